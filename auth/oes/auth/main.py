@@ -1,6 +1,5 @@
 """Main entry points."""
 
-import os
 import sys
 
 from oes.auth.auth import AuthRepo, AuthService
@@ -10,7 +9,7 @@ from oes.auth.email import EmailAuthRepo, EmailAuthService
 from oes.auth.mq import MQService
 from oes.auth.service import AccessTokenService, RefreshTokenService
 from oes.auth.token import RefreshTokenRepo
-from oes.utils.sanic import setup_app, setup_database
+from oes.utils.sanic import run_server, setup_app, setup_database
 from sanic import Sanic
 from sanic.worker.manager import WorkerManager
 from sanic_ext import Extend
@@ -20,13 +19,7 @@ WorkerManager.THRESHOLD = 1200  # type: ignore
 
 def main():
     """CLI wrapper."""
-    os.execlp(
-        "sanic",
-        sys.argv[0],
-        "--single-process",
-        "oes.auth.main:create_app",
-        *sys.argv[1:],
-    )
+    run_server(sys.argv[0], "oes.auth.main:create_app")
 
 
 def create_app() -> Sanic:
@@ -39,8 +32,8 @@ def create_app() -> Sanic:
     app.config.PROXIES_COUNT = 1
     app.config.CORS_ORIGINS = config.allowed_origins
     Extend(app)
-    setup_app(app, config)
-    setup_database(app, config.db_url)
+    setup_app(app, config, metrics=config.metrics)
+    setup_database(app, config.db_url, config.db)
 
     app.blueprint(routes)
 
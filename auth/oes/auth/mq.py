@@ -9,6 +9,7 @@ import aio_pika
 import orjson
 from loguru import logger
 from oes.auth.config import Config
+from oes.utils.metrics import time_mq_publish
 
 
 class MQService:
@@ -42,7 +43,8 @@ class MQService:
         msg = aio_pika.Message(
             orjson.dumps(body), delivery_mode=aio_pika.DeliveryMode.PERSISTENT
         )
-        await self.exchange.publish(msg, "email.auth")
+        with time_mq_publish(self.exchange.name):
+            await self.exchange.publish(msg, "email.auth")
 
     async def stop(self):
         self.run_task.cancel()
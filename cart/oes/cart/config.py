@@ -4,6 +4,8 @@ from typing import Any, cast
 
 import typed_settings as ts
 from oes.utils.config import get_loaders
+from oes.utils.db import DatabaseConfig
+from oes.utils.http import HTTPClientConfig
 from sqlalchemy import URL, make_url
 
 
@@ -15,11 +17,21 @@ class Config:
         default=make_url("postgresql+asyncpg:///cart"),
         help="the database URL",
     )
+    db: DatabaseConfig = ts.option(
+        factory=DatabaseConfig, help="database connection pool settings"
+    )
     redis_url: str | None = ts.option(default=None, help="url of a redis service")
     pricing_url: str = ts.option(
         default="http://pricing:8000", help="url of the pricing service"
     )
     currency: str = ts.option(default="USD", help="the currency to use")
+    metrics: bool = ts.option(default=False, help="expose metrics at /metrics")
+    server_timing: bool = ts.option(
+        default=False, help="send Server-Timing headers to the web service"
+    )
+    http_client: HTTPClientConfig = ts.option(
+        factory=HTTPClientConfig, help="upstream HTTP client settings"
+    )
 
 
 def get_config() -> Config:
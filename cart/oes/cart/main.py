@@ -1,9 +1,5 @@
 """Main entry points."""
 
-import os
-import sys
-
-import httpx
 import oes.cart
 import uvloop
 from oes.cart.cart import (
@@ -16,7 +12,9 @@ from oes.cart.cart import (
 from oes.cart.config import get_config
 from oes.cart.routes import response_converter, routes
 from oes.utils import configure_converter
-from oes.utils.sanic import setup_app, setup_database
+from oes.utils.http import make_http_client
+from oes.utils.metrics import instrument_redis
+from oes.utils.sanic import run_server, setup_app, setup_database
 from redis.asyncio import Redis
 from sanic import Request, Sanic
 from sanic.worker.manager import WorkerManager
@@ -26,13 +24,7 @@ WorkerManager.THRESHOLD = 1200  # type: ignore
 
 def main():
     """CLI wrapper."""
-    os.execlp(
-        "sanic",
-        "oes-cart-service",
-        "--single-process",
-        "oes.cart.main.create_app",
-        *sys.argv[1:]
-    )
+    run_server("oes-cart-service", "oes.cart.main.create_app")
 
 
 def create_app() -> Sanic:
@@ -48,8 +40,14 @@ def create_app() -> Sanic:
         CartEntity, unstructure_cart_entity
     )
 
-    setup_app(app, config, response_converter.converter)
-    setup_database(app, config.db_url)
+    setup_app(
+        app,
+        config,
+        response_converter.converter,
+        metrics=config.metrics,
+        server_timing=config.server_timing,
+    )
+    setup_database(app, config.db_url, config.db)
 
     app.blueprint(routes)
 
@@ -61,7 +59,7 @@ def create_app() -> Sanic:
 
     @app.before_server_start
     async def setup_httpx(app: Sanic):
-        app.ctx.httpx = httpx.AsyncClient()
+        app.ctx.httpx = make_http_client(config.http_client, (config.pricing_url,))
         app.ext.dependency(app.ctx.httpx)
 
     @app.after_server_stop
@@ -70,7 +68,11 @@ def create_app() -> Sanic:
 
     @app.before_server_start
     async def setup_redis(app: Sanic):
-        app.ctx.redis = Redis.from_url(config.redis_url) if config.redis_url else None
+        app.ctx.redis = (
+            instrument_redis(Redis.from_url(config.redis_url))
+            if config.redis_url
+            else None
+        )
         app.ext.dependency(app.ctx.redis)
 
     @app.after_server_stop
@@ -3,8 +3,7 @@ import os
 import pytest
 import pytest_asyncio
 from oes.cart.orm import Base, import_entities
-from oes.utils.sanic import AsyncEngine, create_async_engine
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 
 @pytest_asyncio.fixture
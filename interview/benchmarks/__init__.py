@@ -0,0 +1 @@
+"""Interview service benchmarks."""
@@ -0,0 +1,81 @@
+"""Value pointer parsing benchmark.
+
+Compares the pyparsing grammar, with and without the 1024-entry LRU cache that
+was previously used when structuring, against :func:`parse_pointer`.
+
+Run with ``python -m benchmarks.pointer``.
+"""
+
+import argparse
+import functools
+import time
+from collections.abc import Callable, Sequence
+
+from oes.interview.logic.pointer import Parsing, clear_pointer_cache, parse_pointer
+from oes.interview.logic.types import ValuePointer
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000, help="distinct pointers")
+    parser.add_argument("--passes", type=int, default=5, help="repeated passes")
+    args = parser.parse_args()
+
+    pointers = make_pointers(args.count)
+    print(f"{len(pointers)} distinct pointers, {args.passes} repeated passes")
+    bench("pyparsing", lambda: _parse_pyparsing, pointers, args.passes)
+    bench("pyparsing + lru_cache", _make_pyparsing_lru, pointers, args.passes)
+    bench("parse_pointer", _make_interned, pointers, args.passes)
+
+
+def make_pointers(count: int) -> list[str]:
+    """Generate ``count`` distinct pointers like those in large configs."""
+    return [
+        f'registrations[{i % 50}].options.item_{i}["label-{i % 7}"]'
+        for i in range(count)
+    ]
+
+
+def bench(
+    name: str,
+    make_fn: Callable[[], Callable[[str], ValuePointer]],
+    pointers: Sequence[str],
+    passes: int,
+):
+    """Time the first (startup) pass and repeated (structure) passes."""
+    fn = make_fn()
+    start = time.perf_counter()
+    for ptr in pointers:
+        fn(ptr)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(passes):
+        for ptr in pointers:
+            fn(ptr)
+    repeat = (time.perf_counter() - start) / passes
+
+    per_first = first / len(pointers) * 1e6
+    per_repeat = repeat / len(pointers) * 1e6
+    print(
+        f"{name:<24} first pass {first * 1000:8.2f} ms ({per_first:6.2f} us/ptr)"
+        f"  repeat pass {repeat * 1000:8.2f} ms ({per_repeat:6.2f} us/ptr)"
+    )
+
+
+def _make_pyparsing_lru() -> Callable[[str], ValuePointer]:
+    return functools.lru_cache(maxsize=1024)(_parse_pyparsing)
+
+
+def _make_interned() -> Callable[[str], ValuePointer]:
+    clear_pointer_cache()
+    return parse_pointer
+
+
+def _parse_pyparsing(ptr: str) -> ValuePointer:
+    return Parsing.pointer.parse_string(ptr, parse_all=True)[0]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Proxy access benchmark.
+
+Looks up paths in a deep data tree the way interview steps and ``when``
+conditions do, with a new proxy per lookup and with one proxy shared by all
+lookups, as with :attr:`InterviewState.template_context_proxy`.
+
+Run with ``python -m benchmarks.proxy``.
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from oes.interview.immutable import make_immutable
+from oes.interview.logic.proxy import make_proxy
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, default=8, help="depth of the tree")
+    parser.add_argument("--width", type=int, default=4, help="children per node")
+    parser.add_argument("--paths", type=int, default=20, help="paths per step")
+    parser.add_argument("--steps", type=int, default=2000, help="steps")
+    args = parser.parse_args()
+
+    data = make_immutable(make_tree(args.depth, args.width))
+    paths = make_paths(args.depth, args.width, args.paths)
+    print(
+        f"depth {args.depth}, width {args.width}, "
+        f"{len(paths)} paths x {args.steps} steps"
+    )
+    bench("new proxy", make_proxy, data, paths, args.steps)
+    proxy = make_proxy(make_immutable({"data": data}))
+    bench("shared proxy", lambda context: proxy, data, paths, args.steps)
+
+
+def make_tree(depth: int, width: int) -> Any:
+    """Make a tree of alternating objects and arrays."""
+    if depth == 0:
+        return "leaf"
+    elif depth % 2 == 0:
+        return {f"k{i}": make_tree(depth - 1, width) for i in range(width)}
+    else:
+        return [make_tree(depth - 1, width) for _ in range(width)]
+
+
+def make_paths(depth: int, width: int, count: int) -> list[tuple[str | int, ...]]:
+    """Make paths to leaves of the tree."""
+    paths = []
+    for n in range(count):
+        path: list[str | int] = ["data"]
+        for level in range(depth, 0, -1):
+            i = (n + level) % width
+            path.append(f"k{i}" if level % 2 == 0 else i)
+        paths.append(tuple(path))
+    return paths
+
+
+def bench(
+    name: str,
+    make_fn: Callable[[Any], Mapping[str, Any]],
+    data: Any,
+    paths: Sequence[Sequence[str | int]],
+    steps: int,
+):
+    """Look up each path in a proxy made once per lookup."""
+    context = make_immutable({"data": data})
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(steps):
+        for path in paths:
+            value = make_fn(context)
+            for key in path:
+                value = value[key]
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_eval = elapsed / (steps * len(paths)) * 1e6
+    print(f"{name:<12} {per_eval:8.2f} us/lookup  peak {peak / 1024:8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
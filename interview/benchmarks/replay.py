@@ -0,0 +1,435 @@
+"""Interview replay benchmark.
+
+Replays recorded response sequences from ``scenarios.yml`` through the interview
+engine and reports per-step latency percentiles, allocations and Redis bytes.
+
+The modes are:
+
+- ``engine``: :func:`update_interview` with the context kept in memory.
+- ``storage``: each step loads and stores the context with :class:`StorageService`.
+- ``routes``: each step is an HTTP request to the Sanic routes over ASGI.
+
+The ``storage`` and ``routes`` modes use fakeredis, which must be installed, unless
+``--redis-url`` is set.
+Redis bytes count the keys written by the measured sessions. The shared interview
+config is written during the warm-up session and is not included.
+
+Results can be written as JSON with ``--output`` and compared with a previous run
+with ``--compare``.
+
+Run with ``python -m benchmarks.replay``.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from attrs import frozen
+from cattrs import Converter
+from cattrs.preconf.orjson import make_converter
+from oes.interview.config.files import load_yaml
+from oes.interview.config.snapshot import load_interviews
+from oes.interview.interview.interview import Interview, make_interview_context
+from oes.interview.interview.state import InterviewState
+from oes.interview.interview.step_types.exit import ExitResult
+from oes.interview.interview.update import update_interview
+from oes.interview.serialization import configure_converter
+from oes.interview.server.routes import response_converter, routes
+from oes.interview.storage import StorageService
+from oes.utils.sanic import setup_app
+from redis.asyncio import Redis
+from sanic import Request, Sanic
+
+DEFAULT_SCENARIOS = Path(__file__).parent / "scenarios.yml"
+MODES = ("engine", "storage", "routes")
+
+_APP_NAME = "InterviewBenchmark"
+
+Step = Callable[[Mapping[str, Any] | None], Awaitable[bool]]
+"""Run one interview step, returning whether the interview is finished."""
+
+
+@frozen
+class Scenario:
+    """A recorded response sequence."""
+
+    name: str
+    interview_id: str
+    interviews: Mapping[str, Interview]
+    responses: Sequence[Mapping[str, Any]]
+
+
+@frozen
+class Result:
+    """Results for a scenario and mode."""
+
+    scenario: str
+    mode: str
+    sessions: int
+    steps: int
+    latency_ms: Mapping[str, float]
+    alloc_peak_kib: float
+    alloc_total_kib: float
+    redis_bytes_per_session: float | None
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--scenarios", type=Path, default=DEFAULT_SCENARIOS, help="scenarios file"
+    )
+    parser.add_argument(
+        "--mode", choices=MODES, action="append", help="modes to run (default all)"
+    )
+    parser.add_argument("--only", action="append", help="scenario names to run")
+    parser.add_argument("--sessions", type=int, default=50, help="sessions per run")
+    parser.add_argument("--redis-url", help="use this Redis instead of fakeredis")
+    parser.add_argument(
+        "--delta", action="store_true", help="store delta-encoded states"
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="compare with a JSON result")
+    args = parser.parse_args()
+
+    converter = make_converter()
+    configure_converter(converter)
+    configure_converter(response_converter.converter)
+
+    scenarios = load_scenarios(args.scenarios, converter)
+    if args.only:
+        scenarios = [s for s in scenarios if s.name in args.only]
+    results = asyncio.run(run_all(scenarios, args, converter))
+
+    previous = _load_previous(args.compare) if args.compare else {}
+    print_results(results, previous)
+
+    if args.output:
+        write_results(args.output, results, args)
+
+
+def load_scenarios(path: Path, converter: Converter) -> list[Scenario]:
+    """Load the scenarios and their interview configs."""
+    doc = load_yaml(path)
+    configs: dict[Path, Mapping[str, Interview]] = {}
+    scenarios = []
+    for entry in doc:
+        config_path = (path.parent / entry["config"]).resolve()
+        if config_path not in configs:
+            configs[config_path], _ = load_interviews(config_path, converter)
+        scenarios.append(
+            Scenario(
+                entry["name"],
+                entry["interview"],
+                configs[config_path],
+                tuple(entry.get("responses") or ()),
+            )
+        )
+    return scenarios
+
+
+async def run_all(
+    scenarios: Sequence[Scenario], args: argparse.Namespace, converter: Converter
+) -> list[Result]:
+    """Run every scenario in each mode."""
+    results = []
+    async with _run_app(converter) as client:
+        for mode in args.mode or MODES:
+            for scenario in scenarios:
+                async with make_redis(args.redis_url) as redis:
+                    storage = StorageService(
+                        args.redis_url or "", converter, redis, delta=args.delta
+                    )
+                    runner = make_runner(mode, scenario, storage, client)
+                    result = await run_scenario(
+                        scenario, mode, runner, redis, args.sessions
+                    )
+                results.append(result)
+    return results
+
+
+async def run_scenario(
+    scenario: Scenario,
+    mode: str,
+    start_session: Callable[[], Awaitable[Step]],
+    redis: Redis,
+    sessions: int,
+) -> Result:
+    """Replay a scenario ``sessions`` times in one mode."""
+    # warm up caches before measuring
+    await replay(scenario, await start_session())
+
+    keys_before = await _get_keys(redis)
+    times: list[float] = []
+    for _ in range(sessions):
+        times.extend(await replay(scenario, await start_session()))
+    redis_bytes = await _count_bytes(redis, keys_before)
+
+    tracemalloc.start()
+    try:
+        peaks, totals = await replay_traced(scenario, await start_session())
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        scenario=scenario.name,
+        mode=mode,
+        sessions=sessions,
+        steps=len(times) // sessions,
+        latency_ms=_percentiles(times),
+        alloc_peak_kib=max(peaks) / 1024,
+        alloc_total_kib=sum(totals) / 1024,
+        redis_bytes_per_session=(redis_bytes / sessions if mode != "engine" else None),
+    )
+
+
+async def replay(scenario: Scenario, step: Step) -> list[float]:
+    """Replay the responses, returning the time taken by each step."""
+    times = []
+    for responses in _iter_responses(scenario):
+        start = time.perf_counter()
+        finished = await step(responses)
+        times.append(time.perf_counter() - start)
+        if finished:
+            break
+    _check_finished(scenario, finished, len(times))
+    return times
+
+
+async def replay_traced(scenario: Scenario, step: Step) -> tuple[list[int], list[int]]:
+    """Replay the responses, returning the peak and net allocations per step."""
+    peaks = []
+    totals = []
+    for responses in _iter_responses(scenario):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        finished = await step(responses)
+        after, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        totals.append(after - before)
+        if finished:
+            break
+    _check_finished(scenario, finished, len(peaks))
+    return peaks, totals
+
+
+def make_runner(
+    mode: str,
+    scenario: Scenario,
+    storage: StorageService,
+    client: httpx.AsyncClient,
+) -> Callable[[], Awaitable[Step]]:
+    """Make a function that starts a session and returns its step function."""
+    if mode == "engine":
+        return lambda: _start_engine(scenario)
+    elif mode == "storage":
+        return lambda: _start_storage(scenario, storage)
+    else:
+        return lambda: _start_routes(scenario, storage, client)
+
+
+@asynccontextmanager
+async def make_redis(url: str | None) -> AsyncIterator[Redis]:
+    """Connect to Redis, or create a fakeredis instance."""
+    if url:
+        redis = Redis.from_url(url)
+    else:
+        from fakeredis import FakeAsyncRedis
+
+        redis = FakeAsyncRedis()
+    try:
+        yield redis
+    finally:
+        await redis.aclose()
+
+
+def print_results(results: Sequence[Result], previous: Mapping[tuple, Mapping]):
+    """Print a results table."""
+    print(
+        f"{'scenario':<30} {'mode':<8} {'steps':>5} {'p50 ms':>8} {'p90 ms':>8}"
+        f" {'p99 ms':>8} {'peak KiB':>9} {'redis B':>9}"
+    )
+    for r in results:
+        redis_bytes = (
+            f"{r.redis_bytes_per_session:9.0f}"
+            if r.redis_bytes_per_session is not None
+            else f"{'-':>9}"
+        )
+        line = (
+            f"{r.scenario:<30} {r.mode:<8} {r.steps:>5}"
+            f" {r.latency_ms['p50']:8.3f} {r.latency_ms['p90']:8.3f}"
+            f" {r.latency_ms['p99']:8.3f} {r.alloc_peak_kib:9.1f} {redis_bytes}"
+        )
+        prev = previous.get((r.scenario, r.mode))
+        if prev:
+            change = r.latency_ms["p50"] / prev["latency_ms"]["p50"] - 1
+            line += f"  p50 {change:+.1%}"
+        print(line)
+
+
+def write_results(path: Path, results: Sequence[Result], args: argparse.Namespace):
+    """Write the results as JSON."""
+    doc = {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "sessions": args.sessions,
+        "delta": args.delta,
+        "redis": "redis" if args.redis_url else "fakeredis",
+        "results": [make_converter().unstructure(r) for r in results],
+    }
+    path.write_text(json.dumps(doc, indent=2) + "\n")
+
+
+async def _start_engine(scenario: Scenario) -> Step:
+    context = _make_context(scenario)
+
+    async def step(responses: Mapping[str, Any] | None) -> bool:
+        nonlocal context
+        context, content = await update_interview(context, responses)
+        return context.state.completed or isinstance(content, ExitResult)
+
+    return step
+
+
+async def _start_storage(scenario: Scenario, storage: StorageService) -> Step:
+    key = await storage.put(_make_context(scenario))
+
+    async def step(responses: Mapping[str, Any] | None) -> bool:
+        nonlocal key
+        context = await storage.get(key)
+        assert context is not None
+        context, content = await update_interview(
+            context, responses, load_context=storage.get
+        )
+        key = await storage.put(context, base=key)
+        return context.state.completed or isinstance(content, ExitResult)
+
+    return step
+
+
+async def _start_routes(
+    scenario: Scenario, storage: StorageService, client: httpx.AsyncClient
+) -> Step:
+    app = Sanic.get_app(_APP_NAME)
+    app.ctx.interviews = scenario.interviews
+    app.ctx.storage = storage
+    res = await client.post(
+        f"/interviews/{scenario.interview_id}", json={"target": "benchmark"}
+    )
+    res.raise_for_status()
+    state = res.json()["state"]
+
+    async def step(responses: Mapping[str, Any] | None) -> bool:
+        nonlocal state
+        res = await client.post(
+            "/update-interview", json={"state": state, "responses": responses}
+        )
+        res.raise_for_status()
+        body = res.json()
+        state = body["state"]
+        content = body.get("content") or {}
+        return body["completed"] or content.get("type") == "exit"
+
+    return step
+
+
+@asynccontextmanager
+async def _run_app(converter: Converter) -> AsyncIterator[httpx.AsyncClient]:
+    app = Sanic(_APP_NAME, configure_logging=False)
+    setup_app(app, converter=converter)
+    app.ctx.interviews = {}
+    app.ext.add_dependency(StorageService, _get_storage)
+    app.blueprint(routes)
+
+    # run the ASGI lifespan so the app is started like a server
+    receive: asyncio.Queue[dict] = asyncio.Queue()
+    send: asyncio.Queue[dict] = asyncio.Queue()
+    await receive.put({"type": "lifespan.startup"})
+    task = asyncio.create_task(
+        app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive.get, send.put)
+    )
+    await send.get()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url="http://benchmark"
+        ) as client:
+            yield client
+    finally:
+        await receive.put({"type": "lifespan.shutdown"})
+        await send.get()
+        await task
+
+
+def _get_storage(request: Request) -> StorageService:
+    # the scenario being replayed sets the storage
+    return request.app.ctx.storage
+
+
+def _make_context(scenario: Scenario):
+    interview = scenario.interviews[scenario.interview_id]
+    return make_interview_context(
+        interview.questions,
+        interview.steps,
+        InterviewState(target="benchmark"),
+        scenario.interviews,
+        interview.path_index,
+    )
+
+
+def _iter_responses(scenario: Scenario):
+    # the first step runs without responses to get the first question
+    yield None
+    yield from scenario.responses
+
+
+def _check_finished(scenario: Scenario, finished: bool, steps: int):
+    if not finished or steps != len(scenario.responses) + 1:
+        raise RuntimeError(
+            f"Scenario {scenario.name} did not finish after its recorded responses"
+        )
+
+
+def _percentiles(times: Sequence[float]) -> dict[str, float]:
+    ms = sorted(t * 1000 for t in times)
+    if len(ms) == 1:
+        return {"p50": ms[0], "p90": ms[0], "p99": ms[0], "max": ms[0], "mean": ms[0]}
+    q = statistics.quantiles(ms, n=100, method="inclusive")
+    return {
+        "p50": q[49],
+        "p90": q[89],
+        "p99": q[98],
+        "max": ms[-1],
+        "mean": statistics.fmean(ms),
+    }
+
+
+async def _count_bytes(redis: Redis, exclude: set[bytes]) -> int:
+    total = 0
+    for key in await _get_keys(redis) - exclude:
+        total += await redis.strlen(key)
+    return total
+
+
+async def _get_keys(redis: Redis) -> set[bytes]:
+    return {key async for key in redis.scan_iter(match="oes.interview.*")}
+
+
+def _load_previous(path: Path) -> dict[tuple, Mapping]:
+    doc = json.loads(path.read_text())
+    return {(r["scenario"], r["mode"]): r for r in doc["results"]}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Interview state storage benchmark.
+
+Replays a long interview through :class:`StorageService` with full states and with
+delta-encoded states, and reports the Redis bytes written per session.
+
+Requires ``fakeredis``. Run with ``python -m benchmarks.storage``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from cattrs.preconf.orjson import make_converter
+from fakeredis import FakeAsyncRedis
+from oes.interview.interview.interview import InterviewContext, make_interview_context
+from oes.interview.interview.state import InterviewState
+from oes.interview.serialization import configure_converter
+from oes.interview.storage import DEFAULT_MAX_CHAIN_LENGTH, StorageService
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=50, help="steps per session")
+    parser.add_argument("--sessions", type=int, default=20, help="sessions")
+    parser.add_argument(
+        "--items", type=int, default=200, help="size of the initial data"
+    )
+    parser.add_argument(
+        "--max-chain-length",
+        type=int,
+        default=DEFAULT_MAX_CHAIN_LENGTH,
+        help="maximum patches between snapshots",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.sessions} sessions, {args.steps} steps, "
+        f"{args.items} initial data items"
+    )
+    asyncio.run(bench("full", args, delta=False))
+    asyncio.run(bench("delta", args, delta=True))
+
+
+async def bench(name: str, args: argparse.Namespace, *, delta: bool):
+    """Replay the sessions and print the stored bytes and timings."""
+    converter = make_converter()
+    configure_converter(converter)
+    redis = FakeAsyncRedis()
+    storage = StorageService(
+        "", converter, redis, delta=delta, max_chain_length=args.max_chain_length
+    )
+
+    put_time = 0.0
+    get_time = 0.0
+    for session in range(args.sessions):
+        context = make_context(session, args.items)
+        key = await storage.put(context)
+        for step in range(args.steps):
+            start = time.perf_counter()
+            loaded = await storage.get(key)
+            get_time += time.perf_counter() - start
+            assert loaded is not None
+            context = update_context(loaded, step)
+            start = time.perf_counter()
+            key = await storage.put(context, base=key)
+            put_time += time.perf_counter() - start
+
+    total = 0
+    async for key in redis.scan_iter():
+        total += await redis.strlen(key)
+
+    ops = args.sessions * args.steps
+    print(
+        f"{name:<6} {total / args.sessions / 1024:10.1f} KiB/session"
+        f"  put {put_time / ops * 1e6:8.1f} us  get {get_time / ops * 1e6:8.1f} us"
+    )
+    await storage.aclose()
+
+
+def make_context(session: int, items: int) -> InterviewContext:
+    """Make an initial context with ``items`` data entries."""
+    data = {
+        "session": session,
+        "registrations": [
+            {"id": f"reg-{session}-{i}", "name": f"Name {i}", "options": [i, i + 1]}
+            for i in range(items)
+        ],
+    }
+    return make_interview_context({}, (), InterviewState(target="bench", data=data), {})
+
+
+def update_context(context: InterviewContext, step: int) -> InterviewContext:
+    """Set a new answer, like a question step would."""
+    data = {**context.state.data, f"answer_{step}": f"value {step}"}
+    state = context.state.update(
+        data=data,
+        answered_question_ids=context.state.answered_question_ids | {f"q{step}"},
+    )
+    return context.with_state(state)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,20 @@
 """Config module."""
 
+import hashlib
 from collections.abc import Generator, Mapping, Sequence
 from pathlib import Path
 
+import orjson
 import typed_settings as ts
 from attrs import field, frozen
 from cattrs import Converter
+from oes.interview.config.files import iter_yaml_files, load_yaml
 from oes.interview.config.interview import InterviewConfig, InterviewConfigObject
+from oes.interview.input.question import QuestionTemplate
 from oes.interview.interview.interview import Interview
+from oes.interview.interview.types import Step
 from oes.interview.serialization import converter
 from oes.utils.config import get_loaders
-from ruamel.yaml import YAML
-
-_yaml = YAML(typ="safe")
 
 
 @ts.settings
@@ -23,6 +25,41 @@ class Config:
     config_file: Path = ts.option(
         default=Path("interviews.yml"), help="path to the interviews config file"
     )
+    state_deltas: bool = ts.option(
+        default=False, help="store interview states as patches against the previous"
+    )
+    state_max_chain_length: int = ts.option(
+        default=10, help="maximum number of state patches between full snapshots"
+    )
+    state_cache_size: int = ts.option(
+        default=1024, help="maximum number of locally cached interview states"
+    )
+    snapshot_file: Path | None = ts.option(
+        default=None, help="path to a precompiled config snapshot"
+    )
+    http_timeout: float = ts.option(
+        default=10.0, help="timeout for HTTP request steps, in seconds"
+    )
+    http_max_connections: int = ts.option(
+        default=100, help="maximum number of pooled HTTP connections for all workers"
+    )
+    http_max_keepalive_connections: int = ts.option(
+        default=20,
+        help="maximum number of idle keep-alive HTTP connections for all workers",
+    )
+    http_keepalive_expiry: float = ts.option(
+        default=5.0, help="idle keep-alive connection expiration, in seconds"
+    )
+    http_cache_size: int = ts.option(
+        default=1024, help="maximum number of cached HTTP step responses"
+    )
+    metrics: bool = ts.option(default=False, help="expose metrics at /metrics")
+    server_timing: bool = ts.option(
+        default=False, help="send Server-Timing headers to the web service"
+    )
+    config_watch_interval: float | None = ts.option(
+        default=None, help="interval in seconds to check the interviews for changes"
+    )
 
 
 @frozen
@@ -41,7 +78,7 @@ class ConfigFile:
         for entry in self.interviews:
             if isinstance(entry, InterviewConfigObject):
                 questions = entry.get_questions(base_dir, converter)
-                res[entry.id] = Interview(questions, entry.steps)
+                res[entry.id] = _make_interview(converter, questions, entry.steps)
             else:
                 path = base_dir / entry
                 res.update(dict(self._load_interviews_from_path(converter, path)))
@@ -58,29 +95,43 @@ class ConfigFile:
     def _load_interviews_from_directory(
         self, converter: Converter, path: Path
     ) -> Generator[tuple[str, Interview], None, None]:
-        for entry in path.iterdir():
-            name = entry.parts[-1]
-            if entry.is_file() and (name.endswith(".yml") or name.endswith(".yaml")):
-                yield self._load_interview_from_file(converter, entry)
+        for entry in iter_yaml_files(path):
+            yield self._load_interview_from_file(converter, entry)
 
     def _load_interview_from_file(
         self, converter: Converter, fn: Path
     ) -> tuple[str, Interview]:
         id, _, _ = fn.parts[-1].rpartition(".")
-        with fn.open() as f:
-            doc = _yaml.load(f)
+        doc = load_yaml(fn)
         config = converter.structure(doc, InterviewConfig)
         questions = config.get_questions(fn.parent, converter)
-        return id, Interview(questions, config.steps)
+        return id, _make_interview(converter, questions, config.steps)
 
 
 def load_config_file(path: Path | str, converter: Converter = converter) -> ConfigFile:
     """Load the configuration."""
-    with Path(path).open("r") as f:
-        doc = _yaml.load(f)
+    doc = load_yaml(Path(path))
     return converter.structure(doc, ConfigFile)
 
 
 def get_config() -> Config:
     """Load the config."""
     return ts.load_settings(Config, get_loaders("OES_INTERVIEW_", ("interview.yml",)))
+
+
+def _make_interview(
+    converter: Converter,
+    questions: Mapping[str, QuestionTemplate],
+    steps: Sequence[Step],
+) -> Interview:
+    data = orjson.dumps(
+        converter.unstructure(questions, Mapping[str, QuestionTemplate]),
+        default=_default,
+    )
+    return Interview(questions, steps, hashlib.sha256(data).hexdigest())
+
+
+def _default(obj: object) -> object:
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(type(obj))
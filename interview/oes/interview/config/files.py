@@ -0,0 +1,91 @@
+"""Config file loading."""
+
+import hashlib
+import io
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from ruamel.yaml import YAML
+
+_yaml = YAML(typ="safe")
+
+_loaded_files: ContextVar[dict[Path, str] | None] = ContextVar(
+    "_loaded_files", default=None
+)
+
+
+def load_yaml(path: Path) -> Any:
+    """Load a YAML file."""
+    data = path.read_bytes()
+    _record(path, _hash_bytes(data))
+    return _yaml.load(io.BytesIO(data))
+
+
+def iter_yaml_files(path: Path) -> Generator[Path, None, None]:
+    """Iterate the YAML files in a directory."""
+    entries = _list_yaml_files(path)
+    _record(path, _hash_listing(entries))
+    yield from entries
+
+
+@contextmanager
+def track_loaded_files() -> Generator[dict[Path, str], None, None]:
+    """Context manager to record the files and directories that are loaded.
+
+    Yields:
+        A mapping of each resolved path to its digest, filled in as files are
+        loaded.
+    """
+    files: dict[Path, str] = {}
+    token = _loaded_files.set(files)
+    try:
+        yield files
+    finally:
+        _loaded_files.reset(token)
+
+
+def record_loaded_files(files: Mapping[Path, str]):
+    """Record files that were loaded indirectly, such as through a snapshot."""
+    for path, digest in files.items():
+        _record(path, digest)
+
+
+def get_digest(path: Path) -> str | None:
+    """Get the current digest of a file or directory, or ``None`` if missing."""
+    if path.is_dir():
+        return _hash_listing(_list_yaml_files(path))
+    elif path.is_file():
+        return _hash_bytes(path.read_bytes())
+    else:
+        return None
+
+
+def check_digests(files: Mapping[Path, str]) -> bool:
+    """Check whether all files and directories match their recorded digests."""
+    return all(get_digest(path) == digest for path, digest in files.items())
+
+
+def _record(path: Path, digest: str):
+    files = _loaded_files.get()
+    if files is not None:
+        files[path.resolve()] = digest
+
+
+def _list_yaml_files(path: Path) -> list[Path]:
+    return sorted(
+        entry
+        for entry in path.iterdir()
+        if entry.is_file() and entry.name.endswith((".yml", ".yaml"))
+    )
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _hash_listing(entries: Iterable[Path]) -> str:
+    names = [entry.name for entry in entries]
+    return hashlib.sha256("\n".join(names).encode()).hexdigest()
@@ -6,11 +6,9 @@ from typing import Any
 
 from attrs import field, frozen
 from cattrs import Converter
+from oes.interview.config.files import load_yaml
 from oes.interview.input.question import QuestionTemplate
 from oes.interview.interview.types import Step
-from ruamel.yaml import YAML
-
-_yaml = YAML(typ="safe")
 
 
 @frozen(kw_only=True)
@@ -51,8 +49,7 @@ class InterviewConfig:
     def _load_questions_from_file(
         self, converter: Converter, file: Path
     ) -> Mapping[str, QuestionTemplate]:
-        with file.open() as f:
-            doc = _yaml.load(f)
+        doc = load_yaml(file)
         questions = converter.structure(doc, Mapping[str, QuestionTemplate])
         return questions
 
@@ -0,0 +1,232 @@
+"""Precompiled config snapshots.
+
+A snapshot stores the loaded :class:`Interview` mapping, including parsed pointers,
+compiled expression code and path indexes, so that the service can start without
+parsing and compiling the interview config files. Snapshots are tied to the Python
+and Jinja2 versions and the ``oes.interview`` and ``oes.utils`` sources that
+created them and are invalidated when any of the config files they were built from
+change.
+"""
+
+import argparse
+import functools
+import hashlib
+import io
+import os
+import pickle
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import jinja2
+import oes.interview
+import oes.utils
+from attrs import frozen
+from cattrs import Converter
+from cattrs.preconf.orjson import make_converter
+from loguru import logger
+from oes.interview.config.config import get_config, load_config_file
+from oes.interview.config.files import (
+    check_digests,
+    record_loaded_files,
+    track_loaded_files,
+)
+from oes.interview.interview.interview import Interview
+from oes.interview.logic.env import default_jinja2_env
+from oes.interview.serialization import configure_converter
+from oes.interview.serialization import converter as default_converter
+from oes.utils import setup_logging
+from typing_extensions import Self
+
+SNAPSHOT_VERSION = 1
+"""The snapshot format version."""
+
+_MAGIC = b"OESINTV\n"
+_ENV_ID = "default_jinja2_env"
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot is invalid or out of date."""
+
+
+@frozen
+class SnapshotHeader:
+    """Snapshot header."""
+
+    version: int
+    python_version: str
+    jinja2_version: str
+    code_digest: str
+    config_file: Path
+    files: Mapping[Path, str]
+
+    @classmethod
+    def current(cls, config_file: Path, files: Mapping[Path, str]) -> Self:
+        """Make a header for the running interpreter."""
+        return cls(
+            SNAPSHOT_VERSION,
+            sys.implementation.cache_tag or sys.version,
+            jinja2.__version__,
+            _get_code_digest(),
+            config_file.resolve(),
+            dict(files),
+        )
+
+
+def main():
+    """Build a config snapshot."""
+    parser = argparse.ArgumentParser(description="Build an interview config snapshot.")
+    parser.add_argument("-c", "--config-file", type=Path, help="the interviews file")
+    parser.add_argument("-o", "--output", type=Path, help="the snapshot file")
+    args = parser.parse_args()
+
+    setup_logging()
+    config = get_config()
+    config_file = args.config_file or config.config_file
+    output = args.output or config.snapshot_file
+    if output is None:
+        parser.error("no snapshot file configured, use --output")
+
+    converter = make_converter()
+    configure_converter(converter)
+
+    start = time.perf_counter()
+    interviews = write_snapshot(output, config_file, converter)
+    elapsed = time.perf_counter() - start
+    logger.info(f"Wrote {len(interviews)} interviews to {output} in {elapsed:.2f} s")
+
+
+def get_interviews(
+    config_file: Path,
+    snapshot_file: Path | None = None,
+    converter: Converter = default_converter,
+) -> Mapping[str, Interview]:
+    """Get the interviews, from the snapshot if it is valid."""
+    if snapshot_file is not None:
+        start = time.perf_counter()
+        try:
+            interviews = read_snapshot(snapshot_file, config_file)
+        except SnapshotError as e:
+            logger.warning(f"Not using config snapshot {snapshot_file}: {e}")
+        else:
+            elapsed = (time.perf_counter() - start) * 1000
+            logger.info(f"Loaded config snapshot {snapshot_file} in {elapsed:.1f} ms")
+            return interviews
+    interviews, _ = load_interviews(config_file, converter)
+    return interviews
+
+
+def write_snapshot(
+    path: Path, config_file: Path, converter: Converter = default_converter
+) -> Mapping[str, Interview]:
+    """Load the interviews from ``config_file`` and write a snapshot to ``path``.
+
+    The snapshot is read back and compared with the loaded interviews before it is
+    moved into place.
+
+    Returns:
+        The loaded interviews.
+    """
+    interviews, files = load_interviews(config_file, converter)
+    header = SnapshotHeader.current(config_file, files)
+
+    buf = io.BytesIO()
+    buf.write(_MAGIC)
+    pickle.dump(header, buf, protocol=pickle.HIGHEST_PROTOCOL)
+    _Pickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(dict(interviews))
+    data = buf.getvalue()
+
+    _, loaded = _read_snapshot(data, config_file)
+    if loaded != interviews:
+        raise SnapshotError("Snapshot does not match the loaded config")
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return interviews
+
+
+def read_snapshot(path: Path, config_file: Path) -> Mapping[str, Interview]:
+    """Read a snapshot.
+
+    The config files it was built from are recorded as loaded.
+
+    Raises:
+        SnapshotError: If the snapshot is invalid or out of date.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise SnapshotError(f"Could not read snapshot: {e}") from e
+    header, interviews = _read_snapshot(data, config_file)
+    record_loaded_files(header.files)
+    return interviews
+
+
+def load_interviews(
+    config_file: Path, converter: Converter = default_converter
+) -> tuple[Mapping[str, Interview], Mapping[Path, str]]:
+    """Load the interviews from a config file.
+
+    Returns:
+        A pair of the interviews and the digests of every file they were loaded from.
+    """
+    with track_loaded_files() as files:
+        config = load_config_file(config_file, converter)
+        interviews = config.get_interviews(config_file.resolve().parent, converter)
+    return interviews, files
+
+
+def _read_snapshot(
+    data: bytes, config_file: Path
+) -> tuple[SnapshotHeader, Mapping[str, Interview]]:
+    if not data.startswith(_MAGIC):
+        raise SnapshotError("Not a config snapshot")
+    buf = io.BytesIO(data)
+    buf.seek(len(_MAGIC))
+    try:
+        header = pickle.load(buf)
+        _check_header(header, config_file)
+        interviews = _Unpickler(buf).load()
+    except SnapshotError:
+        raise
+    except Exception as e:
+        raise SnapshotError(f"Invalid snapshot: {e}") from e
+    return header, interviews
+
+
+def _check_header(header: Any, config_file: Path):
+    if not isinstance(header, SnapshotHeader):
+        raise SnapshotError("Invalid snapshot header")
+    expected = SnapshotHeader.current(config_file, header.files)
+    if header != expected:
+        raise SnapshotError("Snapshot was created with a different config or version")
+    if not check_digests(header.files):
+        raise SnapshotError("Snapshot is out of date")
+
+
+@functools.cache
+def _get_code_digest() -> str:
+    h = hashlib.sha256()
+    for package in (oes.interview, oes.utils):
+        root = Path(package.__file__).parent
+        for path in sorted(root.rglob("*.py")):
+            data = path.read_bytes()
+            name = path.relative_to(root.parent)
+            h.update(f"{name}\0{len(data)}\0".encode())
+            h.update(data)
+    return h.hexdigest()
+
+
+class _Pickler(pickle.Pickler):
+    def persistent_id(self, obj: Any) -> Any:
+        return _ENV_ID if obj is default_jinja2_env else None
+
+
+class _Unpickler(pickle.Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == _ENV_ID:
+            return default_jinja2_env
+        raise pickle.UnpicklingError(f"Unsupported persistent ID: {pid}")
@@ -0,0 +1,137 @@
+"""Shared HTTP client module."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+import orjson
+from oes.utils.metrics import instrument_httpx_client
+from typing_extensions import Self
+
+DEFAULT_TIMEOUT = 10.0
+"""Default request timeout, in seconds."""
+
+DEFAULT_CACHE_SIZE = 1024
+"""Default maximum number of cached responses."""
+
+
+class HTTPClient:
+    """Pooled HTTP client used by HTTP request steps.
+
+    Wraps a long-lived :class:`httpx.AsyncClient` so connections are kept alive
+    between steps, and optionally caches responses keyed by URL and request body.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        *,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self._client = (
+            client if client is not None else httpx.AsyncClient(timeout=DEFAULT_TIMEOUT)
+        )
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, bytes], tuple[float, bytes]] = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> Self:
+        """Create a client with the given pool limits and timeout."""
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        client = instrument_httpx_client(
+            httpx.AsyncClient(limits=limits, timeout=timeout)
+        )
+        return cls(client, cache_size=cache_size)
+
+    async def post_json(
+        self, url: str, body: bytes, *, cache_ttl: float | None = None
+    ) -> Any:
+        """POST a JSON body and return the parsed JSON response.
+
+        Args:
+            url: The URL.
+            body: The encoded JSON body.
+            cache_ttl: If set, cache the response for this many seconds, keyed by
+                the URL and a hash of the body.
+        """
+        if cache_ttl is None:
+            content = await self._post(url, body)
+            return orjson.loads(content)
+
+        key = (url, hashlib.sha256(body).digest())
+        content = self._get_cached(key)
+        if content is None:
+            content = await self._post(url, body)
+            self._put_cached(key, content, cache_ttl)
+        return orjson.loads(content)
+
+    def clear_cache(self):
+        """Clear all cached responses."""
+        self._cache.clear()
+
+    async def _post(self, url: str, body: bytes) -> bytes:
+        res = await self._client.post(
+            url, content=body, headers={"Content-Type": "application/json"}
+        )
+        res.raise_for_status()
+        return res.content
+
+    def _get_cached(self, key: tuple[str, bytes]) -> bytes | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, content = entry
+        if time.monotonic() >= expires:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return content
+
+    def _put_cached(self, key: tuple[str, bytes], content: bytes, ttl: float):
+        if self._cache_size <= 0 or ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic() + ttl, content)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_typ, exc_val, tb):
+        await self.aclose()
+        return False
+
+    async def aclose(self):
+        """Close the underlying client."""
+        await self._client.aclose()
+
+
+_http_client: HTTPClient | None = None
+
+
+def set_http_client(client: HTTPClient | None):
+    """Set the shared :class:`HTTPClient`."""
+    global _http_client
+    _http_client = client
+
+
+def get_http_client() -> HTTPClient | None:
+    """Get the shared :class:`HTTPClient`, if one is configured."""
+    return _http_client
@@ -3,14 +3,20 @@
 import functools
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from contextvars import ContextVar
 from typing import Any
 
 from attrs import field, frozen
+from immutabledict import immutabledict
 from oes.interview.input.field import Field, Validator
 from oes.interview.logic.types import ValuePointer
-from oes.utils.logic import WhenCondition, evaluate
+from oes.utils.logic import Evaluable, WhenCondition, evaluate_condition
 from oes.utils.template import Expression, Template, TemplateContext
 
+_rendered_options: ContextVar[
+    dict[int, tuple[TemplateContext, Mapping[str, "SelectFieldOptionBase"]]] | None
+] = ContextVar("_rendered_options", default=None)
+
 
 @frozen
 class FieldTemplateBase(ABC):
@@ -84,6 +90,22 @@ class SelectFieldOptionBase:
         }
         return schema
 
+    @property
+    def is_static(self) -> bool:
+        """Whether the option has no expressions or templates."""
+        return (
+            not isinstance(self.when, Evaluable)
+            and (not isinstance(self.label, Template) or self.label.is_static)
+            and self.value_expr is None
+            and self.default_expr is None
+        )
+
+
+@frozen
+class _StaticOptions:
+    options: Mapping[str, SelectFieldOptionBase]
+    schemas: Sequence[Mapping[str, Any]]
+
 
 @frozen
 class SelectFieldTemplateBase(FieldTemplateBase, ABC):
@@ -97,16 +119,56 @@ class SelectFieldTemplateBase(FieldTemplateBase, ABC):
     @abstractmethod
     def multi(self) -> bool: ...
 
+    @functools.cached_property
+    def _static_options(self) -> _StaticOptions | None:
+        if not all(opt.is_static for opt in self.options):
+            return None
+        options = immutabledict(self._evaluate_options({}))
+        schemas = tuple(opt.get_schema(opt_id, {}) for opt_id, opt in options.items())
+        return _StaticOptions(options, schemas)
+
+    def get_field(self, context: TemplateContext) -> Field:
+        # evaluated options are reused while the field is rendered
+        token = _rendered_options.set({})
+        try:
+            return super().get_field(context)
+        finally:
+            _rendered_options.reset(token)
+
     def get_options(
         self, context: TemplateContext
+    ) -> Mapping[str, SelectFieldOptionBase]:
+        static = self._static_options
+        if static is not None:
+            return static.options
+
+        rendered = _rendered_options.get()
+        entry = rendered.get(id(context)) if rendered is not None else None
+        if entry is not None and entry[0] is context:
+            return entry[1]
+
+        options = self._evaluate_options(context)
+        if rendered is not None:
+            rendered[id(context)] = (context, options)
+        return options
+
+    def _evaluate_options(
+        self, context: TemplateContext
     ) -> Mapping[str, SelectFieldOptionBase]:
         with_idx = enumerate(self.options)
         return {
             self.get_option_id(idx, opt): opt
             for idx, opt in with_idx
-            if evaluate(opt.when, context)
+            if evaluate_condition(opt.when, context)
         }
 
+    def _get_option_schemas(self, context: TemplateContext) -> list[dict[str, Any]]:
+        static = self._static_options
+        if static is not None:
+            return [dict(schema) for schema in static.schemas]
+        opts = self.get_options(context)
+        return [opt.get_schema(opt_id, context) for opt_id, opt in opts.items()]
+
     def get_option_id(self, index: int, option: SelectFieldOptionBase) -> str:
         if option.id:
             return option.id
@@ -119,22 +181,16 @@ class SelectFieldTemplateBase(FieldTemplateBase, ABC):
             return self._get_scalar_schema(context)
 
     def _get_multi_schema(self, context: TemplateContext) -> dict[str, Any]:
-        opts = self.get_options(context)
         schema = {
             **super().get_schema(context),
             "type": "array",
-            "items": {
-                "oneOf": [
-                    opt.get_schema(opt_id, context) for opt_id, opt in opts.items()
-                ]
-            },
+            "items": {"oneOf": self._get_option_schemas(context)},
             "uniqueItems": True,
         }
         return schema
 
     def _get_scalar_schema(self, context: TemplateContext) -> dict[str, Any]:
-        opts = self.get_options(context)
-        items = [opt.get_schema(opt_id, context) for opt_id, opt in opts.items()]
+        items = self._get_option_schemas(context)
         if self.is_optional:
             items.append({"type": "null"})
         schema = {
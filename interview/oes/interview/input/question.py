@@ -84,15 +84,19 @@ class QuestionTemplate:
 
     @property
     def provides(self) -> Set[Sequence[str | int]]:
-        return frozenset(get_path(set_) for set_ in self.fields.keys())  # type: ignore
+        """The value paths this question sets."""
+        return frozenset(
+            p for p in (get_path(set_) for set_ in self.fields) if _is_constant_path(p)
+        )  # type: ignore
 
-    # @property
-    # def provides_indirect(self) -> Set[Sequence[str | int | ValuePointer]]:
-    #     return frozenset(
-    #         p
-    #         for p in (get_path(f.set) for f in self.fields if f.set)
-    #         if any(not isinstance(v, (str, int)) for v in p)
-    #     )  # type: ignore
+    @property
+    def provides_indirect(self) -> Set[Sequence[str | int | ValuePointer]]:
+        """The value paths with pointer segments this question sets."""
+        return frozenset(
+            p
+            for p in (get_path(set_) for set_ in self.fields)
+            if not _is_constant_path(p)
+        )
 
     def get_schema(
         self, fields: Mapping[str, Field], context: TemplateContext
@@ -161,5 +165,9 @@ def make_question(
     )
 
 
+def _is_constant_path(path: Sequence[object]) -> bool:
+    return all(isinstance(p, (str, int)) for p in path)
+
+
 def _make_field_id(index: int) -> str:
     return f"field_{index}"
@@ -3,15 +3,20 @@
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any
 
-from attrs import evolve, field, frozen
+from attrs import Factory, evolve, field, frozen
 from cattrs import Converter, override
 from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn
 from immutabledict import immutabledict
 from oes.interview.immutable import immutable_mapping
 from oes.interview.input.question import QuestionTemplate
 from oes.interview.interview.state import InterviewState
+from oes.interview.interview.trie import PathTrie
 from oes.interview.interview.types import Step
-from typing_extensions import Self
+from oes.interview.logic.types import ValuePointer
+from typing_extensions import Self, TypeAlias
+
+IndirectPath: TypeAlias = tuple[str, Sequence[str | int | ValuePointer]]
+"""A question ID and a value path with pointer segments that it provides."""
 
 
 @frozen
@@ -22,6 +27,28 @@ class Interview:
         default=immutabledict(), converter=immutable_mapping[str, QuestionTemplate]
     )
     steps: Sequence[Step] = field(default=(), converter=tuple[Step, ...])
+    path_index: Mapping[Sequence[str | int], Sequence[str]] = field(
+        init=False,
+        repr=False,
+        eq=False,
+        default=Factory(
+            lambda s: immutabledict(
+                index_question_templates_by_path(s.questions.items())
+            ),
+            takes_self=True,
+        ),
+    )
+    indirect_path_index: PathTrie[IndirectPath] = field(
+        init=False,
+        repr=False,
+        eq=False,
+        default=Factory(
+            lambda s: index_question_templates_by_indirect_path(s.questions.items()),
+            takes_self=True,
+        ),
+    )
+    version: str | None = field(default=None, eq=False)
+    """Identifies the questions, equal in every process that loads the same config."""
 
 
 @frozen
@@ -40,6 +67,18 @@ class InterviewContext:
     interviews: Mapping[str, Interview] = field(
         default=immutabledict(), converter=immutable_mapping[str, Interview]
     )
+    interview_id: str | None = None
+    interview_version: str | None = None
+    indirect_path_index: PathTrie[IndirectPath] = field(
+        repr=False,
+        eq=False,
+        default=Factory(
+            lambda s: index_question_templates_by_indirect_path(
+                s.question_templates.items()
+            ),
+            takes_self=True,
+        ),
+    )
 
     def with_state(self, state: InterviewState) -> Self:
         """Return a copy with the state replaced."""
@@ -51,12 +90,35 @@ def make_interview_context(
     steps: Iterable[Step],
     state: InterviewState,
     interviews: Mapping[str, Interview],
+    path_index: Mapping[Sequence[str | int], Sequence[str]] | None = None,
+    indirect_path_index: PathTrie[IndirectPath] | None = None,
+    interview_id: str | None = None,
+    interview_version: str | None = None,
 ) -> InterviewContext:
-    """Make an :class:`InterviewContext`."""
+    """Make an :class:`InterviewContext`.
+
+    ``path_index`` and ``indirect_path_index`` may be passed if already computed,
+    such as :attr:`Interview.path_index` and :attr:`Interview.indirect_path_index`.
+    ``interview_id`` and ``interview_version`` are the ID and
+    :attr:`Interview.version` of the interview the questions and steps are from.
+    """
     steps = tuple(steps)
-    path_index = index_question_templates_by_path(question_templates.items())
-    # indirect_path_index = index_question_templates_by_indirect_path(by_id.items())
-    return InterviewContext(state, question_templates, steps, path_index, interviews)
+    if path_index is None:
+        path_index = index_question_templates_by_path(question_templates.items())
+    if indirect_path_index is None:
+        indirect_path_index = index_question_templates_by_indirect_path(
+            question_templates.items()
+        )
+    return InterviewContext(
+        state,
+        question_templates,
+        steps,
+        path_index,
+        interviews,
+        interview_id,
+        interview_version,
+        indirect_path_index,
+    )
 
 
 def index_question_templates_by_path(
@@ -69,16 +131,33 @@ def index_question_templates_by_path(
             cur = index.get(path, ())
             index[path] = (*cur, id)
     return index
-    # indirect_path_index: Mapping[
-    #     Sequence[str | int],
-    #     Sequence[tuple[str, Set[Sequence[str | int | ValuePointer]]]],
-    # ] = field(default=immutabledict(), converter=lambda v: immutabledict(v))
+
+
+def index_question_templates_by_indirect_path(
+    question_templates: Iterable[tuple[str, QuestionTemplate]]
+) -> PathTrie[IndirectPath]:
+    """Index :class:`QuestionTemplate` objects by their indirect value paths.
+
+    Indirect paths are paths with pointer segments. Each entry is the question ID
+    and the path it provides.
+    """
+    index: PathTrie[IndirectPath] = PathTrie()
+    for id, question_template in question_templates:
+        for path in sorted(question_template.provides_indirect, key=str):
+            index.add(path, (id, path))
+    return index
 
 
 def make_interview_context_structure_fn(
     converter: Converter,
+    get_interviews: Callable[[], Mapping[str, Interview]] | None = None,
 ) -> Callable[[Any, Any], Any]:
-    """Make a function to structure a :class:`InterviewContext`."""
+    """Make a function to structure a :class:`InterviewContext`.
+
+    The indirect path index is not serialized. If ``get_interviews`` is given and
+    returns the context's interview with the same version, its prebuilt index is
+    used, otherwise the index is rebuilt.
+    """
 
     def structure_index(v, t):
         path_index_items = converter.structure(
@@ -88,16 +167,43 @@ def make_interview_context_structure_fn(
         return immutabledict(path_index_items)
 
     dict_fn = make_dict_structure_fn(
-        InterviewContext, converter, path_index=override(struct_hook=structure_index)
+        InterviewContext,
+        converter,
+        path_index=override(struct_hook=structure_index),
+        indirect_path_index=override(struct_hook=lambda v, t: v),
     )
 
-    return dict_fn
+    def structure(v: Any, t: Any) -> InterviewContext:
+        interview = _get_interview(v.get("interview_id"), v.get("interview_version"))
+        index = interview.indirect_path_index if interview is not None else None
+        context = dict_fn({**v, "indirect_path_index": index}, t)
+        if interview is None:
+            index = index_question_templates_by_indirect_path(  # noqa: NEW100
+                context.question_templates.items()
+            )
+            context = evolve(context, indirect_path_index=index)
+        return context
+
+    def _get_interview(id: str | None, version: str | None) -> Interview | None:
+        if id is None or version is None or get_interviews is None:
+            return None
+        interview = get_interviews().get(id)
+        return (
+            interview
+            if interview is not None and interview.version == version
+            else None
+        )
+
+    return structure
 
 
 def make_interview_context_unstructure_fn(converter: Converter) -> Callable[[Any], Any]:
     """Make a function to unstructure a :class:`InterviewContext`."""
     dict_fn = make_dict_unstructure_fn(
-        InterviewContext, converter, path_index=override(omit=True)
+        InterviewContext,
+        converter,
+        path_index=override(omit=True),
+        indirect_path_index=override(omit=True),
     )
 
     def unstructure(v: InterviewContext) -> Any:
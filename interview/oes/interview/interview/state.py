@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Set
+from collections.abc import Callable, Iterable, Mapping, Set
 from datetime import datetime, timedelta
 from typing import Any
 
 import oes.interview.interview.interview
 from attrs import Factory, evolve, field, frozen
+from cattrs import Converter, override
+from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn
 from immutabledict import immutabledict
 from oes.interview.immutable import immutable_converter, make_immutable
 from oes.interview.input.question import QuestionTemplate
+from oes.interview.logic.proxy import make_proxy
 from oes.interview.logic.types import ValuePointer
 from oes.utils.template import Expression, TemplateContext
 from typing_extensions import Self
@@ -23,11 +26,18 @@ DEFAULT_INTERVIEW_EXPIRATION = timedelta(hours=1)
 
 @frozen
 class ParentInterviewContext:
-    """Parent interview context."""
+    """Parent interview context.
+
+    The parent is referenced by its storage key. ``context`` holds the parent
+    context until it has been stored, and is not serialized.
+    """
 
-    context: oes.interview.interview.interview.InterviewContext
     result: ValuePointer
     value: Expression | None = None
+    key: str | None = None
+    context: oes.interview.interview.interview.InterviewContext | None = field(
+        default=None, eq=False, repr=False
+    )
 
 
 @frozen
@@ -59,12 +69,26 @@ class InterviewState:
         eq=False,
         default=Factory(lambda s: _merge_dict(s.data, s.context), takes_self=True),
     )
+    _template_context_proxy: TemplateContext = field(
+        init=False,
+        repr=False,
+        eq=False,
+        default=Factory(lambda s: make_proxy(s._template_context), takes_self=True),
+    )
 
     @property
     def template_context(self) -> TemplateContext:
         """Combined context and data for use with template/expression evaluation."""
         return self._template_context
 
+    @property
+    def template_context_proxy(self) -> TemplateContext:
+        """:attr:`template_context` in a proxy.
+
+        The proxy is shared by all steps and conditions evaluated with this state.
+        """
+        return self._template_context_proxy
+
     def update(
         self,
         *,
@@ -94,6 +118,34 @@ class InterviewState:
         )
 
 
+def make_parent_interview_context_structure_fn(
+    converter: Converter,
+) -> Callable[[Any, Any], ParentInterviewContext]:
+    """Make a function to structure a :class:`ParentInterviewContext`."""
+    return make_dict_structure_fn(
+        ParentInterviewContext, converter, context=override(omit=True)
+    )
+
+
+def make_parent_interview_context_unstructure_fn(
+    converter: Converter,
+) -> Callable[[ParentInterviewContext], Any]:
+    """Make a function to unstructure a :class:`ParentInterviewContext`.
+
+    Only the key of the parent context is included.
+    """
+    dict_fn = make_dict_unstructure_fn(
+        ParentInterviewContext, converter, context=override(omit=True)
+    )
+
+    def unstructure(v: ParentInterviewContext) -> Any:
+        if v.key is None:
+            raise ValueError("Parent interview context has not been stored")
+        return dict_fn(v)
+
+    return unstructure
+
+
 def _merge_dict(a: Mapping[str, Any], b: Mapping[str, Any]) -> immutabledict[str, Any]:
     updated = {**a, **b}
     return make_immutable(updated)
@@ -7,8 +7,7 @@ from attrs import frozen
 from oes.interview.interview.interview import InterviewContext
 from oes.interview.interview.types import AsyncStep, Step
 from oes.interview.interview.update import UpdateResult
-from oes.interview.logic.proxy import make_proxy
-from oes.utils.logic import WhenCondition, evaluate
+from oes.utils.logic import WhenCondition, evaluate_condition
 from typing_extensions import TypeIs
 
 
@@ -21,10 +20,10 @@ class Block:
 
     async def __call__(self, context: InterviewContext) -> UpdateResult:
         """Run the steps."""
-        ctx = make_proxy(context.state.template_context)
+        ctx = context.state.template_context_proxy
         cur_result = UpdateResult(context)
         for step in self.block:
-            if not evaluate(step.when, ctx):
+            if not evaluate_condition(step.when, ctx):
                 continue
             next_result = await _run_step(cur_result, step)
             if (
@@ -2,7 +2,7 @@
 
 from attrs import frozen
 from cattrs.preconf.orjson import make_converter
-from httpx import AsyncClient
+from oes.interview.http import HTTPClient, get_http_client
 from oes.interview.interview.interview import InterviewContext
 from oes.interview.interview.update import UpdateResult
 from oes.interview.logic.proxy import make_proxy
@@ -16,6 +16,7 @@ class HTTPRequestStep:
 
     url: str
     result: ValuePointer
+    cache_ttl: float | None = None
     when: WhenCondition = True
 
     async def __call__(self, context: InterviewContext) -> UpdateResult:
@@ -28,12 +29,14 @@ class HTTPRequestStep:
             return UpdateResult(context)
 
         body = self._get_body(context)
-        async with AsyncClient() as client:
-            res = await client.post(
-                self.url, content=body, headers={"Content-Type": "application/json"}
+        client = get_http_client()
+        if client is None:
+            async with HTTPClient() as client:
+                result_data = await client.post_json(self.url, body)
+        else:
+            result_data = await client.post_json(
+                self.url, body, cache_ttl=self.cache_ttl
             )
-            res.raise_for_status()
-            result_data = res.json()
         proxy = make_proxy(context.state.data)
         new_data = self.result.set(proxy, result_data)
         new_state = context.state.update(data=new_data)
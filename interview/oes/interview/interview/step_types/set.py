@@ -22,7 +22,7 @@ class SetStep:
     when: WhenCondition = True
 
     def __call__(self, context: InterviewContext) -> UpdateResult:
-        proxy = make_proxy(context.state.template_context)
+        proxy = context.state.template_context_proxy
         try:
             cur_value = self.set.evaluate(proxy)
         except LookupError:
@@ -16,7 +16,7 @@ from oes.interview.interview.interview import (
 from oes.interview.interview.state import InterviewState, ParentInterviewContext
 from oes.interview.interview.update import UpdateResult
 from oes.interview.logic.pointer import IndexAccess
-from oes.interview.logic.proxy import ProxyLookupError, make_proxy
+from oes.interview.logic.proxy import ProxyLookupError
 from oes.interview.logic.types import ValuePointer
 from oes.utils.logic import ValueOrEvaluable, WhenCondition, evaluate
 from oes.utils.template import Expression, TemplateContext
@@ -40,7 +40,7 @@ class SubStep:
     when: WhenCondition = True
 
     def __call__(self, context: InterviewContext) -> UpdateResult:
-        tmpl_ctx = make_proxy(context.state.template_context)
+        tmpl_ctx = context.state.template_context_proxy
         if self.map is None:
             return self._handle_scalar(tmpl_ctx, context)
         else:
@@ -100,16 +100,12 @@ class SubStep:
 
         state = InterviewState(
             date_expires=context.state.date_expires,
-            context={
-                "parent_context": context.state.context,
-                "parent_data": context.state.data,
-                **new_context,
-            },
+            context=new_context,
             data=new_data,
             target=ParentInterviewContext(
-                context,
                 self._get_result_ptr(item),
                 value=self.value,
+                context=context,
             ),
         )
 
@@ -118,6 +114,10 @@ class SubStep:
             interview.steps,
             state,
             context.interviews,
+            interview.path_index,
+            interview.indirect_path_index,
+            self.sub,
+            interview.version,
         )
 
         return UpdateResult(new_interview_context)
@@ -0,0 +1,81 @@
+"""Value path trie."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class PathTrie(Generic[_T]):
+    """A prefix trie of value paths.
+
+    Path segments that are not strings or integers, such as pointers, are
+    wildcards that match any key.
+    """
+
+    __slots__ = ("_children", "_wildcard", "_values", "_count")
+
+    _children: dict[str | int, PathTrie[_T]]
+    _wildcard: PathTrie[_T] | None
+    _values: list[tuple[int, _T]]
+    _count: int
+
+    def __init__(self):
+        self._children = {}
+        self._wildcard = None
+        self._values = []
+        self._count = 0
+
+    def add(self, path: Sequence[object], value: _T):
+        """Add a value at ``path``."""
+        node = self
+        for segment in path:
+            node = node._get_or_add_child(segment)
+        node._values.append((self._count, value))
+        self._count += 1
+
+    def find(self, path: Sequence[str | int]) -> Iterator[_T]:
+        """Yield the values at paths matching ``path``.
+
+        Paths with a longer prefix of matching keys are yielded first. Paths with
+        the same prefix are yielded in the order they were added.
+        """
+        yield from self._find(path, 0)
+
+    def __bool__(self) -> bool:
+        return bool(self._children or self._wildcard or self._values)
+
+    def _find(self, path: Sequence[str | int], pos: int) -> Iterator[_T]:
+        if pos == len(path):
+            yield from (value for _, value in self._values)
+            return
+        child = self._children.get(path[pos])
+        if child is not None:
+            yield from child._find(path, pos + 1)
+        if self._wildcard is not None:
+            matches = sorted(self._wildcard._find_all(path, pos + 1))
+            yield from (value for _, value in matches)
+
+    def _find_all(
+        self, path: Sequence[str | int], pos: int
+    ) -> Iterator[tuple[int, _T]]:
+        if pos == len(path):
+            yield from self._values
+            return
+        child = self._children.get(path[pos])
+        if child is not None:
+            yield from child._find_all(path, pos + 1)
+        if self._wildcard is not None:
+            yield from self._wildcard._find_all(path, pos + 1)
+
+    def _get_or_add_child(self, segment: object) -> PathTrie[_T]:
+        if isinstance(segment, (str, int)):
+            child = self._children.get(segment)
+            if child is None:
+                child = self._children[segment] = PathTrie()
+            return child
+        if self._wildcard is None:
+            self._wildcard = PathTrie()
+        return self._wildcard
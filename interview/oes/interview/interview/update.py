@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from inspect import iscoroutinefunction
 from typing import Any
 
@@ -12,13 +12,16 @@ from oes.interview.interview.interview import InterviewContext
 from oes.interview.interview.resolve import resolve_undefined_values
 from oes.interview.interview.state import InterviewState, ParentInterviewContext
 from oes.interview.interview.types import AsyncStep, Step
-from oes.interview.logic.proxy import make_proxy
+from oes.interview.logic.pointer import resolve_pointer
 from oes.interview.logic.types import ValuePointer
-from oes.utils.logic import evaluate
-from typing_extensions import TypeIs
+from oes.utils.logic import evaluate, evaluate_condition
+from typing_extensions import TypeAlias, TypeIs
 
 MAX_UPDATE_COUNT = 100
 
+ContextLoader: TypeAlias = Callable[[str], Awaitable[InterviewContext | None]]
+"""Function to load a stored :class:`InterviewContext` by key."""
+
 
 @frozen
 class UpdateResult:
@@ -29,9 +32,16 @@ class UpdateResult:
 
 
 async def update_interview(
-    interview_context: InterviewContext, responses: Mapping[str, Any] | None = None
+    interview_context: InterviewContext,
+    responses: Mapping[str, Any] | None = None,
+    *,
+    load_context: ContextLoader | None = None,
 ) -> tuple[InterviewContext, object | None]:
-    """Update an interview."""
+    """Update an interview.
+
+    ``load_context`` is used to load the parent of a completed sub-interview when
+    only its storage key is known.
+    """
     # apply responses first
     if interview_context.state.current_question is not None:
         if responses is None:
@@ -46,7 +56,7 @@ async def update_interview(
             )
         state = apply_responses(interview_context.state, responses or {})
         interview_context = evolve(interview_context, state=state)
-    return await run_steps(interview_context)
+    return await run_steps(interview_context, load_context=load_context)
 
 
 def apply_responses(
@@ -66,15 +76,19 @@ def _apply_response_values(
 ) -> InterviewState:
     cur_data = state.data
     for ptr, value in values.items():
+        # pointer segments refer to the values before the responses were applied
+        ptr = resolve_pointer(ptr, state.template_context)
         cur_data = ptr.set(cur_data, value)
     return state.update(data=cur_data, current_question=None)
 
 
 async def run_steps(
     interview_context: InterviewContext,
+    *,
+    load_context: ContextLoader | None = None,
 ) -> tuple[InterviewContext, object | None]:
     """Run the interview steps until completed or content is returned."""
-    updater = _Updater(interview_context)
+    updater = _Updater(interview_context, load_context)
     result = await updater()
     return result.context, result.content
 
@@ -82,6 +96,7 @@ async def run_steps(
 @frozen
 class _Updater:
     initial_context: InterviewContext
+    load_context: ContextLoader | None = None
 
     async def __call__(self) -> UpdateResult:
         """Run the interview steps until completed or content is returned."""
@@ -102,10 +117,10 @@ class _Updater:
         from oes.interview.interview.step_types.ask import AskResult
 
         cur_result = UpdateResult(context)
-        proxy_ctx = make_proxy(cur_result.context.state.template_context)
+        proxy_ctx = cur_result.context.state.template_context_proxy
         with resolve_undefined_values(context) as resolver:
             for step in steps:
-                if not evaluate(step.when, proxy_ctx):
+                if not evaluate_condition(step.when, proxy_ctx):
                     continue
                 next_result = await self._run_step(cur_result, step)
                 if (
@@ -116,7 +131,7 @@ class _Updater:
                     return next_result
                 cur_result = next_result
             else:
-                return self._handle_complete(cur_result.context)
+                return await self._handle_complete(cur_result.context)
 
         # if we got here, we have an undefined value to ask about
         question_id, question_template, question = resolver.result
@@ -138,9 +153,9 @@ class _Updater:
             result = step(prev_result.context)
         return result
 
-    def _handle_complete(self, context: InterviewContext) -> UpdateResult:
+    async def _handle_complete(self, context: InterviewContext) -> UpdateResult:
         if isinstance(context.state.target, ParentInterviewContext):
-            parent_ctx = context.state.target.context
+            parent_ctx = await self._get_parent(context.state.target)
             value = (
                 context.state.data
                 if context.state.target.value is None
@@ -156,6 +171,18 @@ class _Updater:
             updated_state = context.state.update(completed=True)
             return UpdateResult(context.with_state(updated_state))
 
+    async def _get_parent(self, target: ParentInterviewContext) -> InterviewContext:
+        if target.context is not None:
+            return target.context
+        parent_ctx = (
+            await self.load_context(target.key)
+            if target.key is not None and self.load_context is not None
+            else None
+        )
+        if parent_ctx is None:
+            raise InterviewError("Parent interview not found")
+        return parent_ctx
+
 
 def _is_async_step(step: Step) -> TypeIs[AsyncStep]:
     func = getattr(step, "__call__", step)
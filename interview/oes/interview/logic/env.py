@@ -2,12 +2,15 @@
 
 from oes.interview.logic.undefined import ProxyContextEnvironment, Undefined
 from oes.utils.template import (
+    make_bytecode_cache,
     template_filter_date,
     template_filter_datetime,
     template_fn_get_now,
 )
 
-default_jinja2_env = ProxyContextEnvironment(undefined=Undefined)
+default_jinja2_env = ProxyContextEnvironment(
+    undefined=Undefined, bytecode_cache=make_bytecode_cache()
+)
 """The default :class:`jinja2.Environment` to use with interview logic."""
 
 default_jinja2_env.globals["get_now"] = template_fn_get_now
@@ -2,7 +2,7 @@
 
 import re
 from collections.abc import Mapping, Sequence
-from typing import Any, cast
+from typing import Any
 
 import pyparsing as pp
 from attrs import frozen
@@ -39,7 +39,7 @@ class IndexAccess:
     """Index access object."""
 
     object: ValuePointer
-    index: str | int
+    index: str | int | ValuePointer
 
     def evaluate(self, context: TemplateContext) -> Any:
         index_val = evaluate_logic(self.index, context)
@@ -99,7 +99,9 @@ class Parsing:
 
     property_access = pp.Group(("." + name("property")))
 
-    index_access = pp.Group("[" + space + (number | string)("index") + space + "]")
+    index_access = pp.Group(
+        "[" + space + (number | string | pointer)("index") + space + "]"
+    )
 
     pointer_segment = property_access | index_access
 
@@ -122,21 +124,142 @@ class Parsing:
         return cur
 
 
+_pointer_cache: dict[str, ValuePointer] = {}
+
+_leading_space_re = re.compile(r"(?:[\n\r]*[ \t]+)+|[\n\r]*")
+_space_re = re.compile(r"[ \t]*")
+_pointer_space_re = re.compile(r"(?:[\n\r]*[ \t]+)*")
+_name_re = re.compile(r"(?![0-9])[a-z0-9_]+", re.I)
+_number_re = re.compile(r"[1-9][0-9]*|0(?![0-9])")
+_string_re = re.compile(r'"((?:\\.|[^"\n\r\\])*)"')
+# mirrors the unescaping done by pyparsing's QuotedString, including the repetition
+# counts that it drops from its pattern
+_unescape_re = re.compile(
+    r"(\\[tnfr])|(\\[0-7]3|\\0|\\x[0-9a-fA-F]2|\\u[0-9a-fA-F]4)|\\(.)"
+)
+_whitespace_escapes = {"\\t": "\t", "\\n": "\n", "\\f": "\f", "\\r": "\r"}
+
+
 def parse_pointer(ptr: str, /) -> ValuePointer:
-    """Parse a pointer."""
-    try:
-        res = Parsing.pointer.parse_string(ptr, parse_all=True)
-        return cast(ValuePointer, res[0])
-    except pp.ParseException as e:
-        raise InvalidPointerError(ptr) from e
+    """Parse a pointer.
+
+    Parsed pointers are immutable, so results are interned and shared.
+    """
+    cached = _pointer_cache.get(ptr)
+    if cached is None:
+        cached = _parse_pointer(ptr)
+        _pointer_cache[ptr] = cached
+    return cached
+
+
+def clear_pointer_cache():
+    """Clear the table of interned pointers."""
+    _pointer_cache.clear()
+
+
+def _parse_pointer(ptr: str) -> ValuePointer:
+    # matches Parsing.pointer exactly, including its tab expansion and its
+    # handling of leading and trailing whitespace
+    s = ptr.expandtabs() if "\t" in ptr else ptr
+    s = s.rstrip(" \t\n\r")
+    start = _leading_space_re.match(s).end()  # type: ignore
+    cur, pos = _parse_pointer_at(ptr, s, start)
+    if pos != len(s):
+        raise InvalidPointerError(ptr)
+    return cur
+
+
+def _parse_pointer_at(ptr: str, s: str, pos: int) -> tuple[ValuePointer, int]:
+    m = _name_re.match(s, pos)
+    if m is None:
+        raise InvalidPointerError(ptr)
+    cur: ValuePointer = Name(m.group())
+    pos = m.end()
+    end = len(s)
+    while pos < end:
+        ch = s[pos]
+        if ch == ".":
+            m = _name_re.match(s, pos + 1)
+            if m is None:
+                raise InvalidPointerError(ptr)
+            cur = IndexAccess(cur, m.group())
+            pos = m.end()
+        elif ch == "[":
+            index, pos = _parse_index(ptr, s, pos + 1)
+            cur = IndexAccess(cur, index)
+        else:
+            break
+    return cur, pos
 
 
-def get_path(ptr: ValuePointer, /) -> Sequence[str | int]:
-    """Get the path represented by a pointer."""
+def _parse_index(ptr: str, s: str, pos: int) -> tuple[str | int | ValuePointer, int]:
+    pos = _space_re.match(s, pos).end()  # type: ignore
+    ptr_pos = _pointer_space_re.match(s, pos).end()  # type: ignore
+    if _name_re.match(s, ptr_pos):
+        index, pos = _parse_pointer_at(ptr, s, ptr_pos)  # noqa: NEW100
+    else:
+        index, pos = _parse_constant(ptr, s, pos)
+    pos = _space_re.match(s, pos).end()  # type: ignore
+    if s[pos : pos + 1] != "]":
+        raise InvalidPointerError(ptr)
+    return index, pos + 1
+
+
+def _parse_constant(ptr: str, s: str, pos: int) -> tuple[str | int, int]:
+    m = _string_re.match(s, pos)
+    if m is not None:
+        return _unescape(m.group(1)), m.end()
+    m = _number_re.match(s, pos)
+    if m is not None:
+        return int(m.group()), m.end()
+    raise InvalidPointerError(ptr)
+
+
+def _unescape(s: str) -> str:
+    if "\\" not in s:
+        return s
+    return _unescape_re.sub(_replace_escape, s)
+
+
+def _replace_escape(m: re.Match[str]) -> str:
+    if m.group(1):
+        return _whitespace_escapes[m.group(1)]
+    elif m.group(2):
+        code = m.group(2)[1:]
+        if code == "0":
+            return "\0"
+        elif code[0] in "ux":
+            return chr(int(code[1:], 16))
+        else:
+            return code
+    else:
+        return m.group(3)
+
+
+def get_path(ptr: ValuePointer, /) -> Sequence[str | int | ValuePointer]:
+    """Get the path represented by a pointer.
+
+    Index segments that are pointers themselves are included as pointers.
+    """
     return _get_path(ptr)
 
 
-def _get_path(ptr: ValuePointer) -> Sequence[str | int]:
+def resolve_pointer(ptr: ValuePointer, context: TemplateContext, /) -> ValuePointer:
+    """Return ``ptr`` with any pointer index segments evaluated in ``context``."""
+    if isinstance(ptr, IndexAccess):
+        obj = resolve_pointer(ptr.object, context)
+        index = (
+            ptr.index
+            if isinstance(ptr.index, (str, int))
+            else evaluate_logic(ptr.index, context)
+        )
+        if obj is ptr.object and index is ptr.index:
+            return ptr
+        return IndexAccess(obj, index)
+    return ptr
+
+
+def _get_path(ptr: ValuePointer) -> Sequence[str | int | ValuePointer]:
     if isinstance(ptr, Name):
         return (ptr.name,)
     elif isinstance(ptr, IndexAccess):
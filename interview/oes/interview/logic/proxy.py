@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator, Mapping, Sequence
-from typing import TypeVar, overload
+from typing import Any, TypeVar, overload
 
 _V_co = TypeVar("_V_co", covariant=True)
 _V2_co = TypeVar("_V2_co", covariant=True)
@@ -27,17 +27,69 @@ class ProxyLookupError(LookupError):
         return f"<ProxyLookupError {str(self)} >"
 
 
-class ArrayProxy(Sequence[_V_co]):
-    """Array proxy."""
+class _Proxy:
+    """Proxy base class.
+
+    A proxy stores its parent proxy and key instead of its full path, and the path
+    is only built when needed, such as when a lookup fails. Child proxies are
+    cached by key and reused while the child value is the same object.
+    """
 
-    __slots__ = (
-        "_path",
-        "_target",
-    )
+    __slots__ = ("_target", "_parent", "_key", "_children")
 
-    def __init__(self, target: Sequence[_V_co], path: Sequence[str | int]):
-        self._path = path
+    _target: Any
+    _parent: _Proxy | tuple[str | int, ...]
+    _key: str | int | None
+    _children: dict[str | int, _Proxy] | None
+
+    def __init__(
+        self,
+        target: Any,
+        path: Sequence[str | int] = (),
+        *,
+        parent: _Proxy | None = None,
+        key: str | int | None = None,
+    ):
         self._target = target
+        self._parent = parent if parent is not None else tuple(path)
+        self._key = key
+        self._children = None
+
+    @property
+    def _path(self) -> tuple[str | int, ...]:
+        """The path to this value."""
+        keys = []
+        node = self
+        while isinstance(node._parent, _Proxy):
+            keys.append(node._key)
+            node = node._parent
+        keys.reverse()
+        return (*node._parent, *keys)
+
+    def _get_child(self, key: str | int) -> Any:
+        try:
+            child = self._target[key]
+        except LookupError as exc:
+            raise ProxyLookupError(key, self._path) from exc
+
+        children = self._children
+        if children is None:
+            children = self._children = {}
+        else:
+            cached = children.get(key)
+            if cached is not None and cached._target is child:
+                return cached
+
+        proxy = _make_proxy(child, parent=self, key=key)
+        if proxy is not child:
+            children[key] = proxy
+        return proxy
+
+
+class ArrayProxy(_Proxy, Sequence[_V_co]):
+    """Array proxy."""
+
+    __slots__ = ()
 
     @overload
     def __getitem__(self, index: int) -> _V_co: ...
@@ -48,13 +100,7 @@ class ArrayProxy(Sequence[_V_co]):
     def __getitem__(self, index: int | slice) -> _V_co | ArrayProxy[_V_co]:
         if isinstance(index, slice):
             raise ValueError("Slices are not supported")
-
-        try:
-            child = self._target[index]
-        except LookupError as exc:
-            raise ProxyLookupError(index, self._path) from exc
-
-        return make_proxy(child, (*self._path, index))
+        return self._get_child(index)
 
     def __iter__(self) -> Iterator[_V_co]:
         return iter(self._target)
@@ -85,25 +131,13 @@ class ArrayProxy(Sequence[_V_co]):
         return hash(self._target)
 
 
-class ObjectProxy(Mapping[str, _V_co]):
+class ObjectProxy(_Proxy, Mapping[str, _V_co]):
     """Object proxy."""
 
-    __slots__ = (
-        "_path",
-        "_target",
-    )
-
-    def __init__(self, target: Mapping[str, _V_co], path: Sequence[str | int]):
-        self._path = path
-        self._target = target
+    __slots__ = ()
 
     def __getitem__(self, key: str, /) -> _V_co:
-        try:
-            child = self._target[key]
-        except LookupError as exc:
-            raise ProxyLookupError(key, self._path) from exc
-
-        return make_proxy(child, (*self._path, key))
+        return self._get_child(key)
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._target)
@@ -135,10 +169,26 @@ def make_proxy(obj: _T, path: Sequence[int | str] = ()) -> _T: ...
 
 
 def make_proxy(obj, path=()):
-    """Wrap an object in a proxy if it is a sequence or mapping."""
-    if isinstance(obj, Mapping):
-        return ObjectProxy(obj, path)
+    """Wrap an object in a proxy if it is a sequence or mapping.
+
+    Proxies are returned unchanged. Keep the returned proxy to reuse its cached
+    children, as :attr:`InterviewState.template_context_proxy` does.
+    """
+    return _make_proxy(obj, path)
+
+
+def _make_proxy(
+    obj: Any,
+    path: Sequence[str | int] = (),
+    *,
+    parent: _Proxy | None = None,
+    key: str | int | None = None,
+) -> Any:
+    if isinstance(obj, _Proxy):
+        return obj
+    elif isinstance(obj, Mapping):
+        return ObjectProxy(obj, path, parent=parent, key=key)
     elif isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
-        return ArrayProxy(obj, path)
+        return ArrayProxy(obj, path, parent=parent, key=key)
     else:
         return obj
@@ -0,0 +1,73 @@
+"""JSON patch module.
+
+Patches are lists of operations on JSON-compatible values. Each operation is a
+list of a path, as a list of object keys and array indexes, and optionally a
+value. An operation with a value sets the value at the path, and an operation
+without one deletes it.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+Patch = list[list[Any]]
+"""A list of patch operations."""
+
+
+def make_patch(a: Any, b: Any) -> Patch:
+    """Make a patch that turns ``a`` into ``b``."""
+    ops: Patch = []
+    _diff(a, b, [], ops)
+    return ops
+
+
+def apply_patch(obj: Any, patch: Sequence[Sequence[Any]]) -> Any:
+    """Apply a patch to ``obj``.
+
+    ``obj`` is not modified, only the containers along each path are copied.
+    """
+    copied: set[int] = set()
+    root = [obj]
+    for op in patch:
+        path = op[0]
+        parent, key = _get_parent(root, [0, *path], copied)
+        if len(op) == 1:
+            del parent[key]
+        else:
+            parent[key] = op[1]
+    return root[0]
+
+
+def _diff(a: Any, b: Any, path: list[str | int], ops: Patch):
+    if isinstance(a, dict) and isinstance(b, dict):
+        _diff_dict(a, b, path, ops)
+    elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+        for i, (x, y) in enumerate(zip(a, b)):
+            _diff(x, y, [*path, i], ops)
+    elif type(a) is not type(b) or a != b:
+        ops.append([path, b])
+
+
+def _diff_dict(a: dict[str, Any], b: dict[str, Any], path: list[str | int], ops: Patch):
+    for k, v in b.items():
+        if k in a:
+            _diff(a[k], v, [*path, k], ops)  # noqa: NEW100
+        else:
+            ops.append([[*path, k], v])
+    for k in a:
+        if k not in b:
+            ops.append([[*path, k]])
+
+
+def _get_parent(
+    root: list[Any], path: Sequence[str | int], copied: set[int]
+) -> tuple[Any, str | int]:
+    # copy each container on the path once, then return the last container
+    cur = root
+    for key in path[:-1]:
+        child = cur[key]
+        if id(child) not in copied:
+            child = list(child) if isinstance(child, list) else dict(child)
+            copied.add(id(child))
+            cur[key] = child
+        cur = child
+    return cur, path[-1]
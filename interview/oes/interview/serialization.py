@@ -1,18 +1,30 @@
 """Serialization module."""
 
 import functools
-from collections.abc import Sequence
+from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 from cattrs import Converter
 from cattrs.preconf.orjson import make_converter
 
+if TYPE_CHECKING:
+    from oes.interview.interview.interview import Interview
+
 converter = make_converter()
 
 
-def configure_converter(converter: Converter):
-    """Configure a :class:`Converter`."""
+def configure_converter(
+    converter: Converter,
+    get_interviews: Callable[[], Mapping[str, "Interview"]] | None = None,
+):
+    """Configure a :class:`Converter`.
+
+    Args:
+        converter: The converter.
+        get_interviews: A function returning the loaded interviews, whose prebuilt
+            indexes are reused when structuring an interview context.
+    """
     from oes.interview.config.interview import (
         InterviewConfigObject,
         QuestionTemplateObject,
@@ -27,6 +39,11 @@ def configure_converter(converter: Converter):
         make_interview_context_unstructure_fn,
     )
     from oes.interview.interview.serialization import make_step_structure_fn
+    from oes.interview.interview.state import (
+        ParentInterviewContext,
+        make_parent_interview_context_structure_fn,
+        make_parent_interview_context_unstructure_fn,
+    )
     from oes.interview.interview.types import Step
     from oes.interview.logic.env import default_jinja2_env
     from oes.interview.logic.pointer import ValuePointer, parse_pointer
@@ -58,7 +75,6 @@ def configure_converter(converter: Converter):
     value_eval_structure_fn = functools.lru_cache(maxsize=1024)(
         make_value_or_evaluable_structure_fn(converter)
     )
-    value_pointer_structure_fn = functools.lru_cache(maxsize=1024)(parse_pointer)
 
     converter.register_structure_hook(Template, tmpl_structure_fn)
     converter.register_unstructure_hook(Template, unstructure_template)
@@ -86,9 +102,7 @@ def configure_converter(converter: Converter):
         WhenCondition, make_when_condition_structure_fn(converter)
     )
 
-    converter.register_structure_hook(
-        ValuePointer, lambda v, t: value_pointer_structure_fn(v)
-    )
+    converter.register_structure_hook(ValuePointer, lambda v, t: parse_pointer(v))
     converter.register_unstructure_hook(ValuePointer, lambda v: str(v))
 
     converter.register_structure_hook_func(
@@ -107,8 +121,15 @@ def configure_converter(converter: Converter):
     )
 
     converter.register_structure_hook(
-        InterviewContext, make_interview_context_structure_fn(converter)
+        InterviewContext, make_interview_context_structure_fn(converter, get_interviews)
     )
     converter.register_unstructure_hook(
         InterviewContext, make_interview_context_unstructure_fn(converter)
     )
+    converter.register_structure_hook(
+        ParentInterviewContext, make_parent_interview_context_structure_fn(converter)
+    )
+    converter.register_unstructure_hook(
+        ParentInterviewContext,
+        make_parent_interview_context_unstructure_fn(converter),
+    )
@@ -1,15 +1,25 @@
 """Main entry points."""
 
-import os
-import sys
+from collections.abc import Mapping
+from pathlib import Path
 
+from cattrs import Converter
 from cattrs.preconf.orjson import make_converter
-from oes.interview.config.config import get_config, load_config_file
+from oes.interview.config.config import Config, get_config
+from oes.interview.config.files import track_loaded_files
+from oes.interview.config.snapshot import get_interviews
+from oes.interview.http import HTTPClient, set_http_client
+from oes.interview.interview.interview import Interview
 from oes.interview.serialization import configure_converter
 from oes.interview.server.routes import response_converter, routes
 from oes.interview.storage import StorageService
 from oes.utils import setup_logging
-from oes.utils.sanic import setup_app
+from oes.utils.metrics import instrument_redis
+from oes.utils.reload import ConfigReloader
+from oes.utils.sanic import run_server, setup_app, setup_config_reload
+from oes.utils.template import log_compile_times, record_compile_times
+from oes.utils.workers import per_worker
+from redis.asyncio import Redis
 from sanic import Sanic
 from sanic.worker.manager import WorkerManager
 
@@ -18,13 +28,7 @@ WorkerManager.THRESHOLD = 1200  # type: ignore
 
 def main():
     """CLI wrapper."""
-    os.execlp(
-        "sanic",
-        "oes-interview-service",
-        "--single-process",
-        "oes.interview.server.main:create_app",
-        *sys.argv[1:]
-    )
+    run_server("oes-interview-service", "oes.interview.server.main:create_app")
 
 
 def create_app():
@@ -35,18 +39,34 @@ def create_app():
     setup_logging()
 
     converter = make_converter()
-    configure_converter(converter)
+    configure_converter(converter, lambda: app.ctx.interviews)
     configure_converter(response_converter.converter)
 
-    interview_config = load_config_file(config.config_file, converter)
-    interviews = interview_config.get_interviews(
-        config.config_file.resolve().parent, converter
-    )
+    interviews, paths = _load_interviews(config, converter)
 
-    setup_app(app, converter=converter)
+    setup_app(
+        app,
+        converter=converter,
+        metrics=config.metrics,
+        server_timing=config.server_timing,
+    )
     app.ext.dependency(config)
     app.ctx.interviews = interviews
 
+    def apply_interviews(new_interviews: Mapping[str, Interview]):
+        app.ctx.interviews = new_interviews
+
+    setup_config_reload(
+        app,
+        ConfigReloader(
+            "interview",
+            lambda: _load_interviews(config, converter),
+            apply_interviews,
+            paths,
+            watch_interval=config.config_watch_interval,
+        ),
+    )
+
     app.blueprint(routes)
 
     @app.before_server_start
@@ -55,7 +75,14 @@ def create_app():
 
     @app.before_server_start
     async def setup_redis(app: Sanic):
-        storage = StorageService(config.redis_url, converter)
+        storage = StorageService(
+            config.redis_url,
+            converter,
+            instrument_redis(Redis.from_url(config.redis_url)),
+            delta=config.state_deltas,
+            max_chain_length=config.state_max_chain_length,
+            cache_size=config.state_cache_size,
+        )
         app.ctx.storage = storage
         app.ext.dependency(storage)
 
@@ -63,4 +90,33 @@ def create_app():
     async def stop_redis(app: Sanic):
         await app.ctx.storage.aclose()
 
+    @app.before_server_start
+    async def setup_http_client(app: Sanic):
+        client = HTTPClient.create(
+            timeout=config.http_timeout,
+            max_connections=per_worker(config.http_max_connections),
+            max_keepalive_connections=per_worker(config.http_max_keepalive_connections),
+            keepalive_expiry=config.http_keepalive_expiry,
+            cache_size=config.http_cache_size,
+        )
+        app.ctx.http_client = client
+        set_http_client(client)
+
+    @app.after_server_stop
+    async def stop_http_client(app: Sanic):
+        set_http_client(None)
+        await app.ctx.http_client.aclose()
+
     return app
+
+
+def _load_interviews(
+    config: Config, converter: Converter
+) -> tuple[Mapping[str, Interview], list[Path]]:
+    with record_compile_times() as compile_times, track_loaded_files() as files:
+        interviews = get_interviews(config.config_file, config.snapshot_file, converter)
+    log_compile_times(compile_times)
+    paths = [config.config_file.absolute(), *files]
+    if config.snapshot_file is not None:
+        paths.append(config.snapshot_file.absolute())
+    return interviews, paths
@@ -105,6 +105,10 @@ async def start_interview(
         interview.steps,
         state,
         interviews,
+        interview.path_index,
+        interview.indirect_path_index,
+        interview_id,
+        interview.version,
     )
     key = await storage.put(context)
     return _make_response(request, key, state, None)
@@ -120,12 +124,14 @@ async def update_interview_route(
     context = raise_not_found(await storage.get(req.state))
 
     try:
-        result_ctx, content = await update_interview(context, req.responses)
+        result_ctx, content = await update_interview(
+            context, req.responses, load_context=storage.get
+        )
     except ValidationError:
         exc = BadRequest("Invalid input")
         exc.status_code = 422
         raise exc
-    key = await storage.put(result_ctx)
+    key = await storage.put(result_ctx, base=req.state)
     return _make_response(request, key, result_ctx.state, content)
 
 
@@ -3,55 +3,133 @@
 import base64
 import gzip
 import hashlib
+from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
 import orjson
+from attrs import evolve
 from cattrs import Converter
 from immutabledict import immutabledict
 from oes.interview.interview.interview import InterviewContext
+from oes.interview.interview.state import ParentInterviewContext
+from oes.interview.patch import apply_patch, make_patch
 from redis.asyncio import Redis
 from typing_extensions import Self
 
+DEFAULT_MAX_CHAIN_LENGTH = 10
+"""Default maximum number of patches between full state snapshots."""
 
-class StorageService:
-    """Storage service."""
+DEFAULT_CACHE_SIZE = 1024
+"""Default maximum number of locally cached states."""
+
+# state data, context key, number of patches since the last full snapshot
+_StateEntry = tuple[Mapping[str, Any], str, int]
 
-    def __init__(self, url: str, converter: Converter):
+
+class StorageService:
+    """Storage service.
+
+    If ``delta`` is enabled, a state stored with a ``base`` key is written as a
+    patch against the base state. A full snapshot is written instead once the
+    chain of patches reaches ``max_chain_length``. Recently used states are
+    cached locally to avoid replaying the chain on each read.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        converter: Converter,
+        client: Redis | None = None,
+        *,
+        delta: bool = False,
+        max_chain_length: int = DEFAULT_MAX_CHAIN_LENGTH,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
         self._url = url
-        self._client = Redis.from_url(url)
+        self._client = client if client is not None else Redis.from_url(url)
         self._converter = converter
+        self._delta = delta
+        self._max_chain_length = max_chain_length
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, _StateEntry] = OrderedDict()
 
-    async def put(self, context: InterviewContext) -> str:
+    async def put(self, context: InterviewContext, *, base: str | None = None) -> str:
         """Store an :class:`InterviewContext`.
 
+        The parent of a sub-interview is stored first and referenced by its key.
+
+        Args:
+            context: The context.
+            base: The key of the previous state, which the state may be stored as a
+                patch against.
+
         Returns:
             A string key to reference the context.
         """
+        context = await self._store_parent(context)
         state_only, context_only = self._unstructure(context)
         context_key = await self._store_context(
             context_only, context.state.date_expires
         )
         state_key = await self._store_state(
-            state_only, context_key, context.state.date_expires
+            state_only, context_key, context.state.date_expires, base
         )
         return state_key
 
     async def get(self, key: str) -> InterviewContext | None:
         """Get an :class:`InterviewContext`."""
-        state_data = await self._client.get(b"oes.interview." + key.encode())
-        if state_data is None:
+        entry = await self._get_state(key)
+        if entry is None:
             return None
-        state = _from_bytes(state_data)
-        context_key = state["context_key"]
+        state, context_key, _ = entry
         context_data = await self._client.get(b"oes.interview." + context_key.encode())
         if context_data is None:
             return None
         context = _from_bytes(context_data)
-        full = {**context, "state": state["state"]}
+        full = {**context, "state": state}
         return self._converter.structure(full, InterviewContext)
 
+    async def _get_state(self, key: str) -> _StateEntry | None:
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+
+        state_data = await self._client.get(b"oes.interview." + key.encode())
+        if state_data is None:
+            return None
+        record = _from_bytes(state_data)
+        if "patch" in record:
+            base_entry = await self._get_state(record["base"])
+            if base_entry is None:
+                return None
+            state = apply_patch(base_entry[0], record["patch"])
+            entry = (state, record["context_key"], record["depth"])
+        else:
+            entry = (record["state"], record["context_key"], 0)
+        self._cache_state(key, entry)
+        return entry
+
+    def _cache_state(self, key: str, entry: _StateEntry):
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def _store_parent(self, context: InterviewContext) -> InterviewContext:
+        target = context.state.target
+        if not isinstance(target, ParentInterviewContext) or target.key is not None:
+            return context
+        if target.context is None:
+            raise ValueError("Parent interview context is missing")
+        parent_key = await self.put(target.context)
+        state = evolve(context.state, target=evolve(target, key=parent_key))
+        return context.with_state(state)
+
     def _unstructure(
         self, context: InterviewContext
     ) -> tuple[Mapping[str, Any], Mapping[str, Any]]:
@@ -73,18 +151,46 @@ class StorageService:
         return key
 
     async def _store_state(
-        self, state_only: Mapping[str, Any], context_key: str, exp: datetime
+        self,
+        state_only: Mapping[str, Any],
+        context_key: str,
+        exp: datetime,
+        base: str | None,
     ) -> str:
-        with_context_ref = {
-            **state_only,
-            "context_key": context_key,
-        }
-        key, bytes_ = _to_bytes(with_context_ref)
+        if self._delta:
+            # normalize to the same form as states read back from storage
+            state = orjson.loads(orjson.dumps(state_only["state"], default=_default))
+            record, depth = await self._make_record(state, context_key, base)
+        else:
+            state = state_only["state"]
+            record, depth = {**state_only, "context_key": context_key}, 0
+
+        key, bytes_ = _to_bytes(record)
         await self._client.set(
             b"oes.interview." + key.encode(), bytes_, exat=exp, nx=True
         )
+        if self._delta:
+            self._cache_state(key, (state, context_key, depth))
         return key
 
+    async def _make_record(
+        self, state: Mapping[str, Any], context_key: str, base: str | None
+    ) -> tuple[Mapping[str, Any], int]:
+        base_entry = await self._get_state(base) if base is not None else None
+        if base_entry is not None and base_entry[2] < self._max_chain_length:
+            base_state, _, base_depth = base_entry
+            patch = make_patch(base_state, state)
+            # write a snapshot if the whole state was replaced
+            if not patch or patch[0][0]:
+                record = {
+                    "base": base,
+                    "patch": patch,
+                    "depth": base_depth + 1,
+                    "context_key": context_key,
+                }
+                return record, base_depth + 1
+        return {"state": state, "context_key": context_key}, 0
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -0,0 +1,130 @@
+import io
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+from attrs import evolve
+from cattrs import Converter
+from cattrs.preconf.orjson import make_converter
+from oes.interview.config.files import track_loaded_files
+from oes.interview.config.snapshot import (
+    SnapshotError,
+    SnapshotHeader,
+    get_interviews,
+    load_interviews,
+    read_snapshot,
+    write_snapshot,
+)
+from oes.interview.serialization import configure_converter
+
+
+@pytest.fixture
+def converter():
+    converter = make_converter()
+    configure_converter(converter)
+    return converter
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path):
+    dest = tmp_path / "configs"
+    shutil.copytree("tests/test_data/configs", dest)
+    return dest
+
+
+def test_snapshot(config_dir: Path, tmp_path: Path, converter: Converter):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    interviews = write_snapshot(snapshot_file, config_file, converter)
+    loaded = read_snapshot(snapshot_file, config_file)
+    assert loaded == interviews
+    assert loaded["simple-with-set"].path_index == (
+        interviews["simple-with-set"].path_index
+    )
+
+
+def test_snapshot_file_changed(config_dir: Path, tmp_path: Path, converter: Converter):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    write_snapshot(snapshot_file, config_file, converter)
+
+    questions_file = config_dir / "questions" / "questions1.yml"
+    questions_file.write_text(questions_file.read_text() + "\n# changed\n")
+
+    with pytest.raises(SnapshotError):
+        read_snapshot(snapshot_file, config_file)
+
+
+def test_snapshot_directory_changed(
+    config_dir: Path, tmp_path: Path, converter: Converter
+):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    write_snapshot(snapshot_file, config_file, converter)
+
+    shutil.copy(
+        config_dir / "interviews" / "block.yml", config_dir / "interviews" / "new.yml"
+    )
+
+    with pytest.raises(SnapshotError):
+        read_snapshot(snapshot_file, config_file)
+
+
+class _Invalid:
+    def __reduce__(self):
+        return int, ("invalid",)
+
+
+def _split_snapshot(path: Path) -> tuple[bytes, SnapshotHeader, bytes]:
+    data = path.read_bytes()
+    buf = io.BytesIO(data)
+    buf.seek(data.index(b"\n") + 1)
+    magic = data[: buf.tell()]
+    header = pickle.load(buf)
+    return magic, header, data[buf.tell() :]
+
+
+def test_snapshot_code_changed(config_dir: Path, tmp_path: Path, converter: Converter):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    write_snapshot(snapshot_file, config_file, converter)
+
+    magic, header, payload = _split_snapshot(snapshot_file)
+    header = evolve(header, code_digest="0" * 64)
+    snapshot_file.write_bytes(magic + pickle.dumps(header) + payload)
+
+    with pytest.raises(SnapshotError):
+        read_snapshot(snapshot_file, config_file)
+
+
+def test_snapshot_load_error(config_dir: Path, tmp_path: Path, converter: Converter):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    write_snapshot(snapshot_file, config_file, converter)
+
+    magic, header, _ = _split_snapshot(snapshot_file)
+    snapshot_file.write_bytes(magic + pickle.dumps(header) + pickle.dumps(_Invalid()))
+
+    with pytest.raises(SnapshotError):
+        read_snapshot(snapshot_file, config_file)
+    expected, _ = load_interviews(config_file, converter)
+    assert get_interviews(config_file, snapshot_file, converter) == expected
+
+
+def test_snapshot_fallback(config_dir: Path, tmp_path: Path, converter: Converter):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    snapshot_file.write_bytes(b"invalid")
+    expected, _ = load_interviews(config_file, converter)
+    assert get_interviews(config_file, snapshot_file, converter) == expected
+
+
+def test_snapshot_records_files(config_dir: Path, tmp_path: Path, converter: Converter):
+    config_file = config_dir / "config1.yml"
+    snapshot_file = tmp_path / "snapshot.bin"
+    _, expected = load_interviews(config_file, converter)
+    write_snapshot(snapshot_file, config_file, converter)
+    with track_loaded_files() as files:
+        read_snapshot(snapshot_file, config_file)
+    assert files == expected
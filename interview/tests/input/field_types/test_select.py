@@ -177,3 +177,50 @@ def test_select_field_validators_multi(value, valid, expected):
     else:
         with pytest.raises(ValueError):
             field.parse(value)
+
+
+class _CountingExpression:
+    def __init__(self, value):
+        self.value = value
+        self.count = 0
+
+    def evaluate(self, context):
+        self.count += 1
+        return self.value
+
+
+def test_select_field_options_evaluated_once():
+    when = _CountingExpression(True)
+    template = SelectFieldTemplate(
+        options=(
+            SelectFieldOption(id="1", label="Option 1", when=when),
+            SelectFieldOption(id="2", label="Option 2", when=False),
+        ),
+        min=0,
+        max=2,
+    )
+    field = template.get_field({})
+    assert when.count == 1
+    assert field.parse(["1"]) == (None,)
+    with pytest.raises(ValueError):
+        field.parse(["2"])
+
+    template.get_field({})
+    assert when.count == 2
+
+
+def test_select_field_static_options():
+    template = SelectFieldTemplate(
+        options=(
+            SelectFieldOption(id="1", label="Option 1", value=1),
+            SelectFieldOption(id="2", label="Option 2", value=2, when=False),
+        ),
+    )
+    field = template.get_field({})
+    assert field.parse("1") == 1
+    with pytest.raises(ValueError):
+        field.parse("2")
+    assert template.get_options({}) is template.get_options({"other": 1})
+    assert field.schema["oneOf"] == make_immutable(
+        [{"const": "1", "title": "Option 1"}, {"type": "null"}]
+    )
@@ -1,7 +1,8 @@
-from unittest.mock import MagicMock, create_autospec, patch
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
 from httpx import AsyncClient
+from oes.interview.http import HTTPClient, set_http_client
 from oes.interview.immutable import make_immutable
 from oes.interview.interview.interview import InterviewContext
 from oes.interview.interview.state import InterviewState
@@ -21,14 +22,13 @@ def context(state: InterviewState):
 
 @pytest.fixture
 def mock_client():
-    mock_client = create_autospec(AsyncClient)
-    mock_client.return_value = mock_client
-    mock_client.__aenter__.return_value = mock_client
+    mock_client = create_autospec(AsyncClient, instance=True)
     res_mock = MagicMock()
-    res_mock.json.return_value = {"ok": True}
-    mock_client.__aenter__.return_value.post.return_value = res_mock
-    with patch("oes.interview.interview.step_types.http.AsyncClient", mock_client):
-        yield mock_client
+    res_mock.content = b'{"ok":true}'
+    mock_client.post.return_value = res_mock
+    set_http_client(HTTPClient(mock_client))
+    yield mock_client
+    set_http_client(None)
 
 
 @pytest.mark.asyncio
@@ -51,3 +51,24 @@ async def test_http_step_skip(context: InterviewContext, mock_client: AsyncClien
     result = await step(context)
     assert result.context.state == context.state
     mock_client.post.assert_not_called()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_http_step_cache(context: InterviewContext, mock_client: AsyncClient):
+    step = HTTPRequestStep("test", parse_pointer("result"), cache_ttl=60)
+    result1 = await step(context)
+    result2 = await step(context)
+    assert result1.context.state.data == result2.context.state.data
+    assert mock_client.post.call_count == 1  # type: ignore
+
+    other = context.with_state(context.state.update(data={"a": {"b": "d"}}))
+    await step(other)
+    assert mock_client.post.call_count == 2  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_http_step_no_cache(context: InterviewContext, mock_client: AsyncClient):
+    step = HTTPRequestStep("test", parse_pointer("result"))
+    await step(context)
+    await step(context)
+    assert mock_client.post.call_count == 2  # type: ignore
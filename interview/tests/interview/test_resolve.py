@@ -29,22 +29,14 @@ questions = {
     ),
     "q4": QuestionTemplate(fields={parse_pointer("b.a"): TextFieldTemplate()}),
     "q5": QuestionTemplate(fields={parse_pointer("b.a"): TextFieldTemplate()}),
-    # QuestionTemplate(
-    #     id="q6", fields=(TextFieldTemplate(set=parse_pointer("c[value]")),)
-    # ),
-    # QuestionTemplate(id="q7", fields=(TextFieldTemplate(set=parse_pointer("c[0]")),)),
-    # QuestionTemplate(
-    #     id="q8", fields=(TextFieldTemplate(set=parse_pointer("d[value]")),)
-    # ),
-    # QuestionTemplate(
-    #     id="q9", fields=(TextFieldTemplate(set=parse_pointer("e[value][value]")),)
-    # ),
-    # QuestionTemplate(
-    #     id="q10", fields=(TextFieldTemplate(set=parse_pointer("e[value][0]")),)
-    # ),
-    # QuestionTemplate(
-    #     id="q11", fields=(TextFieldTemplate(set=parse_pointer("e[0][value]")),)
-    # ),
+    "q6": QuestionTemplate(fields={parse_pointer("c[value]"): TextFieldTemplate()}),
+    "q7": QuestionTemplate(fields={parse_pointer("c[0]"): TextFieldTemplate()}),
+    "q8": QuestionTemplate(fields={parse_pointer("d[value]"): TextFieldTemplate()}),
+    "q9": QuestionTemplate(
+        fields={parse_pointer("e[value][value]"): TextFieldTemplate()}
+    ),
+    "q10": QuestionTemplate(fields={parse_pointer("e[value][0]"): TextFieldTemplate()}),
+    "q11": QuestionTemplate(fields={parse_pointer("e[0][value]"): TextFieldTemplate()}),
 }
 
 
@@ -56,11 +48,12 @@ questions = {
         (("a", "c"), set(), "q2"),
         (("b", "a"), set(), "q4"),
         (("b", "a"), {"q4"}, "q5"),
-        # (("c", 0), set(), "q7"),
-        # (("c", 0), {"q7"}, "q6"),
-        # (("e", 0, 0), set(), "q11"),
-        # (("e", 0, 0), {"q11"}, "q9"),
-        # (("e", 0, 0), {"q11", "q9"}, "q10"),
+        (("c", 0), set(), "q7"),
+        (("c", 0), {"q7"}, "q6"),
+        (("d", 0), set(), "q8"),
+        (("e", 0, 0), set(), "q11"),
+        (("e", 0, 0), {"q11"}, "q9"),
+        (("e", 0, 0), {"q11", "q9"}, "q10"),
     ],
 )
 def test_resolve_questions(provide, asked_ids, expected_id):
@@ -110,23 +103,27 @@ questions2 = {
             parse_pointer("q6"): TextFieldTemplate(),
         },
     ),
-    # QuestionTemplate(
-    #     id="q7",
-    #     fields=(TextFieldTemplate(set=parse_pointer("n")),),
-    # ),
-    # QuestionTemplate(
-    #     id="q8",
-    #     fields=(TextFieldTemplate(set=parse_pointer("p[n]")),),
-    # ),
-    # QuestionTemplate(
-    #     id="q9",
-    #     fields=(TextFieldTemplate(set=parse_pointer("p[n].name")),),
-    # ),
-    # QuestionTemplate(
-    #     id="q10",
-    #     description=Template("{{ p[n].name }}", default_jinja2_env),
-    #     fields=(TextFieldTemplate(set=parse_pointer("p[n].other")),),
-    # ),
+    "q7": QuestionTemplate(
+        fields={
+            parse_pointer("n"): TextFieldTemplate(),
+        },
+    ),
+    "q8": QuestionTemplate(
+        fields={
+            parse_pointer("p[n]"): TextFieldTemplate(),
+        },
+    ),
+    "q9": QuestionTemplate(
+        fields={
+            parse_pointer("p[n].name"): TextFieldTemplate(),
+        },
+    ),
+    "q10": QuestionTemplate(
+        description=Template("{{ p[n].name }}", default_jinja2_env),
+        fields={
+            parse_pointer("p[n].other"): TextFieldTemplate(),
+        },
+    ),
 }
 
 
@@ -137,11 +134,11 @@ questions2 = {
         ("c", {}, "q1"),
         ("c", {"a": True}, "q2"),
         ("c", {"b": "b"}, "q3"),
-        # ("p[0].name", {"p": []}, "q7"),
-        # ("p[0].name", {"p": [], "n": 0}, "q8"),
-        # ("p[0].name", {"p": [{}], "n": 0}, "q9"),
-        # ("p[0].other", {"p": [{}], "n": 0}, "q9"),
-        # ("p[0].other", {"p": [{"name": "..."}], "n": 0}, "q10"),
+        ("p[0].name", {"p": []}, "q7"),
+        ("p[0].name", {"p": [], "n": 0}, "q8"),
+        ("p[0].name", {"p": [{}], "n": 0}, "q9"),
+        ("p[0].other", {"p": [{}], "n": 0}, "q9"),
+        ("p[0].other", {"p": [{"name": "..."}], "n": 0}, "q10"),
     ],
 )
 def test_resolve_context(eval, data, expected_id):
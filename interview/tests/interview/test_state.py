@@ -15,6 +15,15 @@ def test_state_template_context():
     )
 
 
+def test_state_template_context_proxy():
+    state = InterviewState(target="test", data={"a": [{"b": 1}]})
+    proxy = state.template_context_proxy
+    assert proxy == state.template_context
+    assert proxy["a"][0] is state.template_context_proxy["a"][0]
+    updated = state.update(data={"a": [{"b": 2}]})
+    assert updated.template_context_proxy["a"][0]["b"] == 2
+
+
 def test_state_update():
     state = InterviewState(target="test", data={"a": 1, "b": 2}, context={"ctx": "ctx"})
     updated = state.update(
@@ -0,0 +1,27 @@
+from oes.interview.interview.trie import PathTrie
+from oes.interview.logic.pointer import parse_pointer
+
+
+def test_path_trie():
+    trie: PathTrie[str] = PathTrie()
+    assert not trie
+    trie.add(("a", parse_pointer("n"), "b"), "wildcard")
+    trie.add(("a", 0, "b"), "exact")
+    trie.add(("a", 0), "prefix")
+    trie.add((parse_pointer("x"), parse_pointer("y"), "b"), "all")
+    assert trie
+
+    assert list(trie.find(("a", 0, "b"))) == ["exact", "wildcard", "all"]
+    assert list(trie.find(("a", 1, "b"))) == ["wildcard", "all"]
+    assert list(trie.find(("a", 0))) == ["prefix"]
+    assert list(trie.find(("c", "d", "b"))) == ["all"]
+    assert list(trie.find(("a", 0, "c"))) == []
+    assert list(trie.find(())) == []
+
+
+def test_path_trie_order():
+    trie: PathTrie[str] = PathTrie()
+    trie.add(("e", parse_pointer("x"), parse_pointer("y")), "q9")
+    trie.add(("e", parse_pointer("x"), 0), "q10")
+    trie.add(("e", 0, parse_pointer("y")), "q11")
+    assert list(trie.find(("e", 0, 0))) == ["q11", "q9", "q10"]
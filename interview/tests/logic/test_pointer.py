@@ -1,6 +1,12 @@
+import pyparsing as pp
 import pytest
 from oes.interview.immutable import make_immutable
-from oes.interview.logic.pointer import InvalidPointerError, get_path, parse_pointer
+from oes.interview.logic.pointer import (
+    InvalidPointerError,
+    Parsing,
+    get_path,
+    parse_pointer,
+)
 
 
 @pytest.mark.parametrize(
@@ -104,10 +110,43 @@ def test_str(val):
         ("a", ("a",)),
         ("a.b", ("a", "b")),
         ("a[1].b[2].c", ("a", 1, "b", 2, "c")),
-        # ("a[b][0]", ("a", parse_pointer("b"), 0)),
-        # ("a[b.c[d]][e]", ("a", parse_pointer("b.c[d]"), parse_pointer("e"))),
+        ("a[b][0]", ("a", parse_pointer("b"), 0)),
+        ("a[b.c[d]][e]", ("a", parse_pointer("b.c[d]"), parse_pointer("e"))),
     ],
 )
 def test_get_path(ptr, expected):
     parsed = parse_pointer(ptr)
     assert get_path(parsed) == expected
+
+
+@pytest.mark.parametrize(
+    "val",
+    [
+        "a",
+        " a.b ",
+        "\na",
+        "\n a",
+        " \na",
+        "a[ 0 ]",
+        "a[\t0]",
+        'a["b c"]',
+        'a["\\t\\n"]',
+        'a["\\x41\\u0042\\101\\0"]',
+        'a["\\q"]',
+        'a["x"',
+        "a[0]]",
+        "A.B_1[12]",
+    ],
+)
+def test_parse_matches_grammar(val):
+    try:
+        expected = Parsing.pointer.parse_string(val, parse_all=True)[0]
+    except pp.ParseException:
+        with pytest.raises(InvalidPointerError):
+            parse_pointer(val)
+    else:
+        assert parse_pointer(val) == expected
+
+
+def test_parse_interned():
+    assert parse_pointer("a.b[0]") is parse_pointer("a.b[0]")
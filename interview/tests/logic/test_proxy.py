@@ -74,3 +74,34 @@ def test_nested_lookup_error():
         obj["b"][1]["b"][2]
     assert err.value.path == ()
     assert err.value.key == "b"
+
+
+def test_make_proxy_reuses_proxy():
+    obj = {"a": [{"b": "c"}]}
+    proxy = make_proxy(obj)
+    assert make_proxy(proxy) is proxy
+    assert proxy["a"] is proxy["a"]
+    assert proxy["a"][0] is proxy["a"][0]
+
+
+def test_proxy_cache_checks_identity():
+    obj = {"a": {"b": "c"}}
+    proxy = make_proxy(obj)
+    assert proxy["a"]["b"] == "c"
+    obj["a"] = {"b": "d"}
+    assert proxy["a"]["b"] == "d"
+
+
+def test_proxy_lookup_error_after_cache():
+    obj: Mapping = make_proxy({"a": [{"b": ["c"]}]})
+    assert obj["a"][0]["b"][0] == "c"
+    with pytest.raises(ProxyLookupError) as err:
+        obj["a"][0]["b"][1]
+    assert err.value.path == ("a", 0, "b")
+    assert err.value.key == 1
+
+
+def test_proxy_path():
+    obj: Mapping = make_proxy({"a": [{"b": ["c"]}]}, ("x",))
+    assert obj["a"][0]["b"]._path == ("x", "a", 0, "b")
+    assert (obj["a"] + [1])._path == ("x", "a")
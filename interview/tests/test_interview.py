@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import orjson
 import pytest
 from cattrs import Converter
 from cattrs.preconf.orjson import make_converter
@@ -58,6 +59,17 @@ def converter():
             [["fname"], ["lname"]],
             {"first_name": "fname", "last_name": "lname"},
         ),
+        (
+            "tests/test_data/configs/config1.yml",
+            "indirect",
+            [["A"], ["B"]],
+            {
+                "people": [{"name": "A"}, {"name": "B"}],
+                "n": 1,
+                "first": "A",
+                "second": "B",
+            },
+        ),
         (
             "tests/test_data/configs/config1.yml",
             "subinterviews1",
@@ -136,3 +148,49 @@ async def run_interview(
         if isinstance(content, ExitResult):
             return interview_context.state, content
     return interview_context.state, None
+
+
+def test_structure_context_reuses_index():
+    path = Path("tests/test_data/configs/config1.yml")
+    converter = make_converter()
+    configure_converter(converter)
+    interviews = load_config_file(path, converter).get_interviews(
+        path.parent, converter
+    )
+    configure_converter(converter, lambda: interviews)
+    interview = interviews["indirect"]
+    context = make_interview_context(
+        interview.questions,
+        interview.steps,
+        InterviewState(target="test"),
+        {},
+        interview_id="indirect",
+        interview_version=interview.version,
+    )
+    data = orjson.loads(converter.dumps(context))
+
+    structured = converter.structure(data, InterviewContext)
+    assert structured == context
+    assert structured.indirect_path_index is interview.indirect_path_index
+
+    structured = converter.structure(
+        {**data, "interview_version": "changed", "question_templates": {}},
+        InterviewContext,
+    )
+    assert structured.indirect_path_index is not interview.indirect_path_index
+    assert not structured.indirect_path_index
+
+
+def test_interview_version():
+    path = Path("tests/test_data/configs/config1.yml")
+    converter = make_converter()
+    configure_converter(converter)
+    interviews1 = load_config_file(path, converter).get_interviews(
+        path.parent, converter
+    )
+    interviews2 = load_config_file(path, converter).get_interviews(
+        path.parent, converter
+    )
+    assert interviews1["indirect"].version is not None
+    assert interviews1["indirect"].version == interviews2["indirect"].version
+    assert interviews1["indirect"].version != interviews1["simple-with-set"].version
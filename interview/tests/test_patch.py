@@ -0,0 +1,42 @@
+import copy
+
+import pytest
+from oes.interview.patch import apply_patch, make_patch
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({}, {}),
+        ({"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": 2}),
+        ({"a": 1}, {"a": True}),
+        ({"a": 1}, {"a": 1.0}),
+        ({"a": 1}, {"b": 1}),
+        ({"a": {"b": 1, "c": [1, 2]}}, {"a": {"b": 1, "c": [1, 3]}}),
+        ({"a": {"b": 1, "c": [1, 2]}}, {"a": {"b": 1, "c": [1, 2, 3]}}),
+        ({"a": {"b": 1}}, {"a": None}),
+        ({"a": None}, {"a": {"b": 1}}),
+        ([1, {"a": 1}], [1, {"a": 2, "b": 3}]),
+        ({"a": 1}, [1]),
+        (1, "1"),
+    ],
+)
+def test_patch(a, b):
+    orig = copy.deepcopy(a)
+    patch = make_patch(a, b)
+    res = apply_patch(a, patch)
+    assert res == b
+    assert type(res) is type(b)
+    assert a == orig
+
+
+def test_patch_only_changes():
+    a = {"a": {"b": [1, 2, 3], "c": "x" * 100}, "d": 1}
+    b = {"a": {"b": [1, 2, 3], "c": "x" * 100}, "d": 2, "e": 3}
+    assert make_patch(a, b) == [[["d"], 2], [["e"], 3]]
+
+
+def test_patch_delete():
+    assert make_patch({"a": {"b": 1, "c": 2}}, {"a": {"b": 1}}) == [[["a", "c"]]]
+    assert apply_patch({"a": {"b": 1, "c": 2}}, [[["a", "c"]]]) == {"a": {"b": 1}}
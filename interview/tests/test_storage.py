@@ -1,13 +1,18 @@
+import gzip
 import os
+from pathlib import Path
 
+import orjson
 import pytest
 import pytest_asyncio
 from cattrs.preconf.orjson import make_converter
+from oes.interview.config.config import load_config_file
 from oes.interview.input.field_types.text import TextFieldTemplate
 from oes.interview.input.question import QuestionTemplate
 from oes.interview.interview.interview import make_interview_context
-from oes.interview.interview.state import InterviewState
+from oes.interview.interview.state import InterviewState, ParentInterviewContext
 from oes.interview.interview.step_types.exit import ExitStep
+from oes.interview.interview.update import update_interview
 from oes.interview.logic.env import default_jinja2_env
 from oes.interview.logic.pointer import parse_pointer
 from oes.interview.serialization import configure_converter
@@ -49,3 +54,79 @@ async def test_storage(storage: StorageService):
     key = await storage.put(context)
     retrieved = await storage.get(key)
     assert retrieved == context
+
+
+@pytest.fixture
+def fake_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest_asyncio.fixture(params=[False, True], ids=["full", "delta"])
+async def fake_storage(request, fake_redis):
+    converter = make_converter()
+    configure_converter(converter)
+    storage = StorageService("", converter, fake_redis, delta=request.param)
+    async with storage:
+        yield storage
+
+
+@pytest.mark.asyncio
+async def test_storage_sub_interview(fake_storage: StorageService):
+    converter = make_converter()
+    configure_converter(converter)
+    path = Path("tests/test_data/configs/config1.yml")
+    interviews = load_config_file(path, converter).get_interviews(
+        path.parent, converter
+    )
+    interview = interviews["subinterviews2"]
+    context = make_interview_context(
+        interview.questions,
+        interview.steps,
+        InterviewState(target="test"),
+        interviews,
+    )
+
+    context, _ = await update_interview(context)
+    key = await fake_storage.put(context)
+    for response in ["fname1", "lname1", "fname2", "lname2"]:
+        context = await fake_storage.get(key)
+        assert context is not None
+        target = context.state.target
+        assert isinstance(target, ParentInterviewContext)
+        assert target.key is not None
+        assert "parent_data" not in context.state.context
+        context, _ = await update_interview(
+            context, {"field_0": response}, load_context=fake_storage.get
+        )
+        key = await fake_storage.put(context, base=key)
+
+    assert context.state.completed
+    assert context.state.data["results"][1]["full_name"] == "fname2 lname2"
+
+
+@pytest.mark.asyncio
+async def test_storage_delta(fake_redis):
+    converter = make_converter()
+    configure_converter(converter)
+    storage = StorageService("", converter, fake_redis, delta=True, max_chain_length=3)
+    context = make_interview_context({}, (), InterviewState(target="test"), {})
+    key = await storage.put(context)
+    keys = [key]
+    for i in range(8):
+        data = {"values": list(range(i + 1)), "big": "x" * 1000}
+        context = context.with_state(context.state.update(data=data))
+        key = await storage.put(context, base=key)
+        keys.append(key)
+
+    records = [_read_record(await fake_redis.get(f"oes.interview.{k}")) for k in keys]
+    assert [r.get("depth", 0) for r in records] == [0, 1, 2, 3, 0, 1, 2, 3, 0]
+
+    # read back without the local cache
+    uncached = StorageService("", converter, fake_redis, delta=True, cache_size=0)
+    retrieved = await uncached.get(keys[-1])
+    assert retrieved == context
+
+
+def _read_record(data: bytes):
+    return orjson.loads(gzip.decompress(data))
@@ -1,15 +1,17 @@
 """Main entry points."""
 
-import os
-import sys
+from pathlib import Path
 
 from cattrs import Converter
-from httpx import AsyncClient
-from oes.payment.config import get_config
+from oes.payment.config import CONFIG_FILE, Config, get_config
 from oes.payment.mq import MQService
 from oes.payment.service import PaymentRepo, PaymentServicesSvc, PaymentSvc
 from oes.utils import configure_converter
-from oes.utils.sanic import setup_app, setup_database
+from oes.utils.config import get_config_files
+from oes.utils.http import make_http_client
+from oes.utils.reload import ConfigReloader
+from oes.utils.sanic import run_server, setup_app, setup_config_reload, setup_database
+from oes.utils.template import log_compile_times, record_compile_times
 from sanic import Sanic
 from sanic.worker.manager import WorkerManager
 
@@ -18,37 +20,51 @@ WorkerManager.THRESHOLD = 1200  # type: ignore
 
 def main():
     """CLI wrapper."""
-    os.execlp(
-        "sanic",
-        "oes-payment-service",
-        "--single-process",
-        "oes.payment.main.create_app",
-        *sys.argv[1:]
-    )
+    run_server("oes-payment-service", "oes.payment.main.create_app")
 
 
 def create_app() -> Sanic:
     """Main app factory."""
     from oes.payment.routes import response_converter, routes
 
-    config = get_config()
+    with record_compile_times() as compile_times:
+        config = get_config()
+    log_compile_times(compile_times)
     app = Sanic("Payment", configure_logging=False)
     app.config.PROXIES_COUNT = 1
 
     configure_converter(response_converter.converter)
 
-    setup_app(app, config, response_converter.converter)
-    setup_database(app, config.db_url)
+    setup_app(
+        app,
+        config,
+        response_converter.converter,
+        metrics=config.metrics,
+        server_timing=config.server_timing,
+    )
+    setup_database(app, config.db_url, config.db)
 
     app.blueprint(routes)
 
-    app.ctx.config = config
-    app.ext.dependency(config)
     app.ext.add_dependency(Converter, lambda: response_converter.converter)
     app.ext.add_dependency(PaymentRepo)
     app.ext.add_dependency(PaymentServicesSvc)
     app.ext.add_dependency(PaymentSvc)
 
+    def apply_config(new_config: Config):
+        app.ctx.config = new_config
+
+    setup_config_reload(
+        app,
+        ConfigReloader(
+            "payment",
+            _load_config,
+            apply_config,
+            get_config_files((CONFIG_FILE,)),
+            watch_interval=config.config_watch_interval,
+        ),
+    )
+
     @app.before_server_start
     async def start_mq(app: Sanic):
         mq = MQService(config, response_converter.converter)
@@ -62,7 +78,9 @@ def create_app() -> Sanic:
 
     @app.before_server_start
     async def start_httpx(app: Sanic):
-        client = AsyncClient()
+        client = make_http_client(
+            config.http_client, (config.registration_service_url,)
+        )
         app.ctx.httpx_client = client
         app.ext.dependency(client)
 
@@ -71,3 +89,10 @@ def create_app() -> Sanic:
         await app.ctx.httpx_client.aclose()
 
     return app
+
+
+def _load_config() -> tuple[Config, list[Path]]:
+    with record_compile_times() as compile_times:
+        config = get_config()
+    log_compile_times(compile_times)
+    return config, get_config_files((CONFIG_FILE,))
@@ -28,7 +28,7 @@ from oes.payment.types import (
     UpdatablePaymentService,
     WebhookPaymentService,
 )
-from oes.utils.logic import evaluate
+from oes.utils.logic import evaluate_condition
 from oes.utils.orm import Repo
 from sqlalchemy import ColumnElement, func, or_, select
 
@@ -159,7 +159,7 @@ class PaymentServicesSvc:
             "pricing_result": self.converter.unstructure(pricing_result),
         }
         for method_id, method in self.config.methods.items():
-            if evaluate(method.when, ctx):
+            if evaluate_condition(method.when, ctx):
                 yield method_id, method
 
 
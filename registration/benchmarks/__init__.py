@@ -0,0 +1 @@
+"""Registration service benchmarks."""
@@ -0,0 +1,90 @@
+"""Request body structuring benchmark.
+
+Structures large :class:`BatchChangeRequestBody` payloads with
+``converter.structure``, with the cached structure function used by
+:class:`CattrsBody`, and with the cached trusted structure function.
+
+Run with ``python -m benchmarks.body``.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+from oes.registration.routes.batch import BatchChangeRequestBody
+from oes.registration.routes.common import response_converter
+from oes.registration.serialization import configure_converter
+from oes.utils.request import get_structure_fn
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--changes", type=int, default=500, help="changes per body")
+    parser.add_argument("--count", type=int, default=100, help="bodies per round")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds, best is shown")
+    args = parser.parse_args()
+
+    converter = response_converter.converter
+    configure_converter(converter)
+    body = orjson.dumps(make_body(args.changes))
+    print(f"{args.count} bodies, {args.changes} changes, {len(body) / 1024:.1f} KiB")
+
+    bench("structure", lambda: converter.structure, body, args.count, args.rounds)
+    bench(
+        "cached",
+        lambda: get_structure_fn(converter, BatchChangeRequestBody),
+        body,
+        args.count,
+        args.rounds,
+    )
+    bench(
+        "trusted",
+        lambda: get_structure_fn(converter, BatchChangeRequestBody, trusted=True),
+        body,
+        args.count,
+        args.rounds,
+    )
+
+
+def make_body(changes: int) -> dict[str, Any]:
+    """Make a batch change body with ``changes`` registrations."""
+    return {
+        "changes": [
+            {
+                "id": f"reg-{i}",
+                "event_id": "example-event",
+                "status": "created",
+                "version": 1,
+                "first_name": f"First {i}",
+                "last_name": f"Last {i}",
+                "email": f"user{i}@example.net",
+                "extra_data": {"option": i % 3, "tags": ["a", "b"]},
+            }
+            for i in range(changes)
+        ],
+        "access_codes": {f"reg-{i}": f"code-{i}" for i in range(0, changes, 10)},
+    }
+
+
+def bench(
+    name: str,
+    get_fn: Callable[[], Callable[[Any, Any], Any]],
+    body: bytes,
+    count: int,
+    rounds: int,
+):
+    """Load and structure the body, getting the function each time."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(count):
+            get_fn()(orjson.loads(body), BatchChangeRequestBody)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<10} {best / count * 1e3:8.2f} ms/body")
+
+
+if __name__ == "__main__":
+    main()
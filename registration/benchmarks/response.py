@@ -0,0 +1,95 @@
+"""Registration list response benchmark.
+
+Encodes registration list responses with ``converter.dumps`` and with the cached
+per-type dumpers of :class:`ResponseConverter`, and reports bytes per second.
+
+Run with ``python -m benchmarks.response``.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from cattrs.preconf.orjson import make_converter
+from oes.registration.registration import Registration, Status
+from oes.registration.routes.registration import (
+    RegistrationListResponse,
+    RegistrationResponse,
+)
+from oes.registration.serialization import configure_converter
+from oes.utils.response import ResponseConverter
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50, help="registrations per list")
+    parser.add_argument("--count", type=int, default=200, help="responses per round")
+    parser.add_argument("--rounds", type=int, default=20, help="rounds, best is shown")
+    args = parser.parse_args()
+
+    converter = make_converter()
+    configure_converter(converter)
+    response_converter = ResponseConverter(converter)
+
+    value = make_list_response(args.size)
+    print(f"{args.count} responses, {args.size} registrations each")
+    bench("dumps", converter.dumps, value, args.count, args.rounds)
+    bench(
+        "cached",
+        lambda v: response_converter.make_response(v).body,
+        value,
+        args.count,
+        args.rounds,
+    )
+
+
+def make_list_response(size: int) -> RegistrationListResponse:
+    """Make a list response with ``size`` registrations."""
+    date = datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
+    return RegistrationListResponse(
+        tuple(
+            RegistrationResponse(
+                Registration(
+                    id=f"reg-{i}",
+                    event_id="example-event",
+                    status=Status.created,
+                    date_created=date,
+                    number=i,
+                    first_name=f"First {i}",
+                    last_name=f"Last {i}",
+                    email=f"user{i}@example.net",
+                    extra_data={"option": i % 3, "tags": ["a", "b"]},
+                )
+            )
+            for i in range(size)
+        )
+    )
+
+
+def bench(
+    name: str,
+    dump: Callable[[Any], bytes],
+    value: Any,
+    count: int,
+    rounds: int,
+):
+    """Encode the value ``count`` times per round."""
+    size = len(dump(value))
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(count):
+            dump(value)
+        best = min(best, time.perf_counter() - start)
+    rate = size * count / best / 1024 / 1024
+    print(
+        f"{name:<8} {best / count * 1e6:8.1f} us/response  {rate:8.1f} MiB/s"
+        f"  ({size} bytes)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,15 @@
 """Main entry points."""
 
-import os
 import sys
 
-import httpx
 from oes.registration.access_code import AccessCodeRepo, AccessCodeService
 from oes.registration.batch import BatchChangeService
 from oes.registration.config import get_config
 from oes.registration.event import EventStatsRepo, EventStatsService
 from oes.registration.mq import MQService
 from oes.registration.registration import RegistrationService
-from oes.utils.sanic import setup_app, setup_database
+from oes.utils.http import make_http_client
+from oes.utils.sanic import run_server, setup_app, setup_database
 from sanic import Sanic
 from sanic.worker.manager import WorkerManager
 
@@ -19,13 +18,7 @@ WorkerManager.THRESHOLD = 1200  # type: ignore
 
 def main():
     """CLI wrapper."""
-    os.execlp(
-        "sanic",
-        sys.argv[0],
-        "--single-process",
-        "oes.registration.main:create_app",
-        *sys.argv[1:]
-    )
+    run_server(sys.argv[0], "oes.registration.main:create_app")
 
 
 def create_app() -> Sanic:
@@ -45,8 +38,15 @@ def create_app() -> Sanic:
 
     app = Sanic("Registration", configure_logging=False)
     app.config.PROXIES_COUNT = 1
-    setup_app(app, config, common.response_converter.converter)
-    setup_database(app, config.db_url)
+    setup_app(
+        app,
+        config,
+        common.response_converter.converter,
+        trusted_body=config.trusted_body,
+        metrics=config.metrics,
+        server_timing=config.server_timing,
+    )
+    setup_database(app, config.db_url, config.db)
     configure_converter(common.response_converter.converter)
 
     app.blueprint(healthcheck.routes)
@@ -68,7 +68,7 @@ def create_app() -> Sanic:
 
     @app.before_server_start
     async def setup_httpx(app: Sanic):
-        app.ctx.httpx = httpx.AsyncClient()
+        app.ctx.httpx = make_http_client(config.http_client)
         app.ext.dependency(app.ctx.httpx)
 
     @app.after_server_stop
@@ -12,6 +12,7 @@ import orjson
 from cattrs import Converter
 from loguru import logger
 from oes.registration.config import Config
+from oes.utils.metrics import time_mq_publish
 
 if TYPE_CHECKING:
     from oes.registration.registration import RegistrationChangeResult
@@ -61,7 +62,8 @@ class MQService:
             orjson.dumps(body), delivery_mode=aio_pika.DeliveryMode.PERSISTENT
         )
         await self._ready.wait()
-        await self.exchange.publish(msg, key)
+        with time_mq_publish(self.exchange.name):
+            await self.exchange.publish(msg, key)
 
     async def stop(self):
         """Stop the service."""
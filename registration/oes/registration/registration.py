@@ -539,6 +539,9 @@ def make_registration_unstructure_fn(
         Registration,
         converter,
         _cattrs_omit_if_default=True,
+        # these defaults are factories, which would be called for each comparison
+        id=override(omit_if_default=False),
+        date_created=override(omit_if_default=False),
         version=override(omit_if_default=False),
         status=override(omit_if_default=False),
     )
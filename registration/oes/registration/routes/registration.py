@@ -3,7 +3,7 @@
 from collections.abc import Sequence
 from datetime import datetime
 
-from attrs import frozen
+from attrs import field, frozen, validators
 from oes.registration.event import EventStatsService
 from oes.registration.mq import MQService
 from oes.registration.registration import (
@@ -24,6 +24,9 @@ from sanic.exceptions import HTTPException
 
 routes = Blueprint("registrations")
 
+BULK_READ_MAX_IDS = 100
+"""Maximum number of registration IDs in a bulk read request."""
+
 
 @frozen
 class RegistrationResponse:
@@ -39,6 +42,28 @@ class RegistrationListResponse:
     registrations: Sequence[RegistrationResponse]
 
 
+@frozen
+class RegistrationETagResponse:
+    """Registration response with an ETag."""
+
+    registration: Registration
+    etag: str
+
+
+@frozen
+class RegistrationBulkReadResponse:
+    """Registration bulk read response."""
+
+    registrations: Sequence[RegistrationETagResponse]
+
+
+@frozen
+class RegistrationBulkReadRequestBody:
+    """Request body to read registrations by ID."""
+
+    ids: Sequence[str] = field(validator=validators.max_len(BULK_READ_MAX_IDS))
+
+
 @frozen
 class RegistrationCreateRequestBody:
     """Request body to create a registration."""
@@ -145,6 +170,34 @@ async def read_registration(
     return response
 
 
+@routes.post("/bulk-read")
+async def bulk_read_registrations(
+    request: Request,
+    event_id: str,
+    repo: RegistrationRepo,
+    reg_service: RegistrationService,
+    body: CattrsBody,
+) -> HTTPResponse:
+    """Read registrations by ID.
+
+    At most :data:`BULK_READ_MAX_IDS` IDs may be requested. Registrations that are
+    not found are omitted.
+    """
+    req_body = await body(RegistrationBulkReadRequestBody)
+    ids = dict.fromkeys(req_body.ids)
+    res = await repo.get_multi(ids, event_id=event_id)
+    by_id = {r.id: r for r in res}
+    return response_converter.make_response(
+        RegistrationBulkReadResponse(
+            tuple(
+                RegistrationETagResponse(by_id[id], reg_service.get_etag(by_id[id]))
+                for id in ids
+                if id in by_id
+            )
+        )
+    )
+
+
 @routes.put("/<registration_id>")
 async def update_registration(
     request: Request,
@@ -17,20 +17,10 @@ def configure_converter(converter: Converter):
     """Configure a :class:`Converter`."""
     _configure_converter(converter)
 
-    converter.register_structure_hook(
-        Registration, make_registration_fields_structure_fn(Registration, converter)
-    )
-    converter.register_structure_hook(
-        RegistrationCreateFields,
-        make_registration_fields_structure_fn(RegistrationCreateFields, converter),
-    )
-    converter.register_structure_hook(
-        RegistrationUpdateFields,
-        make_registration_fields_structure_fn(RegistrationUpdateFields, converter),
-    )
-    converter.register_structure_hook(
-        RegistrationBatchChangeFields,
-        make_registration_fields_structure_fn(RegistrationBatchChangeFields, converter),
+    # factories, so copies of the converter make their own functions
+    converter.register_structure_hook_factory(
+        lambda cls: cls in _registration_fields_types,
+        make_registration_fields_structure_fn,
     )
     converter.register_unstructure_hook(
         Registration,
@@ -40,3 +30,11 @@ def configure_converter(converter: Converter):
         RegistrationBatchChangeFields,
         make_registration_batch_change_unstructure_fn(converter),
     )
+
+
+_registration_fields_types = (
+    Registration,
+    RegistrationCreateFields,
+    RegistrationUpdateFields,
+    RegistrationBatchChangeFields,
+)
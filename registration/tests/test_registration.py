@@ -2,6 +2,7 @@ from unittest.mock import create_autospec
 
 import pytest
 from cattrs import Converter
+from cattrs.errors import ClassValidationError
 from oes.registration.registration import (
     ConflictError,
     Registration,
@@ -13,6 +14,10 @@ from oes.registration.registration import (
     StatusError,
     generate_registration_id,
 )
+from oes.registration.routes.registration import (
+    BULK_READ_MAX_IDS,
+    RegistrationBulkReadRequestBody,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm.exc import StaleDataError
 
@@ -142,6 +147,16 @@ def test_create(converter: Converter):
     assert reg.extra_data == {"extra": 123}
 
 
+def test_bulk_read_max_ids(converter: Converter):
+    ids = [f"r{i}" for i in range(BULK_READ_MAX_IDS + 1)]
+    body = converter.structure(
+        {"ids": ids[:BULK_READ_MAX_IDS]}, RegistrationBulkReadRequestBody
+    )
+    assert len(body.ids) == BULK_READ_MAX_IDS
+    with pytest.raises(ClassValidationError):
+        converter.structure({"ids": ids}, RegistrationBulkReadRequestBody)
+
+
 def test_complete_cancel():
     reg = Registration(event_id="test")
     assert reg.complete() is True
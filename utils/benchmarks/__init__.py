@@ -0,0 +1 @@
+"""Utility benchmarks."""
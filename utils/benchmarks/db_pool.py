@@ -0,0 +1,99 @@
+"""Database pool benchmark.
+
+Runs concurrent simulated requests against a PostgreSQL database, each checking out a
+connection, running a few queries and holding the connection for a while, with
+each pool size and prepared statement cache size, and reports the throughput and
+the time spent waiting for a connection.
+
+Run with ``python -m benchmarks.db_pool --db-url postgresql+asyncpg://...``.
+"""
+
+import argparse
+import asyncio
+import time
+
+from oes.utils.db import DatabaseConfig, make_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+QUERY = text(
+    "SELECT n, md5(n::text) FROM generate_series(1, :count) AS n WHERE n % :mod = 0"
+)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", required=True, help="the database URL")
+    parser.add_argument(
+        "--pool-sizes",
+        type=lambda v: [int(n) for n in v.split(",")],
+        default=[2, 5, 10, 20],
+        help="comma separated pool sizes",
+    )
+    parser.add_argument("--concurrency", type=int, default=50, help="open requests")
+    parser.add_argument("--queries", type=int, default=4, help="queries per request")
+    parser.add_argument(
+        "--hold", type=float, default=2, help="ms holding the connection per query"
+    )
+    parser.add_argument("--duration", type=float, default=5, help="seconds per run")
+    args = parser.parse_args()
+
+    print(
+        f"{args.concurrency} concurrent requests, {args.queries} queries each, "
+        f"{args.hold:.0f} ms held per query"
+    )
+    print(f"{'pool':>4} {'cache':>5} {'req/s':>8} {'wait p50':>9} {'wait p99':>9}")
+    asyncio.run(bench_all(args))
+
+
+async def bench_all(args: argparse.Namespace):
+    """Run each pool size with and without the statement cache."""
+    for pool_size in args.pool_sizes:
+        for cache_size in (0, 100):
+            config = DatabaseConfig(
+                pool_size=pool_size, max_overflow=0, statement_cache_size=cache_size
+            )
+            engine = make_engine(args.db_url, config)
+            try:
+                rate, waits = await bench(engine, args)
+            finally:
+                await engine.dispose()
+            waits.sort()
+            p50 = waits[len(waits) // 2] * 1000
+            p99 = waits[int(len(waits) * 0.99)] * 1000
+            print(
+                f"{pool_size:>4} {cache_size:>5} {rate:>8.0f} "
+                f"{p50:>7.1f}ms {p99:>7.1f}ms"
+            )
+
+
+async def bench(
+    engine: AsyncEngine, args: argparse.Namespace
+) -> tuple[float, list[float]]:
+    """Run requests for the duration and return the rate and checkout waits."""
+    waits: list[float] = []
+    end = time.perf_counter() + args.duration
+    counts = await asyncio.gather(
+        *(_run_requests(engine, args, end, waits) for _ in range(args.concurrency))
+    )
+    return sum(counts) / args.duration, waits
+
+
+async def _run_requests(
+    engine: AsyncEngine, args: argparse.Namespace, end: float, waits: list[float]
+) -> int:
+    count = 0
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        async with engine.connect() as conn:
+            waits.append(time.perf_counter() - start)
+            for i in range(args.queries):
+                await conn.execute(QUERY, {"count": 100, "mod": i + 1})
+                await asyncio.sleep(args.hold / 1000)
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    main()
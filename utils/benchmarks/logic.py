@@ -0,0 +1,81 @@
+"""When condition evaluation benchmark.
+
+Compares :func:`evaluate` on structured condition trees against
+:func:`compile_condition` and :func:`evaluate_condition`.
+
+Run with ``python -m benchmarks.logic``.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import jinja2
+from cattrs.preconf.orjson import make_converter
+from oes.utils.logic import (
+    ValueOrEvaluable,
+    WhenCondition,
+    compile_condition,
+    evaluate,
+    evaluate_condition,
+    make_value_or_evaluable_structure_fn,
+    make_when_condition_structure_fn,
+)
+from oes.utils.template import Expression, make_expression_structure_fn
+
+CONDITIONS = {
+    "expression": "age >= 18",
+    "list": ["age >= 18", "country == 'US'", True],
+    "nested": [
+        {"or": ["age >= 18", {"and": ["guardian", "guardian_age >= 21"]}]},
+        {"or": [False, "country in ('US', 'CA')"]},
+        True,
+    ],
+    "constant": [True, {"or": [False, True]}],
+}
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=50000, help="evaluations")
+    args = parser.parse_args()
+
+    converter = make_converter()
+    converter.register_structure_hook(
+        Expression, make_expression_structure_fn(jinja2.Environment())
+    )
+    converter.register_structure_hook(
+        ValueOrEvaluable, make_value_or_evaluable_structure_fn(converter)
+    )
+    converter.register_structure_hook(
+        WhenCondition, make_when_condition_structure_fn(converter)
+    )
+
+    context = {"age": 20, "guardian": False, "guardian_age": 0, "country": "US"}
+    print(f"{args.count} evaluations per condition")
+    for name, v in CONDITIONS.items():
+        when = converter.structure(v, WhenCondition)  # type: ignore
+        compiled = compile_condition(when)
+        bench(f"{name}: evaluate", lambda c: evaluate(when, c), context, args.count)
+        bench(f"{name}: compiled", compiled, context, args.count)
+        bench(
+            f"{name}: evaluate_condition",
+            lambda c: evaluate_condition(when, c),
+            context,
+            args.count,
+        )
+
+
+def bench(name: str, fn: Callable[[Any], Any], context: Any, count: int):
+    """Time ``count`` calls of ``fn``."""
+    start = time.perf_counter()
+    for _ in range(count):
+        fn(context)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32} {elapsed * 1000:8.2f} ms ({elapsed / count * 1e6:6.2f} us/op)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Worker scaling benchmark.
+
+Serves a CPU-bound endpoint, which structures and serializes a list of objects, with
+each number of worker processes, and reports the requests per second under
+concurrent load.
+
+Run with ``python -m benchmarks.workers``.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+from collections.abc import Sequence
+
+import httpx
+from attrs import frozen
+from cattrs.preconf.orjson import make_converter
+from oes.utils.sanic import setup_app
+from sanic import HTTPResponse, Request, Sanic
+
+ITEMS = [
+    {
+        "id": f"reg-{i}",
+        "event_id": "event",
+        "status": "created",
+        "version": 1,
+        "first_name": "First",
+        "last_name": "Last",
+        "email": f"user{i}@example.com",
+    }
+    for i in range(200)
+]
+
+
+@frozen
+class Item:
+    """Benchmark item."""
+
+    id: str
+    event_id: str
+    status: str
+    version: int
+    first_name: str
+    last_name: str
+    email: str
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--workers",
+        type=lambda v: [int(n) for n in v.split(",")],
+        default=[1, 2, 4],
+        help="comma separated worker counts",
+    )
+    parser.add_argument("--duration", type=float, default=5, help="seconds per run")
+    parser.add_argument("--concurrency", type=int, default=32, help="open requests")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs")
+    for workers in args.workers:
+        rate = run(workers, args.duration, args.concurrency)
+        print(f"{workers:>2} workers {rate:10.0f} requests/s")
+
+
+def create_app() -> Sanic:
+    """Benchmark app factory."""
+    app = Sanic("WorkerBench", configure_logging=False)
+    converter = make_converter()
+    setup_app(app, converter=converter)
+
+    @app.get("/")
+    async def handler(request: Request) -> HTTPResponse:
+        items = converter.structure(ITEMS, Sequence[Item])
+        return HTTPResponse(converter.dumps(items), content_type="application/json")
+
+    return app
+
+
+def run(workers: int, duration: float, concurrency: int) -> float:
+    """Serve the app with ``workers`` workers and return the requests per second."""
+    port = _get_free_port()
+    code = (
+        "from oes.utils.sanic import run_server; "
+        "run_server('oes-worker-bench', 'benchmarks.workers:create_app', "
+        f"['--workers', '{workers}', '--port', '{port}', '--no-access-logs'])"
+    )
+    path = os.pathsep.join(filter(None, (os.getcwd(), os.getenv("PYTHONPATH"))))
+    proc = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": path},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        return asyncio.run(_load(f"http://127.0.0.1:{port}/", duration, concurrency))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+async def _load(url: str, duration: float, concurrency: int) -> float:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        await _wait_ready(client, url)
+        end = time.perf_counter() + duration
+        counts = await asyncio.gather(
+            *(_send_until(client, url, end) for _ in range(concurrency))
+        )
+    return sum(counts) / duration
+
+
+async def _wait_ready(client: httpx.AsyncClient, url: str):
+    for _ in range(300):
+        try:
+            await client.get(url)
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+        else:
+            return
+    raise RuntimeError("Server did not start")
+
+
+async def _send_until(client: httpx.AsyncClient, url: str, end: float) -> int:
+    count = 0
+    while time.perf_counter() < end:
+        res = await client.get(url)
+        res.raise_for_status()
+        count += 1
+    return count
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == "__main__":
+    main()
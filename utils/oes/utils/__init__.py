@@ -9,12 +9,18 @@ __all__ = [
     "configure_converter",
     "setup_logging",
     # modules
+    "asgi",
     "config",
+    "db",
+    "http",
     "logic",
     "mapping",
+    "metrics",
     "orm",
+    "reload",
     "request",
     "response",
     "sanic",
     "template",
+    "workers",
 ]
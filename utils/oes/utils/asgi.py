@@ -0,0 +1,62 @@
+"""ASGI utils."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+__all__ = [
+    "ASGIApp",
+    "ASGILifespan",
+]
+
+ASGIApp = Callable[
+    [
+        MutableMapping[str, Any],
+        Callable[[], Awaitable[MutableMapping[str, Any]]],
+        Callable[[MutableMapping[str, Any]], Awaitable[None]],
+    ],
+    Awaitable[None],
+]
+"""An ASGI application."""
+
+
+class ASGILifespan:
+    """Runs the lifespan of an ASGI app that is not served by an ASGI server.
+
+    Args:
+        app: The ASGI app.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._receive: asyncio.Queue[MutableMapping[str, Any]] = asyncio.Queue()
+        self._send: asyncio.Queue[MutableMapping[str, Any]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        """Start the app.
+
+        Raises:
+            RuntimeError: If the app fails to start.
+        """
+        self._task = asyncio.create_task(
+            self.app(
+                {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}},
+                self._receive.get,
+                self._send.put,
+            )
+        )
+        await self._send_event("lifespan.startup")
+
+    async def stop(self):
+        """Stop the app."""
+        if self._task is not None:
+            await self._send_event("lifespan.shutdown")
+            await self._task
+            self._task = None
+
+    async def _send_event(self, type: str):
+        await self._receive.put({"type": type})
+        message = await self._send.get()
+        if message["type"].endswith(".failed"):
+            raise RuntimeError(f"{type} failed: {message.get('message', '')}")
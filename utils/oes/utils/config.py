@@ -1,5 +1,6 @@
 """Config file loading."""
 
+import os
 from collections.abc import Iterable
 from pathlib import Path
 
@@ -8,6 +9,7 @@ from ruamel.yaml import YAML
 from typed_settings.loaders import Loader
 
 __all__ = [
+    "get_config_files",
     "get_loaders",
 ]
 
@@ -34,3 +36,21 @@ def get_loaders(
             env_var="CONFIG_FILE",
         ),
     ]
+
+
+def get_config_files(
+    config_files: Iterable[str | Path] = ("config.yml",)
+) -> list[Path]:
+    """Get the paths of the config files that :func:`get_loaders` reads.
+
+    Includes the files listed in the ``CONFIG_FILE`` environment variable. Files that
+    do not exist are included, so that creating them can be noticed.
+    """
+    names = [str(f) for f in config_files]
+    names.extend(os.getenv("CONFIG_FILE", "").split(":"))
+    paths = []
+    for name in names:
+        _, _, name = name.rpartition("!")
+        if name:
+            paths.append(Path(name).absolute())
+    return paths
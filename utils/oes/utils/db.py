@@ -0,0 +1,127 @@
+"""Database engine module.
+
+Creates SQLAlchemy engines with configurable connection pools, divided among the
+worker processes, and records pool checkout wait times and usage.
+"""
+
+import time
+import uuid
+from typing import Any
+
+from attrs import frozen
+from oes.utils.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_LIMIT,
+    DB_POOL_TIMEOUTS,
+)
+from oes.utils.workers import per_worker
+from sqlalchemy import URL, event, exc, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+__all__ = [
+    "DatabaseConfig",
+    "make_engine",
+]
+
+
+@frozen
+class DatabaseConfig:
+    """Database connection pool settings.
+
+    Pool limits are totals for all worker processes.
+    """
+
+    pool_size: int = 5
+    """Connections kept open."""
+
+    max_overflow: int = 10
+    """Extra connections opened when all pooled ones are in use, or -1 for no limit."""
+
+    pool_timeout: float = 30.0
+    """Time to wait for a connection, in seconds."""
+
+    pool_pre_ping: bool = False
+    """Whether to check that a connection is alive before using it."""
+
+    pool_recycle: int = -1
+    """Time after which connections are replaced, in seconds, or -1 to disable."""
+
+    statement_cache_size: int = 100
+    """Prepared statements cached on each asyncpg connection."""
+
+    pgbouncer: bool = False
+    """Whether to disable prepared statement caches for PgBouncer transaction mode."""
+
+
+def make_engine(db_url: str | URL, config: DatabaseConfig | None = None) -> AsyncEngine:
+    """Make an instrumented database engine.
+
+    Args:
+        db_url: The database URL.
+        config: The connection pool settings.
+    """
+    config = config if config is not None else DatabaseConfig()
+    url = make_url(db_url)
+    name = url.database or ""
+    pool_size = per_worker(config.pool_size)
+    max_overflow = per_worker(config.max_overflow)
+    pool_class = _make_pool_class(name)
+    engine = create_async_engine(
+        url,
+        poolclass=pool_class,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_pre_ping=config.pool_pre_ping,
+        pool_recycle=config.pool_recycle,
+        connect_args=_get_connect_args(url, config),
+    )
+    event.listen(engine.sync_engine, "checkout", _make_listener(name, 1))
+    event.listen(engine.sync_engine, "checkin", _make_listener(name, -1))
+    if max_overflow >= 0:
+        DB_POOL_LIMIT.labels(name).set(pool_size + max_overflow)
+    return engine
+
+
+def _get_connect_args(url: URL, config: DatabaseConfig) -> dict[str, Any]:
+    if url.get_driver_name() != "asyncpg":
+        return {}
+    if config.pgbouncer:
+        # PgBouncer may run each statement on a different server connection
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _make_statement_name,
+        }
+    return {
+        "statement_cache_size": config.statement_cache_size,
+        "prepared_statement_cache_size": config.statement_cache_size,
+    }
+
+
+def _make_pool_class(name: str) -> type[AsyncAdaptedQueuePool]:
+    class InstrumentedPool(AsyncAdaptedQueuePool):
+        def _do_get(self) -> Any:
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            except exc.TimeoutError:
+                DB_POOL_TIMEOUTS.labels(name).inc()
+                raise
+            finally:
+                DB_POOL_CHECKOUT_WAIT.labels(name).observe(time.perf_counter() - start)
+
+    return InstrumentedPool
+
+
+def _make_listener(name: str, amount: int) -> Any:
+    def listener(*args: Any):
+        DB_POOL_CONNECTIONS.labels(name).inc(amount)
+
+    return listener
+
+
+def _make_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
@@ -0,0 +1,253 @@
+"""HTTP client module.
+
+Creates :class:`httpx.AsyncClient` instances tuned for calls between services,
+with a separate connection pool for each upstream service, timeouts, and retries
+of idempotent requests. Upstreams running in the same process can be mounted with
+:func:`mount_local_app` to skip the network.
+"""
+
+import asyncio
+import random
+from collections.abc import AsyncIterator, Iterable
+from urllib.parse import urlsplit
+
+import httpx
+from attrs import frozen
+from oes.utils.asgi import ASGIApp
+from oes.utils.metrics import (
+    HTTP_CLIENT_POOL_LIMIT,
+    HTTP_CLIENT_POOL_REQUESTS,
+    HTTP_CLIENT_POOL_TIMEOUTS,
+    HTTP_CLIENT_RETRIES,
+    instrument_httpx_client,
+)
+from oes.utils.workers import per_worker
+
+__all__ = [
+    "SAFE_METHODS",
+    "IDEMPOTENT_METHODS",
+    "RETRY_STATUS_CODES",
+    "HTTPClientConfig",
+    "make_http_client",
+    "mount_local_app",
+    "unmount_local_apps",
+]
+
+SAFE_METHODS = frozenset(("GET", "HEAD"))
+"""Methods that may be retried after the request was sent."""
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"))
+"""Methods that may be retried when a connection could not be established."""
+
+RETRY_STATUS_CODES = frozenset((502, 503, 504))
+"""Response status codes that are retried for :data:`SAFE_METHODS`."""
+
+_local_apps: dict[str, ASGIApp] = {}
+
+# the request was not sent
+_connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+
+_retry_errors = (
+    *_connect_errors,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+@frozen
+class HTTPClientConfig:
+    """HTTP client settings.
+
+    Each upstream gets its own pool with these limits.
+    """
+
+    connect_timeout: float = 5.0
+    """Timeout to establish a connection, in seconds."""
+
+    read_timeout: float = 30.0
+    """Timeout to read each chunk of a response, in seconds."""
+
+    write_timeout: float = 30.0
+    """Timeout to send each chunk of a request, in seconds."""
+
+    pool_timeout: float = 5.0
+    """Timeout to wait for a pooled connection, in seconds."""
+
+    max_connections: int = 100
+    """Maximum connections per upstream, shared by all worker processes."""
+
+    max_keepalive_connections: int = 20
+    """Maximum idle connections kept open per upstream, shared by all workers."""
+
+    keepalive_expiry: float = 60.0
+    """Time to keep idle connections open, in seconds."""
+
+    http2: bool = False
+    """Whether to use HTTP/2. Requires the ``h2`` package."""
+
+    retries: int = 2
+    """Maximum retries of idempotent requests.
+
+    Only ``GET`` and ``HEAD`` requests without an ``If-Match`` header are retried
+    after they were sent, others only when a connection could not be established.
+    """
+
+    retry_backoff: float = 0.05
+    """Base retry delay, in seconds, doubled after each attempt."""
+
+
+def make_http_client(
+    config: HTTPClientConfig | None = None,
+    upstreams: Iterable[str] = (),
+) -> httpx.AsyncClient:
+    """Make an instrumented HTTP client.
+
+    Args:
+        config: The client settings.
+        upstreams: Base URLs of upstream services. Each gets its own connection
+            pool. Other URLs share a default pool.
+    """
+    config = config if config is not None else HTTPClientConfig()
+    mounts: dict[str, httpx.AsyncBaseTransport] = {}
+    for url in upstreams:
+        pattern = _get_pattern(url)
+        if pattern:
+            mounts[pattern] = _UpstreamTransport(config, urlsplit(url).netloc)
+    for pattern, app in _local_apps.items():
+        mounts[pattern] = _LocalTransport(app)
+
+    timeout = httpx.Timeout(
+        connect=config.connect_timeout,
+        read=config.read_timeout,
+        write=config.write_timeout,
+        pool=config.pool_timeout,
+    )
+    client = httpx.AsyncClient(
+        timeout=timeout,
+        transport=_UpstreamTransport(config, "default"),
+        mounts=mounts,
+    )
+    return instrument_httpx_client(client)
+
+
+def mount_local_app(url: str, app: ASGIApp):
+    """Send requests for ``url`` to an ASGI app in this process.
+
+    Applies to clients made afterwards by :func:`make_http_client`. Requests skip
+    the network and connection pools, and the app runs in a copy of the caller's
+    context. Use :class:`oes.utils.asgi.ASGILifespan` to start the app.
+    """
+    pattern = _get_pattern(url)
+    if not pattern:
+        raise ValueError(f"Not an absolute URL: {url}")
+    _local_apps[pattern] = app
+
+
+def unmount_local_apps():
+    """Remove the apps mounted with :func:`mount_local_app`."""
+    _local_apps.clear()
+
+
+class _UpstreamTransport(httpx.AsyncBaseTransport):
+    def __init__(self, config: HTTPClientConfig, pool_name: str):
+        max_connections = per_worker(config.max_connections)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=per_worker(config.max_keepalive_connections),
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        self._transport = httpx.AsyncHTTPTransport(limits=limits, http2=config.http2)
+        self._retries = config.retries
+        self._retry_backoff = config.retry_backoff
+        self._pool_name = pool_name
+        HTTP_CLIENT_POOL_LIMIT.labels(pool_name).set(max_connections)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        retries = self._retries if _is_retryable(request) else 0
+        errors, statuses = _get_retry_conditions(request)
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(request)
+            except errors:
+                if attempt >= retries:
+                    raise
+            else:
+                if attempt >= retries or response.status_code not in statuses:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(random.uniform(0, self._retry_backoff * 2**attempt))
+            attempt += 1
+            HTTP_CLIENT_RETRIES.labels(self._pool_name).inc()
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        # the connection is in use until the response body is closed
+        HTTP_CLIENT_POOL_REQUESTS.labels(self._pool_name).inc()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            HTTP_CLIENT_POOL_REQUESTS.labels(self._pool_name).dec()
+            if isinstance(e, httpx.PoolTimeout):
+                HTTP_CLIENT_POOL_TIMEOUTS.labels(self._pool_name).inc()
+            raise
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=_PooledStream(response.stream, self._pool_name),
+            extensions=response.extensions,
+        )
+
+
+class _PooledStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, pool_name: str):
+        self._stream = stream
+        self._pool_name = pool_name
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            HTTP_CLIENT_POOL_REQUESTS.labels(self._pool_name).dec()
+        await self._stream.aclose()
+
+
+class _LocalTransport(httpx.AsyncBaseTransport):
+    def __init__(self, app: ASGIApp):
+        self._transport = httpx.ASGITransport(app, raise_app_exceptions=False)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # the app sets per-request context variables, which must not leak
+        return await asyncio.create_task(self._transport.handle_async_request(request))
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+def _get_pattern(url: str) -> str | None:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme and parts.netloc else None
+
+
+def _is_retryable(request: httpx.Request) -> bool:
+    # streamed bodies cannot be sent again
+    return request.method in IDEMPOTENT_METHODS and isinstance(
+        request.stream, httpx.ByteStream
+    )
+
+
+def _get_retry_conditions(
+    request: httpx.Request,
+) -> tuple[tuple[type[httpx.TransportError], ...], frozenset[int]]:
+    # other requests, such as conditional ones, may have been applied before the error
+    if request.method in SAFE_METHODS and "If-Match" not in request.headers:
+        return _retry_errors, RETRY_STATUS_CODES
+    else:
+        return _connect_errors, frozenset()
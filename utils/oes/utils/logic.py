@@ -1,5 +1,6 @@
 """Template logic module."""
 
+import functools
 from abc import abstractmethod
 from collections.abc import Mapping, Sequence
 from typing import Any, Callable, Protocol, TypeAlias, runtime_checkable
@@ -15,6 +16,9 @@ __all__ = [
     "LogicAnd",
     "LogicOr",
     "evaluate",
+    "Condition",
+    "compile_condition",
+    "evaluate_condition",
     "make_value_or_evaluable_structure_fn",
     "make_when_condition_structure_fn",
     "make_logic_unstructure_fn",
@@ -34,6 +38,9 @@ class Evaluable(Protocol):
 ValueOrEvaluable: TypeAlias = Evaluable | object
 WhenCondition: TypeAlias = ValueOrEvaluable | Sequence[ValueOrEvaluable]
 
+Condition: TypeAlias = Callable[[TemplateContext], Any]
+"""A compiled :class:`WhenCondition`."""
+
 
 @frozen
 class LogicAnd:
@@ -56,6 +63,21 @@ class LogicOr:
         return any(evaluate(item, context) for item in self.or_)
 
 
+def evaluate_condition(when: WhenCondition, context: TemplateContext) -> Any:
+    """Evaluate a condition, compiling it on first use.
+
+    Returns the same result as :func:`evaluate`. Compiled conditions are cached by
+    value and by the environment of each expression, so equal conditions structured
+    separately share the compiled callable.
+    """
+    try:
+        key = _ConditionKey(when)
+    except TypeError:
+        # unhashable conditions are not cached
+        return evaluate(when, context)
+    return _compile_cached(key)(context)
+
+
 def evaluate(evaluable: Any, context: TemplateContext) -> Any:
     """Evaluate an evaluable."""
     if isinstance(evaluable, Evaluable):
@@ -64,6 +86,126 @@ def evaluate(evaluable: Any, context: TemplateContext) -> Any:
         return evaluable
 
 
+class _ConditionKey:
+    # equal expressions from different environments must not share a callable, the
+    # key holds a reference to the condition, so the environment ids are not reused
+    __slots__ = ("value", "key", "hash")
+
+    def __init__(self, value: object):
+        self.value = value
+        self.key = _make_key(value)
+        self.hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ConditionKey) and other.key == self.key
+
+
+def _make_key(obj: object) -> Any:
+    if isinstance(obj, LogicAnd):
+        return LogicAnd, tuple(_make_key(item) for item in obj.and_)
+    elif isinstance(obj, LogicOr):
+        return LogicOr, tuple(_make_key(item) for item in obj.or_)
+    elif isinstance(obj, Expression):
+        return Expression, obj.source, id(obj.environment)
+    else:
+        # the type keeps constants like 1 and True apart
+        return type(obj), obj
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_cached(key: _ConditionKey) -> Condition:
+    return compile_condition(key.value)
+
+
+def compile_condition(when: WhenCondition) -> Condition:
+    """Compile a condition into a single callable.
+
+    The callable returns the same result as :func:`evaluate`. Constant items are
+    folded and ``and``/``or`` items short-circuit in order.
+    """
+    fn, _, _ = _compile(when)
+    return fn
+
+
+def _compile(obj: object) -> tuple[Condition, bool, Any]:
+    # returns the function, whether it is constant, and the constant value
+    if isinstance(obj, LogicAnd):
+        return _compile_and(obj.and_)
+    elif isinstance(obj, LogicOr):
+        return _compile_or(obj.or_)
+    elif isinstance(obj, Evaluable):
+        return obj.evaluate, False, None
+    else:
+        return (lambda context: obj), True, obj
+
+
+def _compile_and(items: Sequence[ValueOrEvaluable]) -> tuple[Condition, bool, Any]:
+    fns = []
+    result = True
+    for item in items:
+        fn, const, value = _compile(item)  # noqa: NEW100
+        if not const:
+            fns.append(fn)
+        elif not value:
+            # later items are never evaluated
+            result = False
+            break
+
+    if not fns:
+        return (lambda context: result), True, result
+    elif not result:
+        return _make_all(fns, False), False, None
+    else:
+        return _make_all(fns, True), False, None
+
+
+def _compile_or(items: Sequence[ValueOrEvaluable]) -> tuple[Condition, bool, Any]:
+    fns = []
+    result = False
+    for item in items:
+        fn, const, value = _compile(item)  # noqa: NEW100
+        if not const:
+            fns.append(fn)
+        elif value:
+            # later items are never evaluated
+            result = True
+            break
+
+    if not fns:
+        return (lambda context: result), True, result
+    elif result:
+        return _make_any(fns, True), False, None
+    else:
+        return _make_any(fns, False), False, None
+
+
+def _make_all(fns: Sequence[Condition], result: bool) -> Condition:
+    if len(fns) == 1:
+        (a,) = fns
+        return lambda context: bool(a(context)) and result
+    elif len(fns) == 2:
+        a, b = fns
+        return lambda context: bool(a(context) and b(context)) and result
+
+    fns = tuple(fns)
+    return lambda context: all(fn(context) for fn in fns) and result
+
+
+def _make_any(fns: Sequence[Condition], result: bool) -> Condition:
+    if len(fns) == 1:
+        (a,) = fns
+        return lambda context: bool(a(context)) or result
+    elif len(fns) == 2:
+        a, b = fns
+        return lambda context: bool(a(context) or b(context)) or result
+
+    fns = tuple(fns)
+    return lambda context: any(fn(context) for fn in fns) or result
+
+
 def make_value_or_evaluable_structure_fn(
     converter: Converter,
 ) -> Callable[[Any, Any], ValueOrEvaluable]:
@@ -0,0 +1,507 @@
+"""Metrics module.
+
+Counters, gauges and histograms rendered in the Prometheus text exposition
+format, and helpers to record request, database, Redis, HTTP client and message
+queue timings.
+
+Each request also gets a request ID, which instrumented HTTP clients forward to
+other services, and per-request timings, which are sent back in a
+``Server-Timing`` header and collected from upstream responses.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    import httpx
+    from redis.asyncio import Redis
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "registry",
+    "REQUEST_ID_HEADER",
+    "SERVER_TIMING_HEADER",
+    "RequestStats",
+    "make_request_id",
+    "get_request_stats",
+    "observe_db_query",
+    "start_request_stats",
+    "time_mq_publish",
+    "instrument_httpx_client",
+    "instrument_redis",
+]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Default histogram buckets, in seconds."""
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""The content type of the text exposition format."""
+
+REQUEST_ID_HEADER = "X-Request-ID"
+"""The request ID header."""
+
+SERVER_TIMING_HEADER = "Server-Timing"
+"""The server timing header."""
+
+_C = TypeVar("_C")
+
+_request_id_re = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+_server_timing_dur_re = re.compile(r"(?:^|;)\s*dur=([0-9]+(?:\.[0-9]+)?)")
+
+
+class Registry:
+    """A collection of metrics."""
+
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric):
+        """Add a metric."""
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        """Render all metrics in the text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+"""The default registry."""
+
+
+class _Metric(ABC, Generic[_C]):
+    type_name = ""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        *,
+        registry: Registry | None = registry,
+    ):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], _C] = {}
+        if registry is not None:
+            registry.register(self)
+
+    def labels(self, *values: object) -> _C:
+        """Get the child metric for the label values."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(f"Expected labels {self.label_names}")
+            child = self._children[key] = self._make_child()
+        return child
+
+    def render(self) -> Iterator[str]:
+        """Render the metric in the text exposition format."""
+        yield f"# HELP {self.name} {_escape_help(self.help)}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        for key, child in sorted(self._children.items()):
+            labels = dict(zip(self.label_names, key))
+            yield from self._render_child(labels, child)
+
+    @abstractmethod
+    def _make_child(self) -> _C: ...
+
+    @abstractmethod
+    def _render_child(self, labels: dict[str, str], child: _C) -> Iterator[str]: ...
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        """Increase the value."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        """Decrease the value."""
+        self.value -= amount
+
+    def set(self, value: float):
+        """Set the value."""
+        self.value = value
+
+
+class Counter(_Metric[_Value]):
+    """A counter."""
+
+    type_name = "counter"
+
+    def inc(self, amount: float = 1.0):
+        """Increase the counter without labels."""
+        self.labels().inc(amount)
+
+    def _make_child(self) -> _Value:
+        return _Value()
+
+    def _render_child(self, labels: dict[str, str], child: _Value) -> Iterator[str]:
+        yield f"{self.name}{_format_labels(labels)} {_format_value(child.value)}"
+
+
+class Gauge(_Metric[_Value]):
+    """A gauge."""
+
+    type_name = "gauge"
+
+    def inc(self, amount: float = 1.0):
+        """Increase the gauge without labels."""
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        """Decrease the gauge without labels."""
+        self.labels().dec(amount)
+
+    def _make_child(self) -> _Value:
+        return _Value()
+
+    def _render_child(self, labels: dict[str, str], child: _Value) -> Iterator[str]:
+        yield f"{self.name}{_format_labels(labels)} {_format_value(child.value)}"
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Record a value."""
+        i = bisect.bisect_left(self.buckets, value)
+        if i < len(self.counts):
+            self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the time spent in the context, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric[_HistogramValue]):
+    """A histogram."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Registry | None = registry,
+    ):
+        super().__init__(name, help, label_names, registry=registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float):
+        """Record a value without labels."""
+        self.labels().observe(value)
+
+    def _make_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def _render_child(
+        self, labels: dict[str, str], child: _HistogramValue
+    ) -> Iterator[str]:
+        total = 0
+        for bound, count in zip(child.buckets, child.counts):
+            total += count
+            le = _format_labels({**labels, "le": _format_value(bound)})
+            yield f"{self.name}_bucket{le} {total}"
+        le = _format_labels({**labels, "le": "+Inf"})
+        yield f"{self.name}_bucket{le} {child.count}"
+        yield f"{self.name}_sum{_format_labels(labels)} {_format_value(child.sum)}"
+        yield f"{self.name}_count{_format_labels(labels)} {child.count}"
+
+
+REQUEST_DURATION = Histogram(
+    "oes_http_request_duration_seconds",
+    "HTTP request latency",
+    ("method", "route", "status"),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "oes_http_requests_in_flight", "HTTP requests currently being handled"
+)
+DB_QUERY_DURATION = Histogram("oes_db_query_duration_seconds", "Database query latency")
+DB_QUERIES_PER_REQUEST = Histogram(
+    "oes_db_queries_per_request",
+    "Database queries per HTTP request",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "oes_db_time_per_request_seconds", "Database time per HTTP request"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "oes_db_pool_checkout_wait_seconds",
+    "Time waiting for a pooled database connection",
+    ("database",),
+    buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "oes_db_pool_connections_in_use",
+    "Database connections checked out of the pool",
+    ("database",),
+)
+DB_POOL_LIMIT = Gauge(
+    "oes_db_pool_limit",
+    "Maximum database connections, including overflow",
+    ("database",),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "oes_db_pool_timeouts_total",
+    "Timeouts waiting for a pooled database connection",
+    ("database",),
+)
+REDIS_COMMAND_DURATION = Histogram(
+    "oes_redis_command_duration_seconds", "Redis command latency", ("command",)
+)
+HTTP_CLIENT_DURATION = Histogram(
+    "oes_http_client_request_duration_seconds",
+    "Outgoing HTTP request latency, until the response headers",
+    ("method", "host", "status"),
+)
+HTTP_CLIENT_POOL_REQUESTS = Gauge(
+    "oes_http_client_pool_requests",
+    "Outgoing HTTP requests using or waiting for a pooled connection",
+    ("pool",),
+)
+HTTP_CLIENT_POOL_LIMIT = Gauge(
+    "oes_http_client_pool_max_connections",
+    "Connection limit of each HTTP client pool",
+    ("pool",),
+)
+HTTP_CLIENT_POOL_TIMEOUTS = Counter(
+    "oes_http_client_pool_timeouts_total",
+    "Outgoing HTTP requests that timed out waiting for a pooled connection",
+    ("pool",),
+)
+HTTP_CLIENT_RETRIES = Counter(
+    "oes_http_client_retries_total", "Retried outgoing HTTP requests", ("pool",)
+)
+MQ_PUBLISH_DURATION = Histogram(
+    "oes_mq_publish_duration_seconds", "Message queue publish latency", ("exchange",)
+)
+CONFIG_RELOAD_DURATION = Histogram(
+    "oes_config_reload_duration_seconds",
+    "Time to load a new config, off the event loop",
+    ("config",),
+)
+CONFIG_SWAP_DURATION = Histogram(
+    "oes_config_swap_duration_seconds",
+    "Time the event loop spent swapping in a new config",
+    ("config",),
+    buckets=(0.00001, 0.0001, 0.001, 0.01, 0.1),
+)
+CONFIG_RELOADS = Counter(
+    "oes_config_reloads_total", "Config reloads", ("config", "result")
+)
+
+
+class RequestStats:
+    """The request ID and time spent in each phase of the current request."""
+
+    __slots__ = (
+        "request_id",
+        "db_queries",
+        "db_time",
+        "redis_time",
+        "upstream_time",
+        "upstream_timings",
+    )
+
+    def __init__(self, request_id: str = ""):
+        self.request_id = request_id
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.redis_time = 0.0
+        self.upstream_time = 0.0
+        self.upstream_timings: list[tuple[str, float]] = []
+        """Timings from upstream ``Server-Timing`` headers, in milliseconds."""
+
+    def get_server_timing(self, total: float) -> str:
+        """Get the ``Server-Timing`` header value.
+
+        Args:
+            total: The total request time, in seconds.
+        """
+        entries = [f"total;dur={total * 1000:.1f}"]
+        if self.db_queries:
+            entries.append(
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.db_queries} queries"'
+            )
+        if self.redis_time:
+            entries.append(f"redis;dur={self.redis_time * 1000:.1f}")
+        if self.upstream_time:
+            entries.append(f"upstream;dur={self.upstream_time * 1000:.1f}")
+        entries.extend(f"{name};dur={dur:.1f}" for name, dur in self.upstream_timings)
+        return ", ".join(entries)
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "_request_stats", default=None
+)
+
+
+def make_request_id(request_id: str | None = None) -> str:
+    """Return ``request_id`` if it is a valid request ID, or a new request ID."""
+    if request_id and _request_id_re.match(request_id):
+        return request_id
+    return uuid.uuid4().hex
+
+
+def start_request_stats(request_id: str = "") -> RequestStats:
+    """Start collecting :class:`RequestStats` for the current context."""
+    stats = RequestStats(request_id)
+    _request_stats.set(stats)
+    return stats
+
+
+def get_request_stats() -> RequestStats | None:
+    """Get the :class:`RequestStats` for the current context, if any."""
+    return _request_stats.get()
+
+
+def observe_db_query(duration: float):
+    """Record a database query."""
+    DB_QUERY_DURATION.observe(duration)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_time += duration
+
+
+@contextmanager
+def time_mq_publish(exchange: str) -> Iterator[None]:
+    """Record the time to publish a message."""
+    with MQ_PUBLISH_DURATION.labels(exchange).time():
+        yield
+
+
+def instrument_httpx_client(client: httpx.AsyncClient) -> httpx.AsyncClient:
+    """Add event hooks to instrument requests made by ``client``.
+
+    The hooks record the latency of each request, send the current request ID and
+    collect the timings from the response ``Server-Timing`` header, prefixed by
+    the host name.
+    """
+    client.event_hooks["request"].append(_httpx_request_hook)
+    client.event_hooks["response"].append(_httpx_response_hook)
+    return client
+
+
+def instrument_redis(client: Redis) -> Redis:
+    """Record the latency of commands sent by ``client``.
+
+    Pipelines are not timed.
+    """
+    execute_command = client.execute_command
+
+    async def timed_execute_command(*args: Any, **options: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await execute_command(*args, **options)
+        finally:
+            duration = time.perf_counter() - start
+            REDIS_COMMAND_DURATION.labels(_get_command_name(args)).observe(duration)
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.redis_time += duration
+
+    client.execute_command = timed_execute_command  # type: ignore
+    return client
+
+
+async def _httpx_request_hook(request: httpx.Request):
+    stats = _request_stats.get()
+    if stats is not None and stats.request_id:
+        request.headers.setdefault(REQUEST_ID_HEADER, stats.request_id)
+    request.extensions["oes_start"] = time.perf_counter()
+
+
+async def _httpx_response_hook(response: httpx.Response):
+    start = response.request.extensions.get("oes_start")
+    if start is None:
+        return
+    duration = time.perf_counter() - start
+    request = response.request
+    HTTP_CLIENT_DURATION.labels(
+        request.method, request.url.host, response.status_code
+    ).observe(duration)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.upstream_time += duration
+        server_timing = response.headers.get(SERVER_TIMING_HEADER)
+        if server_timing:
+            prefix = request.url.host
+            stats.upstream_timings.extend(
+                (f"{prefix}.{name}", dur)
+                for name, dur in _parse_server_timing(server_timing)
+            )
+
+
+def _parse_server_timing(value: str) -> Iterator[tuple[str, float]]:
+    for entry in value.split(","):
+        name, _, params = entry.strip().partition(";")
+        match = _server_timing_dur_re.search(params)
+        if name and match:
+            yield name.strip(), float(match.group(1))
+
+
+def _get_command_name(args: Sequence[Any]) -> str:
+    if not args:
+        return ""
+    name = args[0]
+    return name.decode() if isinstance(name, bytes) else str(name)
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    items = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+    return "{" + items + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape_help(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
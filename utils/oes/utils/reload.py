@@ -0,0 +1,165 @@
+"""Config reloading.
+
+A :class:`ConfigReloader` loads a new config in a worker thread, so the event loop
+keeps serving requests while YAML is parsed and templates are compiled, and then
+swaps it in with a single call on the event loop. Reloads are triggered by
+``SIGHUP`` or by changes to the watched files. One ``SIGHUP`` handler reloads all
+started reloaders, such as those of the services in the combined mode.
+"""
+
+import asyncio
+import contextlib
+import os
+import signal
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from loguru import logger
+from oes.utils.metrics import (
+    CONFIG_RELOAD_DURATION,
+    CONFIG_RELOADS,
+    CONFIG_SWAP_DURATION,
+)
+
+__all__ = [
+    "DEFAULT_WATCH_INTERVAL",
+    "ConfigReloader",
+]
+
+DEFAULT_WATCH_INTERVAL = 2.0
+"""Default interval between checks of the watched files, in seconds."""
+
+_T = TypeVar("_T")
+
+_started: list["ConfigReloader"] = []
+
+
+class ConfigReloader(Generic[_T]):
+    """Reloads a config and swaps it in.
+
+    Args:
+        name: The config name, used in logs and metrics.
+        load: Function that loads the config. It is called in a worker thread and
+            returns the config and the paths to watch for changes.
+        apply: Function that swaps in the new config. It is called on the event
+            loop and should only assign the new objects.
+        paths: The initial paths to watch.
+        watch_interval: The interval between checks of the watched files, in
+            seconds, or ``None`` to only reload on ``SIGHUP``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[], tuple[_T, Iterable[Path]]],
+        apply: Callable[[_T], None],
+        paths: Iterable[Path] = (),
+        *,
+        watch_interval: float | None = DEFAULT_WATCH_INTERVAL,
+    ):
+        self.name = name
+        self.load = load
+        self.apply = apply
+        self.watch_interval = watch_interval
+        self._mtimes = _get_mtimes(paths)
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._signal_tasks: set[asyncio.Task] = set()
+
+    async def reload(self) -> bool:
+        """Load the config and swap it in.
+
+        Returns:
+            Whether the new config was applied. If loading fails, the current
+            config is kept.
+        """
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            start = time.perf_counter()
+            try:
+                value, paths = await loop.run_in_executor(None, self.load)
+            except Exception:
+                logger.exception(f"Failed to reload {self.name} config")
+                CONFIG_RELOADS.labels(self.name, "error").inc()
+                # retry when the files change again
+                self._mtimes = _get_mtimes(self._mtimes)
+                return False
+            load_time = time.perf_counter() - start
+
+            swap_start = time.perf_counter()
+            self.apply(value)
+            swap_time = time.perf_counter() - swap_start
+
+            self._mtimes = _get_mtimes(paths)
+            CONFIG_RELOAD_DURATION.labels(self.name).observe(load_time)
+            CONFIG_SWAP_DURATION.labels(self.name).observe(swap_time)
+            CONFIG_RELOADS.labels(self.name, "success").inc()
+            logger.info(
+                f"Reloaded {self.name} config in {load_time * 1000:.1f} ms, "
+                f"swapped in {swap_time * 1e6:.1f} us"
+            )
+            return True
+
+    def start(self):
+        """Handle ``SIGHUP`` and start watching files."""
+        if self not in _started:
+            if not _started:
+                _add_signal_handler()
+            _started.append(self)
+        if self.watch_interval is not None and self._task is None:
+            self._task = asyncio.create_task(self._watch(self.watch_interval))
+
+    async def stop(self):
+        """Stop handling ``SIGHUP`` and watching files."""
+        if self in _started:
+            _started.remove(self)
+            if not _started:
+                _remove_signal_handler()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _reload_on_signal(self):
+        logger.info(f"Received SIGHUP, reloading {self.name} config")
+        task = asyncio.create_task(self.reload())
+        self._signal_tasks.add(task)
+        task.add_done_callback(self._signal_tasks.discard)
+
+    async def _watch(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            if _get_mtimes(self._mtimes) != self._mtimes:
+                logger.info(f"Config files changed, reloading {self.name} config")
+                await self.reload()
+
+
+def _add_signal_handler():
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGHUP, _handle_signal)
+    except (NotImplementedError, RuntimeError, AttributeError):
+        logger.warning("Cannot reload config on SIGHUP")
+
+
+def _remove_signal_handler():
+    loop = asyncio.get_running_loop()
+    with contextlib.suppress(NotImplementedError, RuntimeError, AttributeError):
+        loop.remove_signal_handler(signal.SIGHUP)
+
+
+def _handle_signal():
+    for reloader in list(_started):
+        reloader._reload_on_signal()
+
+
+def _get_mtimes(paths: Iterable[Path]) -> dict[Path, int | None]:
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    return mtimes
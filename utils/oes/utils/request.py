@@ -1,6 +1,7 @@
 """Request utils."""
 
-from typing import Type, TypeVar
+from collections.abc import Callable
+from typing import Any, Type, TypeVar
 
 import orjson
 from cattrs import BaseValidationError, Converter
@@ -9,14 +10,29 @@ from sanic import BadRequest, NotFound, Request, SanicException
 
 __all__ = [
     "CattrsBody",
+    "get_structure_fn",
     "raise_not_found",
 ]
 
 _T = TypeVar("_T")
 
+StructureFn = Callable[[Any, Any], Any]
+
+# converters are long-lived, so they are kept with their caches by ID
+_structure_fns: dict[int, tuple[Converter, dict[tuple[Any, bool], StructureFn]]] = {}
+_trusted_converters: dict[int, tuple[Converter, Converter]] = {}
+
+_validation_errors = (BaseValidationError,)
+_trusted_validation_errors = (BaseValidationError, KeyError, TypeError, ValueError)
+
 
 class CattrsBody:
-    """Cattrs body reader."""
+    """Cattrs body reader.
+
+    If ``trusted_body`` is set on the app context, such as by
+    :func:`oes.utils.sanic.setup_app`, bodies are structured without detailed
+    validation, and any structuring error is treated as an invalid body.
+    """
 
     def __init__(self, request: Request, converter: Converter):
         self.request = request
@@ -30,15 +46,46 @@ class CattrsBody:
             json = orjson.loads(self.request.body)
         except ValueError:
             raise BadRequest
+        trusted = getattr(self.request.app.ctx, "trusted_body", False)
+        structure = get_structure_fn(self.converter, structure_as, trusted=trusted)
+        errors = _trusted_validation_errors if trusted else _validation_errors
         try:
-            return self.converter.structure(json, structure_as)
-        except BaseValidationError as exc:
+            return structure(json, structure_as)
+        except errors as exc:
             logger.opt(exception=exc).debug(f"Invalid body: {exc}")
             raise SanicException("Invalid body", status_code=422) from exc
 
 
+def get_structure_fn(
+    converter: Converter, type_: Type[_T], *, trusted: bool = False
+) -> Callable[[Any, Type[_T]], _T]:
+    """Get the cached structure function for a type.
+
+    Args:
+        converter: The converter.
+        type_: The type to structure as.
+        trusted: Use a copy of the converter without detailed validation, for
+            bodies from trusted services. Errors are not collected or annotated
+            with their paths.
+    """
+    _, fns = _structure_fns.setdefault(id(converter), (converter, {}))
+    fn = fns.get((type_, trusted))
+    if fn is None:
+        source = _get_trusted_converter(converter) if trusted else converter
+        fn = fns[(type_, trusted)] = source.get_structure_hook(type_)
+    return fn
+
+
 def raise_not_found(obj: _T | None) -> _T:
     """Raise :class:`NotFound` if the object is ``None``."""
     if obj is None:
         raise NotFound
     return obj
+
+
+def _get_trusted_converter(converter: Converter) -> Converter:
+    entry = _trusted_converters.get(id(converter))
+    if entry is None:
+        trusted = converter.copy(detailed_validation=False)
+        entry = _trusted_converters[id(converter)] = (converter, trusted)
+    return entry[1]
@@ -1,15 +1,19 @@
 """HTTP response utilities."""
 
 import functools
+import hashlib
 import types
 from collections.abc import Awaitable, Callable, Coroutine
 from typing import Any, ParamSpec, Type, overload
 
+import orjson
+from attrs import frozen
 from cattrs.preconf.orjson import OrjsonConverter, make_converter
-from sanic import HTTPResponse
+from sanic import HTTPResponse, Request
 
 __all__ = [
     "ResponseConverter",
+    "CachedResponse",
 ]
 
 _P = ParamSpec("_P")
@@ -31,6 +35,7 @@ class ResponseConverter:
     ):
         self.converter = converter or make_converter()
         self.json_default = json_default
+        self._dumpers: dict[Any, Callable[[Any], bytes]] = {}
 
     @overload
     def __call__(self, unstructure_as: Type | None = None, /) -> Callable[
@@ -66,5 +71,56 @@ class ResponseConverter:
         self, value: Any, unstructure_as: Type | None = None
     ) -> HTTPResponse:
         """Make a response from the value."""
-        body = self.converter.dumps(value, unstructure_as, default=self.json_default)
-        return HTTPResponse(body, content_type="application/json")
+        dumper = self.get_dumper(
+            unstructure_as if unstructure_as is not None else type(value)
+        )
+        return HTTPResponse(dumper(value), content_type="application/json")
+
+    def get_dumper(self, unstructure_as: Any) -> Callable[[Any], bytes]:
+        """Get the cached function to encode values of a type as JSON.
+
+        Dumpers use the unstructure hooks registered when they are first used.
+        """
+        dumper = self._dumpers.get(unstructure_as)
+        if dumper is None:
+            dumper = self._dumpers[unstructure_as] = self._make_dumper(unstructure_as)
+        return dumper
+
+    def _make_dumper(self, unstructure_as: Any) -> Callable[[Any], bytes]:
+        hook = self.converter.get_unstructure_hook(unstructure_as)
+        json_default = self.json_default
+        return lambda v: orjson.dumps(hook(v), default=json_default)
+
+
+@frozen
+class CachedResponse:
+    """A pre-serialized response body with a strong ETag."""
+
+    body: bytes
+    etag: str
+    content_type: str = "application/json"
+
+    @classmethod
+    def create(
+        cls, body: bytes, content_type: str = "application/json"
+    ) -> "CachedResponse":
+        """Create a cached response, computing the ETag from the body."""
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(body, etag, content_type)
+
+    def make_response(self, request: Request) -> HTTPResponse:
+        """Make a response, or a 304 response if the client's copy is current."""
+        headers = {"ETag": self.etag}
+        if _etag_matches(request.headers.get("If-None-Match"), self.etag):
+            return HTTPResponse(status=304, headers=headers)
+        return HTTPResponse(self.body, headers=headers, content_type=self.content_type)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if value == "*" or value.removeprefix("W/") == etag:
+            return True
+    return False
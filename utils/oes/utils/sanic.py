@@ -1,60 +1,230 @@
 """Sanic utils."""
 
-from typing import AsyncContextManager
+import argparse
+import os
+import signal
+import sys
+import time
+from collections.abc import Sequence
+from typing import Any, AsyncContextManager, NoReturn
 
 from cattrs import Converter
 from cattrs.preconf.orjson import make_converter
+from oes.utils import metrics
+from oes.utils.db import DatabaseConfig, make_engine
 from oes.utils.orm import get_session, set_session_factory
+from oes.utils.reload import ConfigReloader
 from oes.utils.request import CattrsBody
+from oes.utils.workers import WORKERS_ENV, get_worker_count
 from sanic import HTTPResponse, Request, Sanic
-from sqlalchemy import URL
-from sqlalchemy.ext.asyncio import (
-    AsyncEngine,
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy import URL, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 __all__ = [
+    "run_server",
     "setup_app",
+    "setup_config_reload",
     "setup_database",
 ]
 
 
-def setup_app(app: Sanic, config: object = None, converter: Converter | None = None):
-    """App setup boilerplate."""
+def setup_app(
+    app: Sanic,
+    config: object = None,
+    converter: Converter | None = None,
+    *,
+    trusted_body: bool = False,
+    metrics: bool = False,
+    server_timing: bool = False,
+):
+    """App setup boilerplate.
+
+    Set ``trusted_body`` to structure :class:`CattrsBody` bodies without detailed
+    validation, for services only called by other trusted services.
+
+    Set ``metrics`` to record request metrics and expose them at ``/metrics``.
+    Metrics are kept in the worker process, so they can only be enabled with a
+    single worker.
+
+    Each request gets the ID in its ``X-Request-ID`` header, or a new one, which is
+    sent back in the response. Set ``server_timing`` to also send the time spent
+    in each phase of the request, including upstream timings, in a
+    ``Server-Timing`` header. Only enable it where the clients are trusted.
+
+    Raises:
+        ValueError: If ``metrics`` is set and there are several workers.
+    """
+    workers = get_worker_count()
+    if metrics and workers > 1:
+        raise ValueError(
+            f"Metrics cannot be enabled with {workers} workers, each worker would "
+            "only report its own requests at /metrics; run a single worker"
+        )
+
     app.config.FALLBACK_ERROR_FORMAT = "json"
+    app.ctx.trusted_body = trusted_body
+    app.ctx.server_timing = server_timing
 
+    # read from the context for each request, so the config can be swapped
     app.ctx.config = config
     if config is not None:
-        app.ext.dependency(config)
+        app.ext.add_dependency(type(config), _get_config)
 
     converter = converter or make_converter()
     app.ext.add_dependency(CattrsBody)
     app.ext.add_dependency(Converter, lambda: converter)
 
+    app.on_request(_start_request)
+    app.on_response(_finish_request)
+    if metrics:
+        _setup_metrics(app)
+
+
+def setup_database(app: Sanic, db_url: str | URL, config: DatabaseConfig | None = None):
+    """Configure the app to manage a database engine.
 
-def setup_database(app: Sanic, db_url: str | URL):
-    """Configure the app to manage a database engine."""
-    engine = create_async_engine(db_url)
-    factory = async_sessionmaker(engine, expire_on_commit=False)
-    app.ctx.db_engine = engine
-    app.ctx.db_session_factory = factory
+    The engine is created in each worker process when the server starts, with the
+    pool limits in ``config`` divided among the workers.
+    """
+
+    @app.before_server_start
+    async def _create_db_engine(app: Sanic):
+        engine = make_engine(db_url, config)
+        app.ctx.db_engine = engine
+        app.ctx.db_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        event.listen(
+            engine.sync_engine, "before_cursor_execute", _before_cursor_execute
+        )
+        event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
 
     app.after_server_stop(_shutdown)
 
+    app.on_request(_set_session_factory)
     app.on_response(_session_cleanup)
     app.ext.add_dependency(AsyncSession, _session_dependency)
 
-    @app.on_request
-    async def _set_factory_ctx(request: Request):
-        # context is not copied, so set it here
-        set_session_factory(factory)
+
+def setup_config_reload(app: Sanic, reloader: ConfigReloader):
+    """Run ``reloader`` while the server is running.
+
+    With several worker processes, ``SIGHUP`` sent to the main process is
+    forwarded to the workers.
+    """
+    if get_worker_count() > 1 and not hasattr(app.ctx, "config_reloader"):
+        app.main_process_ready(_forward_sighup)
+    app.ctx.config_reloader = reloader
+
+    @app.before_server_start
+    async def _start_config_reload(app: Sanic):
+        reloader.start()
+
+    @app.after_server_stop
+    async def _stop_config_reload(app: Sanic):
+        await reloader.stop()
+
+
+def run_server(
+    prog: str, app_factory: str, args: Sequence[str] | None = None
+) -> NoReturn:
+    """Replace this process with a Sanic server for ``app_factory``.
+
+    The number of worker processes is taken from a ``--workers`` argument or the
+    ``OES_WORKERS`` environment variable, and is exported to the workers. A single
+    worker runs in the main process. Other arguments are passed to Sanic.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("-w", "--workers", type=int)
+    parsed, rest = parser.parse_known_args(sys.argv[1:] if args is None else args)
+    workers = max(1, parsed.workers) if parsed.workers else get_worker_count()
+    os.environ[WORKERS_ENV] = str(workers)
+    mode = ("--workers", str(workers)) if workers > 1 else ("--single-process",)
+    os.execlp("sanic", prog, *mode, app_factory, *rest)
+
+
+def _get_config(request: Request) -> Any:
+    return request.app.ctx.config
+
+
+async def _start_request(request: Request):
+    request_id = metrics.make_request_id(request.headers.get(metrics.REQUEST_ID_HEADER))
+    request.ctx.request_id = request_id
+    request.ctx.start_time = time.perf_counter()
+    metrics.start_request_stats(request_id)
+
+
+async def _finish_request(request: Request, response: HTTPResponse):
+    request_id = getattr(request.ctx, "request_id", None)
+    if request_id is None:
+        return
+    response.headers[metrics.REQUEST_ID_HEADER] = request_id
+    stats = metrics.get_request_stats()
+    if request.app.ctx.server_timing and stats is not None:
+        total = time.perf_counter() - request.ctx.start_time
+        response.headers[metrics.SERVER_TIMING_HEADER] = stats.get_server_timing(total)
+
+
+async def _forward_sighup(app: Sanic):
+    manager = app.manager
+
+    def forward(signum: int, frame: Any):
+        for process in manager.transient_processes:
+            if process.pid:
+                os.kill(process.pid, signal.SIGHUP)
+
+    signal.signal(signal.SIGHUP, forward)
+
+
+def _setup_metrics(app: Sanic):
+    app.on_request(_start_request_metrics)
+    app.on_response(_record_request_metrics)
+    app.add_route(_metrics_handler, "/metrics", name="metrics")
+
+
+async def _start_request_metrics(request: Request):
+    metrics.REQUESTS_IN_FLIGHT.inc()
+    request.ctx.metrics_start = time.perf_counter()
+
+
+async def _record_request_metrics(request: Request, response: HTTPResponse):
+    start = getattr(request.ctx, "metrics_start", None)
+    if start is None:
+        return
+    del request.ctx.metrics_start
+    metrics.REQUESTS_IN_FLIGHT.dec()
+    route = f"/{request.route.path}" if request.route else ""
+    metrics.REQUEST_DURATION.labels(request.method, route, response.status).observe(
+        time.perf_counter() - start
+    )
+    stats = metrics.get_request_stats()
+    if stats is not None and hasattr(request.app.ctx, "db_engine"):
+        metrics.DB_QUERIES_PER_REQUEST.observe(stats.db_queries)
+        metrics.DB_TIME_PER_REQUEST.observe(stats.db_time)
+
+
+async def _metrics_handler(request: Request) -> HTTPResponse:
+    return HTTPResponse(metrics.registry.render(), content_type=metrics.CONTENT_TYPE)
+
+
+def _before_cursor_execute(conn: Any, *args: Any):
+    # a connection runs one statement at a time, a failed one is overwritten
+    conn.info["oes_query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn: Any, *args: Any):
+    start = conn.info.pop("oes_query_start", None)
+    if start is not None:
+        metrics.observe_db_query(time.perf_counter() - start)
+
+
+async def _set_session_factory(request: Request):
+    # context is not copied, so set it here
+    set_session_factory(request.app.ctx.db_session_factory)
 
 
 async def _shutdown(app: Sanic):
-    engine: AsyncEngine = app.ctx.db_engine
-    await engine.dispose()
+    engine: AsyncEngine | None = getattr(app.ctx, "db_engine", None)
+    if engine is not None:
+        await engine.dispose()
 
 
 async def _session_dependency(request: Request) -> AsyncSession:
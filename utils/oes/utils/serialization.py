@@ -38,7 +38,7 @@ def configure_converter(converter: Converter):
 
     converter.register_structure_hook_factory(
         lambda cls: get_origin(cls) is Sequence,
-        lambda cls: make_sequence_structure_fn(cls, converter),
+        make_sequence_structure_fn,
     )
 
 
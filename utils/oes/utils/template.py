@@ -1,17 +1,37 @@
 """Template logic module."""
 
-from collections.abc import Callable, Mapping
+import marshal
+import os
+import time
+from collections.abc import Callable, Generator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime
-from typing import Any, TypeAlias
+from types import CodeType
+from typing import Any, Literal, TypeAlias
 
 import jinja2
-from jinja2 import Environment
+from attrs import frozen
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    TemplateSyntaxError,
+    nodes,
+)
 from jinja2.environment import TemplateExpression
+from jinja2.parser import Parser
+from loguru import logger
 
 __all__ = [
     "TemplateContext",
     "Expression",
     "Template",
+    "TEMPLATE_CACHE_DIR_ENV",
+    "make_bytecode_cache",
+    "CompileTime",
+    "record_compile_times",
+    "log_compile_times",
     "template_fn_get_now",
     "template_filter_datetime",
     "template_filter_date",
@@ -24,6 +44,13 @@ __all__ = [
 TemplateContext: TypeAlias = Mapping[str, Any]
 """Template evaluation context."""
 
+TEMPLATE_CACHE_DIR_ENV = "OES_TEMPLATE_CACHE_DIR"
+"""Environment variable for the default template bytecode cache directory."""
+
+_compile_times: ContextVar[list["CompileTime"] | None] = ContextVar(
+    "_compile_times", default=None
+)
+
 
 class Expression:
     """A template expression."""
@@ -35,12 +62,28 @@ class Expression:
 
     def __init__(self, source: str, env: Environment):
         self.source = source
-        self._expr = env.compile_expression(source, undefined_to_none=False)
+        self._expr = _make_expression(env, _compile(env, "expression", source))
 
     def evaluate(self, context: TemplateContext) -> Any:
         """Evaluate the expression."""
         return self._expr(**context)
 
+    @property
+    def environment(self) -> Environment:
+        """The environment the expression was compiled with."""
+        return self._expr._template.environment
+
+    def __getstate__(self) -> tuple[str, Environment, bytes]:
+        # pickled as compiled code, the environment must be pickled by reference
+        env = self.environment
+        code = _compile(env, "expression", self.source)
+        return self.source, env, marshal.dumps(code)
+
+    def __setstate__(self, state: tuple[str, Environment, bytes]):
+        source, env, code = state
+        self.source = source
+        self._expr = _make_expression(env, marshal.loads(code))
+
     def __repr__(self) -> str:
         return f"Expression({self.source!r})"
 
@@ -61,12 +104,39 @@ class Template:
 
     def __init__(self, source: str, env: Environment):
         self.source = source
-        self._template = env.from_string(source)
+        self._template = _make_template(env, _compile(env, "template", source))
 
     def render(self, context: TemplateContext) -> str:
         """Render the template."""
         return self._template.render(**context)
 
+    @property
+    def is_static(self) -> bool:
+        """Whether the template contains no template syntax.
+
+        A static template renders the same text with any context.
+        """
+        env = self._template.environment
+        delimiters = (
+            env.block_start_string,
+            env.variable_start_string,
+            env.comment_start_string,
+            env.line_statement_prefix,
+            env.line_comment_prefix,
+        )
+        return not any(d and d in self.source for d in delimiters)
+
+    def __getstate__(self) -> tuple[str, Environment, bytes]:
+        # pickled as compiled code, the environment must be pickled by reference
+        env = self._template.environment
+        code = _compile(env, "template", self.source)
+        return self.source, env, marshal.dumps(code)
+
+    def __setstate__(self, state: tuple[str, Environment, bytes]):
+        source, env, code = state
+        self.source = source
+        self._template = _make_template(env, marshal.loads(code))
+
     def __repr__(self) -> str:
         return f"Template({self.source!r})"
 
@@ -77,6 +147,126 @@ class Template:
         return isinstance(other, Template) and other.source == self.source
 
 
+@frozen
+class CompileTime:
+    """The time taken to compile a template or expression."""
+
+    kind: Literal["expression", "template"]
+    source: str
+    seconds: float
+    cached: bool
+    """Whether the code was loaded from the bytecode cache."""
+
+
+def make_bytecode_cache(
+    directory: str | os.PathLike[str] | None = None,
+) -> BytecodeCache | None:
+    """Make a filesystem bytecode cache for a :class:`jinja2.Environment`.
+
+    Compiled expressions and templates are stored in the cache, so that later
+    processes with the same sources do not need to compile them again.
+
+    Args:
+        directory: The cache directory. Defaults to the directory in the
+            ``OES_TEMPLATE_CACHE_DIR`` environment variable.
+
+    Returns:
+        The cache, or ``None`` if no directory is configured.
+    """
+    if directory is None:
+        directory = os.getenv(TEMPLATE_CACHE_DIR_ENV) or None
+    if directory is None:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    return FileSystemBytecodeCache(os.fspath(directory))
+
+
+@contextmanager
+def record_compile_times() -> Generator[list[CompileTime], None, None]:
+    """Context manager to record each expression and template compiled.
+
+    Yields:
+        A list that :class:`CompileTime` entries are appended to.
+    """
+    times: list[CompileTime] = []
+    token = _compile_times.set(times)
+    try:
+        yield times
+    finally:
+        _compile_times.reset(token)
+
+
+def log_compile_times(times: Sequence[CompileTime], slowest: int = 10):
+    """Log a summary of recorded compile times."""
+    if not times:
+        return
+    total = sum(t.seconds for t in times)
+    cached = sum(1 for t in times if t.cached)
+    logger.info(
+        f"Compiled {len(times)} expressions and templates in {total * 1000:.1f} ms "
+        f"({cached} from cache)"
+    )
+    for t in sorted(times, key=lambda t: t.seconds, reverse=True)[:slowest]:
+        logger.debug(f"Compiled {t.kind} in {t.seconds * 1000:.2f} ms: {t.source!r}")
+
+
+def _compile(
+    env: Environment, kind: Literal["expression", "template"], source: str
+) -> CodeType:
+    start = time.perf_counter()
+    bcc = env.bytecode_cache
+    if bcc is None:
+        code = _compile_source(env, kind, source)
+        cached = False
+    else:
+        # the name is part of the cache key, the source is the checksum
+        name = f"{type(env).__qualname__}:{kind}:{source}"
+        bucket = bcc.get_bucket(env, name, None, source)
+        cached = bucket.code is not None
+        if not cached:
+            bucket.code = _compile_source(env, kind, source)
+            bcc.set_bucket(bucket)
+        code = bucket.code
+    times = _compile_times.get()
+    if times is not None:
+        times.append(CompileTime(kind, source, time.perf_counter() - start, cached))
+    return code  # type: ignore
+
+
+def _compile_source(
+    env: Environment, kind: Literal["expression", "template"], source: str
+) -> CodeType:
+    if kind == "expression":
+        return _compile_expression(env, source)
+    else:
+        return env.compile(source)
+
+
+def _compile_expression(env: Environment, source: str) -> CodeType:
+    # same as Environment.compile_expression, but returns the code
+    parser = Parser(env, source, state="variable")
+    try:
+        expr = parser.parse_expression()
+        if not parser.stream.eos:
+            raise TemplateSyntaxError(
+                "chunk after expression", parser.stream.current.lineno, None, None
+            )
+        expr.set_environment(env)
+    except TemplateSyntaxError:
+        env.handle_exception(source=source)
+
+    body = [nodes.Assign(nodes.Name("result", "store"), expr, lineno=1)]
+    return env.compile(nodes.Template(body, lineno=1))
+
+
+def _make_expression(env: Environment, code: CodeType) -> TemplateExpression:
+    return TemplateExpression(_make_template(env, code), False)
+
+
+def _make_template(env: Environment, code: CodeType) -> jinja2.Template:
+    return env.template_class.from_code(env, code, env.make_globals(None))
+
+
 def template_fn_get_now() -> datetime:
     """Template function to get the current datetime."""
     return datetime.now().astimezone()
@@ -0,0 +1,28 @@
+"""Worker process utils."""
+
+import os
+
+__all__ = [
+    "WORKERS_ENV",
+    "get_worker_count",
+    "per_worker",
+]
+
+WORKERS_ENV = "OES_WORKERS"
+"""Environment variable with the number of worker processes."""
+
+
+def per_worker(total: int) -> int:
+    """Divide a connection limit among the worker processes, rounding up.
+
+    Limits of zero or less, which often mean none or unlimited, are unchanged.
+    """
+    return -(-total // get_worker_count()) if total > 0 else total
+
+
+def get_worker_count() -> int:
+    """Get the number of worker processes."""
+    try:
+        return max(1, int(os.getenv(WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
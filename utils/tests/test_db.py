@@ -0,0 +1,58 @@
+import asyncio
+from typing import Any
+
+import pytest
+from oes.utils.db import DatabaseConfig, make_engine
+from oes.utils.metrics import DB_POOL_LIMIT
+from oes.utils.workers import WORKERS_ENV
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class _StopConnect(Exception):
+    pass
+
+
+def _get_connect_params(engine: AsyncEngine) -> dict[str, Any]:
+    params = {}
+
+    def do_connect(dialect, conn_rec, cargs, cparams):
+        params.update(cparams)
+        raise _StopConnect
+
+    event.listen(engine.sync_engine, "do_connect", do_connect)
+
+    async def connect():
+        async with engine.connect():
+            pass
+
+    with pytest.raises(_StopConnect):
+        asyncio.run(connect())
+    return params
+
+
+def test_make_engine(monkeypatch):
+    monkeypatch.setenv(WORKERS_ENV, "2")
+    config = DatabaseConfig(pool_size=10, max_overflow=4, pgbouncer=True)
+    engine = make_engine("postgresql+asyncpg:///pooltest", config)
+    assert engine.pool.size() == 5
+    assert DB_POOL_LIMIT.labels("pooltest").value == 7
+
+
+def test_make_engine_pgbouncer():
+    config = DatabaseConfig(statement_cache_size=50, pgbouncer=True)
+    engine = make_engine("postgresql+asyncpg:///pooltest", config)
+    params = _get_connect_params(engine)
+    assert params["statement_cache_size"] == 0
+    assert params["prepared_statement_cache_size"] == 0
+    names = params["prepared_statement_name_func"]
+    assert names() != names()
+
+
+def test_make_engine_statement_cache():
+    config = DatabaseConfig(statement_cache_size=50)
+    engine = make_engine("postgresql+asyncpg:///pooltest", config)
+    params = _get_connect_params(engine)
+    assert params["statement_cache_size"] == 50
+    assert params["prepared_statement_cache_size"] == 50
+    assert "prepared_statement_name_func" not in params
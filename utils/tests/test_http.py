@@ -0,0 +1,178 @@
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+import httpx
+import pytest
+from oes.utils.asgi import ASGILifespan
+from oes.utils.http import (
+    HTTPClientConfig,
+    make_http_client,
+    mount_local_app,
+    unmount_local_apps,
+)
+from oes.utils.metrics import HTTP_CLIENT_POOL_REQUESTS, HTTP_CLIENT_RETRIES
+from sanic import HTTPResponse, Request, Sanic, json
+
+
+@asynccontextmanager
+async def _serve(statuses: Sequence[int]) -> AsyncIterator[tuple[str, list[str]]]:
+    # respond with each status in turn, then 200, status 0 closes the connection
+    requests: list[str] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            requests.append(await _read_request(reader))
+            status = (
+                statuses[len(requests) - 1] if len(requests) <= len(statuses) else 200
+            )
+            if status == 0:
+                writer.close()
+                return
+            writer.write(f"HTTP/1.1 {status} X\r\nContent-Length: 2\r\n\r\nok".encode())
+            await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}", requests
+
+
+async def _read_request(reader: asyncio.StreamReader) -> str:
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    await reader.readexactly(length)
+    return head.split(b" ", 1)[0].decode()
+
+
+@pytest.mark.parametrize(
+    "method, statuses, expected_status, expected_requests",
+    [
+        ("GET", (), 200, 1),
+        ("GET", (503,), 200, 2),
+        ("GET", (503, 502, 504), 504, 3),
+        ("PUT", (503,), 503, 1),
+        ("POST", (503,), 503, 1),
+        ("GET", (500,), 500, 1),
+    ],
+)
+def test_retries(
+    method: str,
+    statuses: Sequence[int],
+    expected_status: int,
+    expected_requests: int,
+):
+    config = HTTPClientConfig(retries=2, retry_backoff=0.001)
+
+    async def run():
+        async with _serve(statuses) as (url, requests):
+            pool = url.removeprefix("http://")
+            retries = HTTP_CLIENT_RETRIES.labels(pool).value
+            async with make_http_client(config, (url,)) as client:
+                res = await client.request(method, url, content=b"body")
+                assert HTTP_CLIENT_POOL_REQUESTS.labels(pool).value == 0
+            assert HTTP_CLIENT_RETRIES.labels(pool).value - retries == len(requests) - 1
+            return res, requests
+
+    res, requests = asyncio.run(run())
+    assert res.status_code == expected_status
+    assert res.text == "ok"
+    assert requests == [method] * expected_requests
+
+
+@pytest.mark.parametrize(
+    "method, headers, expected_requests",
+    [
+        ("GET", {}, 2),
+        ("GET", {"If-Match": '"1"'}, 1),
+        ("PUT", {}, 1),
+        ("PUT", {"If-Match": '"1"'}, 1),
+    ],
+)
+def test_retries_after_send(
+    method: str, headers: dict[str, str], expected_requests: int
+):
+    config = HTTPClientConfig(retries=2, retry_backoff=0.001)
+    sent: list[str] = []
+
+    async def run():
+        async with _serve((0,)) as (url, requests):
+            try:
+                async with make_http_client(config, (url,)) as client:
+                    return await client.request(method, url, headers=headers)
+            finally:
+                sent.extend(requests)
+
+    if expected_requests > 1:
+        assert asyncio.run(run()).status_code == 200
+    else:
+        with pytest.raises(httpx.RemoteProtocolError):
+            asyncio.run(run())
+    assert sent == [method] * expected_requests
+
+
+def test_retries_connect_error():
+    config = HTTPClientConfig(retries=2, retry_backoff=0.001)
+
+    async def run():
+        async with _serve(()) as (url, _):
+            pass
+        # the server is closed, so the connection is refused
+        pool = url.removeprefix("http://")
+        retries = HTTP_CLIENT_RETRIES.labels(pool).value
+        async with make_http_client(config, (url,)) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.put(url, headers={"If-Match": '"1"'})
+        return HTTP_CLIENT_RETRIES.labels(pool).value - retries
+
+    assert asyncio.run(run()) == 2
+
+
+def test_pool_requests():
+    async def run():
+        async with _serve(()) as (url, _):
+            pool = url.removeprefix("http://")
+            async with make_http_client(upstreams=(url,)) as client:
+                async with client.stream("GET", url) as res:
+                    assert HTTP_CLIENT_POOL_REQUESTS.labels(pool).value == 1
+                    await res.aread()
+                assert HTTP_CLIENT_POOL_REQUESTS.labels(pool).value == 0
+
+    asyncio.run(run())
+
+
+def test_local_app():
+    request_var: ContextVar[str | None] = ContextVar("request_var", default=None)
+    app = Sanic("LocalUpstream", configure_logging=False)
+    app.config.TOUCHUP = False
+    app.ctx.started = False
+
+    @app.before_server_start
+    async def start(app: Sanic):
+        app.ctx.started = True
+
+    @app.get("/items/<id>")
+    async def read_item(request: Request, id: str) -> HTTPResponse:
+        request_var.set(id)
+        return json({"id": id, "started": request.app.ctx.started})
+
+    async def run():
+        lifespan = ASGILifespan(app)
+        await lifespan.start()
+        mount_local_app("http://upstream:8000", app)
+        try:
+            async with make_http_client() as client:
+                res = await client.get("http://upstream:8000/items/1")
+        finally:
+            unmount_local_apps()
+            await lifespan.stop()
+        return res, request_var.get()
+
+    res, value = asyncio.run(run())
+    assert res.status_code == 200
+    assert res.json() == {"id": "1", "started": True}
+    assert value is None
@@ -7,7 +7,9 @@ from oes.utils.logic import (
     LogicOr,
     ValueOrEvaluable,
     WhenCondition,
+    compile_condition,
     evaluate,
+    evaluate_condition,
     make_logic_unstructure_fn,
     make_value_or_evaluable_structure_fn,
     make_when_condition_structure_fn,
@@ -78,3 +80,82 @@ def test_unstructure_logic(converter: Converter):
             True,
         ],
     }
+
+
+@pytest.mark.parametrize(
+    "v, expected",
+    [
+        ("a", 1),
+        (0, 0),
+        ({"other": 1}, {"other": 1}),
+        ({"and": ["a", "t"]}, True),
+        ({"and": ["a", "f"]}, False),
+        ({"and": [True, "a", True]}, True),
+        ({"and": [False, "x"]}, False),
+        ({"and": []}, True),
+        ({"or": ["b", "f"]}, False),
+        ({"or": [False, "a"]}, True),
+        ({"or": [True, "x"]}, True),
+        ({"or": []}, False),
+        ({"or": [{"and": ["t", "f"]}, "t"]}, True),
+        (["t", "f", "a"], False),
+        (["t", "a", "t"], True),
+    ],
+)
+def test_compile_condition(converter: Converter, v, expected):
+    context = {
+        "a": 1,
+        "b": 0,
+        "t": True,
+        "f": False,
+    }
+    structured = converter.structure(v, WhenCondition)  # type: ignore
+    assert compile_condition(structured)(context) == expected
+    assert evaluate_condition(structured, context) == expected
+
+
+def test_compile_condition_short_circuit():
+    evaluated = []
+
+    class Item:
+        def __init__(self, value):
+            self.value = value
+
+        def evaluate(self, context):
+            evaluated.append(self.value)
+            return self.value
+
+    cond = LogicOr((LogicAnd((Item(0), Item(1))), Item(2), Item(3), True))
+    assert compile_condition(cond)({}) is True
+    assert evaluated == [0, 2]
+
+
+def test_evaluate_condition_environments():
+    env1 = jinja2.Environment()
+    env1.globals["x"] = 1
+    env2 = jinja2.Environment()
+    env2.globals["x"] = 2
+    expr1 = Expression("x", env1)
+    expr2 = Expression("x", env2)
+    assert evaluate_condition(expr1, {}) == 1
+    assert evaluate_condition(expr2, {}) == 2
+
+
+def test_evaluate_condition_restructured(
+    converter: Converter, monkeypatch: pytest.MonkeyPatch
+):
+    compiled = []
+
+    def compile_counted(when):
+        compiled.append(when)
+        return compile_condition(when)
+
+    monkeypatch.setattr("oes.utils.logic.compile_condition", compile_counted)
+    v = ["a == 1", {"or": ["b == 1", "restructured"]}]
+    context = {"a": 1, "b": 0, "restructured": True}
+    cond1 = converter.structure(v, WhenCondition)  # type: ignore
+    cond2 = converter.structure(v, WhenCondition)  # type: ignore
+    assert cond1 is not cond2
+    assert evaluate_condition(cond1, context) is True
+    assert evaluate_condition(cond2, context) is True
+    assert compiled == [cond1]
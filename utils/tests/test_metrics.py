@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from oes.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    RequestStats,
+    get_request_stats,
+    instrument_redis,
+    make_request_id,
+    observe_db_query,
+    start_request_stats,
+)
+
+
+@pytest.fixture
+def registry() -> Registry:
+    return Registry()
+
+
+def test_counter(registry: Registry):
+    counter = Counter("test_total", "A test counter", ("kind",), registry=registry)
+    counter.labels("a").inc()
+    counter.labels("a").inc(2)
+    counter.labels('b"\n').inc()
+    assert registry.render() == (
+        "# HELP test_total A test counter\n"
+        "# TYPE test_total counter\n"
+        'test_total{kind="a"} 3.0\n'
+        'test_total{kind="b\\"\\n"} 1.0\n'
+    )
+
+
+def test_gauge(registry: Registry):
+    gauge = Gauge("test_gauge", "A test gauge", registry=registry)
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    assert registry.render().splitlines()[-1] == "test_gauge 1.0"
+
+
+def test_histogram(registry: Registry):
+    histogram = Histogram(
+        "test_seconds", "A test histogram", buckets=(0.1, 1.0), registry=registry
+    )
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(2.0)
+    assert registry.render().splitlines()[2:] == [
+        'test_seconds_bucket{le="0.1"} 2',
+        'test_seconds_bucket{le="1.0"} 3',
+        'test_seconds_bucket{le="+Inf"} 4',
+        "test_seconds_sum 2.65",
+        "test_seconds_count 4",
+    ]
+
+
+def test_labels_count(registry: Registry):
+    counter = Counter("test_total", "A test counter", ("kind",), registry=registry)
+    with pytest.raises(ValueError):
+        counter.labels()
+
+
+def test_request_stats():
+    async def request():
+        assert get_request_stats() is None
+        stats = start_request_stats()
+        observe_db_query(0.5)
+        observe_db_query(0.25)
+        return stats
+
+    stats = asyncio.run(request())
+    assert stats.db_queries == 2
+    assert stats.db_time == 0.75
+
+
+def test_instrument_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def request():
+        stats = start_request_stats()
+        client = instrument_redis(fakeredis.FakeAsyncRedis())
+        await client.set("a", "1")
+        assert await client.get("a") == b"1"
+        await client.aclose()
+        return stats
+
+    stats = asyncio.run(request())
+    assert stats.redis_time > 0
+
+
+def test_server_timing():
+    stats = RequestStats("id")
+    assert stats.get_server_timing(0.0123) == "total;dur=12.3"
+    stats.db_queries = 3
+    stats.db_time = 0.004
+    stats.upstream_time = 0.0061
+    stats.upstream_timings.append(("cart.total", 5.9))
+    assert stats.get_server_timing(0.0123) == (
+        'total;dur=12.3, db;dur=4.0;desc="3 queries", upstream;dur=6.1, '
+        "cart.total;dur=5.9"
+    )
+
+
+@pytest.mark.parametrize(
+    "value, valid",
+    [
+        ("abc-123", True),
+        ("", False),
+        (None, False),
+        ("a b", False),
+        ("a" * 129, False),
+    ],
+)
+def test_make_request_id(value, valid):
+    request_id = make_request_id(value)
+    assert (request_id == value) is valid
+    assert request_id
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import signal
+from pathlib import Path
+
+from oes.utils.config import get_config_files
+from oes.utils.reload import ConfigReloader
+
+
+def test_reload(tmp_path: Path):
+    path = tmp_path / "config.yml"
+    path.write_text("1")
+    applied = []
+
+    def load():
+        return int(path.read_text()), [path]
+
+    reloader = ConfigReloader("test", load, applied.append, [path])
+
+    async def run():
+        path.write_text("2")
+        assert await reloader.reload()
+        path.write_text("invalid")
+        assert not await reloader.reload()
+
+    asyncio.run(run())
+    assert applied == [2]
+
+
+def test_reload_on_change(tmp_path: Path):
+    path = tmp_path / "config.yml"
+    path.write_text("1")
+    applied = []
+
+    def load():
+        return int(path.read_text()), [path]
+
+    reloader = ConfigReloader("test", load, applied.append, [path], watch_interval=0.01)
+
+    async def run():
+        reloader.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert applied == []
+            path.write_text("2")
+            os.utime(path, ns=(0, 1))
+            for _ in range(100):
+                if applied:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await reloader.stop()
+
+    asyncio.run(run())
+    assert applied == [2]
+
+
+def test_get_config_files(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CONFIG_FILE", f"extra.yml:!{tmp_path / 'required.yml'}")
+    assert get_config_files(("config.yml",)) == [
+        tmp_path / "config.yml",
+        tmp_path / "extra.yml",
+        tmp_path / "required.yml",
+    ]
+
+
+def test_reload_on_signal(tmp_path: Path):
+    paths = [tmp_path / "a.yml", tmp_path / "b.yml"]
+    applied = []
+
+    def make_reloader(path: Path) -> ConfigReloader:
+        path.write_text("1")
+        return ConfigReloader(
+            path.stem,
+            lambda: (path.read_text(), [path]),
+            lambda v: applied.append((path.stem, v)),
+            [path],
+            watch_interval=None,
+        )
+
+    a, b = (make_reloader(path) for path in paths)
+
+    async def wait_for(count: int):
+        for _ in range(100):
+            if len(applied) >= count:
+                break
+            await asyncio.sleep(0.01)
+
+    async def run():
+        a.start()
+        b.start()
+        try:
+            os.kill(os.getpid(), signal.SIGHUP)
+            await wait_for(2)
+            await a.stop()
+            os.kill(os.getpid(), signal.SIGHUP)
+            await wait_for(3)
+        finally:
+            await a.stop()
+            await b.stop()
+
+    asyncio.run(run())
+    assert sorted(applied[:2]) == [("a", "1"), ("b", "1")]
+    assert applied[2:] == [("b", "1")]
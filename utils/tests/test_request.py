@@ -0,0 +1,58 @@
+import asyncio
+from collections.abc import Sequence
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from attrs import frozen
+from cattrs import BaseValidationError, Converter
+from oes.utils.request import CattrsBody, get_structure_fn
+from sanic import SanicException
+
+
+@frozen
+class Item:
+    id: str
+    count: int = 0
+
+
+@frozen
+class Body:
+    items: Sequence[Item]
+
+
+def _make_request(body: object, trusted: bool = False):
+    app = SimpleNamespace(ctx=SimpleNamespace(trusted_body=trusted))
+    return SimpleNamespace(body=orjson.dumps(body), app=app)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_get_structure_fn(trusted: bool):
+    converter = Converter()
+    fn = get_structure_fn(converter, Body, trusted=trusted)
+    assert get_structure_fn(converter, Body, trusted=trusted) is fn
+    assert fn({"items": [{"id": "a", "count": 1}]}, Body) == Body([Item("a", 1)])
+
+
+def test_get_structure_fn_trusted_no_detailed_validation():
+    converter = Converter()
+    with pytest.raises(BaseValidationError):
+        get_structure_fn(converter, Body)({"items": [{}]}, Body)
+    with pytest.raises(KeyError):
+        get_structure_fn(converter, Body, trusted=True)({"items": [{}]}, Body)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_cattrs_body(trusted: bool):
+    converter = Converter()
+    body = CattrsBody(_make_request({"items": [{"id": "a"}]}, trusted), converter)
+    assert asyncio.run(body(Body)) == Body([Item("a")])
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_cattrs_body_invalid(trusted: bool):
+    converter = Converter()
+    body = CattrsBody(_make_request({"items": [{"count": 1}]}, trusted), converter)
+    with pytest.raises(SanicException) as exc_info:
+        asyncio.run(body(Body))
+    assert exc_info.value.status_code == 422
@@ -0,0 +1,84 @@
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+import pytest
+from attrs import frozen
+from cattrs.preconf.orjson import make_converter
+from oes.utils.response import CachedResponse, ResponseConverter
+from oes.utils.serialization import configure_converter
+from sanic import Request, Sanic
+from sanic.compat import Header
+
+
+@frozen
+class Item:
+    id: str
+    date: datetime
+    tags: frozenset[str] = frozenset()
+
+
+@frozen
+class ItemList:
+    items: Sequence[Item]
+    total: int
+
+
+@pytest.fixture
+def response_converter() -> ResponseConverter:
+    converter = make_converter()
+    configure_converter(converter)
+    return ResponseConverter(converter)
+
+
+def _make_value() -> ItemList:
+    date = datetime(2020, 1, 1, 12, tzinfo=timezone.utc)
+    return ItemList((Item("a", date, frozenset({"x"})), Item("b", date)), 2)
+
+
+def test_make_response(response_converter: ResponseConverter):
+    value = _make_value()
+    response = response_converter.make_response(value)
+    assert response.body == response_converter.converter.dumps(value)
+    assert response.content_type == "application/json"
+
+
+def test_make_response_unstructure_as(response_converter: ResponseConverter):
+    value = _make_value().items
+    response = response_converter.make_response(value, Sequence[Item])
+    assert response.body == response_converter.converter.dumps(value, Sequence[Item])
+
+
+def test_get_dumper_cached(response_converter: ResponseConverter):
+    dumper = response_converter.get_dumper(ItemList)
+    assert response_converter.get_dumper(ItemList) is dumper
+
+
+@pytest.mark.parametrize(
+    "if_none_match, status",
+    [
+        (None, 200),
+        ('"other"', 200),
+        ("{etag}", 304),
+        ("W/{etag}", 304),
+        ('"other", {etag}', 304),
+        ("*", 304),
+    ],
+)
+def test_cached_response(if_none_match: str | None, status: int):
+    cached = CachedResponse.create(b'{"id":"test"}')
+    assert cached == CachedResponse.create(b'{"id":"test"}')
+    assert cached.etag != CachedResponse.create(b'{"id":"other"}').etag
+
+    headers = (
+        {"If-None-Match": if_none_match.format(etag=cached.etag)}
+        if if_none_match
+        else {}
+    )
+    request = Request(b"/", Header(headers), "1.1", "GET", None, _app)
+    res = cached.make_response(request)
+    assert res.status == status
+    assert res.headers["ETag"] == cached.etag
+    assert res.body == (cached.body if status == 200 else b"")
+
+
+_app = Sanic("TestResponse")
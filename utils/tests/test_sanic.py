@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from oes.utils.db import DatabaseConfig
+from oes.utils.metrics import instrument_httpx_client
+from oes.utils.sanic import setup_app, setup_database
+from oes.utils.workers import WORKERS_ENV
+from sanic import HTTPResponse, Request, Sanic, json
+
+
+@asynccontextmanager
+async def _serve(app: Sanic) -> AsyncIterator[httpx.AsyncClient]:
+    # run the ASGI lifespan so the app is started like a server
+    receive: asyncio.Queue[dict] = asyncio.Queue()
+    send: asyncio.Queue[dict] = asyncio.Queue()
+    await receive.put({"type": "lifespan.startup"})
+    task = asyncio.create_task(
+        app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive.get, send.put)
+    )
+    await send.get()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url=f"http://{app.name.lower()}"
+        ) as client:
+            yield client
+    finally:
+        await receive.put({"type": "lifespan.shutdown"})
+        await send.get()
+        await task
+
+
+def _make_apps(server_timing: bool) -> tuple[Sanic, Sanic]:
+    suffix = "Timing" if server_timing else "NoTiming"
+    upstream = Sanic(f"Upstream{suffix}", configure_logging=False)
+    setup_app(upstream, server_timing=True)
+
+    @upstream.get("/")
+    async def upstream_handler(request: Request) -> HTTPResponse:
+        return json({"request_id": request.headers.get("x-request-id")})
+
+    front = Sanic(f"Front{suffix}", configure_logging=False)
+    if server_timing:
+        setup_app(front, server_timing=True)
+    else:
+        setup_app(front)
+
+    @front.get("/")
+    async def front_handler(request: Request) -> HTTPResponse:
+        res = await request.app.ctx.upstream.get("/")
+        return json(res.json())
+
+    return upstream, front
+
+
+def test_request_id_and_server_timing():
+    upstream, front = _make_apps(True)
+
+    async def run():
+        async with _serve(upstream) as upstream_client, _serve(front) as client:
+            front.ctx.upstream = instrument_httpx_client(upstream_client)
+            res = await client.get("/", headers={"X-Request-ID": "req-1"})
+            res_new = await client.get("/")
+        return res, res_new
+
+    res, res_new = asyncio.run(run())
+    assert res.headers["x-request-id"] == "req-1"
+    assert res.json() == {"request_id": "req-1"}
+    timing = res.headers["server-timing"]
+    assert timing.startswith("total;dur=")
+    assert "upstream;dur=" in timing
+    assert "upstreamtiming.total;dur=" in timing
+
+    request_id = res_new.headers["x-request-id"]
+    assert request_id and request_id != "req-1"
+    assert res_new.json() == {"request_id": request_id}
+
+
+def test_server_timing_disabled():
+    upstream, front = _make_apps(False)
+
+    async def run():
+        async with _serve(upstream) as upstream_client, _serve(front) as client:
+            front.ctx.upstream = instrument_httpx_client(upstream_client)
+            return await client.get("/")
+
+    res = asyncio.run(run())
+    assert "server-timing" not in res.headers
+    assert res.headers["x-request-id"]
+
+
+def test_database_per_worker(monkeypatch):
+    monkeypatch.setenv(WORKERS_ENV, "4")
+    app = Sanic("DatabaseWorkers", configure_logging=False)
+    app.config.TOUCHUP = False
+    setup_app(app)
+    setup_database(
+        app, "postgresql+asyncpg:///test", DatabaseConfig(pool_size=10, max_overflow=10)
+    )
+    assert not hasattr(app.ctx, "db_engine")
+
+    async def run():
+        async with _serve(app):
+            return app.ctx.db_engine.pool
+
+    pool = asyncio.run(run())
+    assert pool.size() == 3
+
+
+def test_metrics_several_workers(monkeypatch):
+    monkeypatch.setenv(WORKERS_ENV, "2")
+    app = Sanic("MetricsWorkers", configure_logging=False)
+    app.config.TOUCHUP = False
+    with pytest.raises(ValueError):
+        setup_app(app, metrics=True)
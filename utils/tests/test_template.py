@@ -1,12 +1,17 @@
+from pathlib import Path
+
 import jinja2
 import pytest
 from cattrs import Converter
 from cattrs.preconf.orjson import make_converter
 from oes.utils.template import (
+    TEMPLATE_CACHE_DIR_ENV,
     Expression,
     Template,
+    make_bytecode_cache,
     make_expression_structure_fn,
     make_template_structure_fn,
+    record_compile_times,
     unstructure_expression,
     unstructure_template,
 )
@@ -31,9 +36,65 @@ def test_template(converter: Converter):
     assert to_str == "value: {{ a }}"
 
 
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("plain text", True),
+        ("", True),
+        ("value: {{ a }}", False),
+        ("{% if a %}a{% endif %}", False),
+        ("{# comment #}", False),
+    ],
+)
+def test_template_is_static(source: str, expected: bool):
+    template = Template(source, jinja2.Environment())
+    assert template.is_static is expected
+
+
 def test_expression(converter: Converter):
     expr = converter.structure("a + b", Expression)
     result = expr.evaluate({"a": 1, "b": 2})
     assert result == 3
     to_str = converter.unstructure(expr)
     assert to_str == "a + b"
+
+
+def test_bytecode_cache(tmp_path: Path):
+    env = jinja2.Environment(bytecode_cache=make_bytecode_cache(tmp_path))
+    with record_compile_times() as times:
+        Expression("a + b", env)
+        Template("value: {{ a }}", env)
+        expr = Expression("a + b", env)
+        template = Template("value: {{ a }}", env)
+
+    assert [(t.kind, t.cached) for t in times] == [
+        ("expression", False),
+        ("template", False),
+        ("expression", True),
+        ("template", True),
+    ]
+    assert expr.evaluate({"a": 1, "b": 2}) == 3
+    assert template.render({"a": "rendered"}) == "value: rendered"
+
+
+def test_bytecode_cache_not_configured(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(TEMPLATE_CACHE_DIR_ENV, raising=False)
+    assert make_bytecode_cache() is None
+
+
+def test_pickle(tmp_path: Path):
+    env = jinja2.Environment()
+    expr = Expression("a + b", env)
+    template = Template("value: {{ a }}", env)
+    # environments are not picklable on their own
+    expr_state = expr.__getstate__()
+    template_state = template.__getstate__()
+
+    loaded_expr = Expression.__new__(Expression)
+    loaded_expr.__setstate__(expr_state)
+    loaded_template = Template.__new__(Template)
+    loaded_template.__setstate__(template_state)
+
+    assert loaded_expr == expr
+    assert loaded_expr.evaluate({"a": 1, "b": 2}) == 3
+    assert loaded_template.render({"a": "rendered"}) == "value: rendered"
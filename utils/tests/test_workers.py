@@ -0,0 +1,23 @@
+import pytest
+from oes.utils.workers import WORKERS_ENV, get_worker_count, per_worker
+
+
+@pytest.mark.parametrize(
+    "workers, total, expected",
+    [
+        ("1", 10, 10),
+        ("4", 10, 3),
+        ("4", 2, 1),
+        ("4", 0, 0),
+        ("4", -1, -1),
+        ("invalid", 10, 10),
+    ],
+)
+def test_per_worker(monkeypatch, workers: str, total: int, expected: int):
+    monkeypatch.setenv(WORKERS_ENV, workers)
+    assert per_worker(total) == expected
+
+
+def test_get_worker_count_default(monkeypatch):
+    monkeypatch.delenv(WORKERS_ENV, raising=False)
+    assert get_worker_count() == 1
@@ -0,0 +1 @@
+"""Web service benchmarks."""
@@ -0,0 +1,175 @@
+"""Combined deployment mode benchmark.
+
+Runs web service calls against stub cart, registration and payment apps, served
+over local TCP connections as in a normal deployment, and mounted in-process as in
+the combined mode, and reports the time per call.
+
+Run with ``python -m benchmarks.combined``.
+"""
+
+import argparse
+import asyncio
+import socket
+import time
+from collections.abc import Awaitable, Callable
+
+from oes.utils.asgi import ASGILifespan
+from oes.utils.http import make_http_client, mount_local_app, unmount_local_apps
+from oes.web.cart import CartService
+from oes.web.config import Config
+from oes.web.payment import PaymentService
+from oes.web.registration import RegistrationRenderCache, RegistrationService
+from sanic import HTTPResponse, Request, Sanic, json
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--registrations", type=int, default=20, help="registrations per response"
+    )
+    parser.add_argument("--count", type=int, default=200, help="calls per round")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds, best is shown")
+    args = parser.parse_args()
+
+    print(f"{args.registrations} registrations per response")
+    asyncio.run(bench_all(args))
+
+
+async def bench_all(args: argparse.Namespace):
+    """Run each call over TCP and in-process."""
+    names = ("cart", "registration", "payment")
+    ports = {name: _get_free_port() for name in names}
+    servers = []
+    for name in names:
+        app = make_app(f"{name.title()}TCP", args.registrations)
+        server = await app.create_server(
+            host="127.0.0.1",
+            port=ports[name],
+            return_asyncio_server=True,
+            access_log=False,
+        )
+        assert server is not None
+        await server.startup()
+        await server.start_serving()
+        servers.append(server)
+
+    tcp_config = Config(
+        cart_service_url=f"http://127.0.0.1:{ports['cart']}",
+        registration_service_url=f"http://127.0.0.1:{ports['registration']}",
+        payment_service_url=f"http://127.0.0.1:{ports['payment']}",
+    )
+    local_config = Config(
+        cart_service_url="http://cart:8000",
+        registration_service_url="http://registration:8000",
+        payment_service_url="http://payment:8000",
+    )
+    lifespans = []
+    for name in names:
+        app = make_app(f"{name.title()}Local", args.registrations)
+        lifespan = ASGILifespan(app)
+        await lifespan.start()
+        lifespans.append(lifespan)
+        mount_local_app(getattr(local_config, f"{name}_service_url"), app)
+
+    for mode, config in (("tcp", tcp_config), ("in-process", local_config)):
+        urls = (
+            config.cart_service_url,
+            config.registration_service_url,
+            config.payment_service_url,
+        )
+        client = make_http_client(config.http_client, urls)
+        registration_service = RegistrationService(
+            config, client, RegistrationRenderCache()
+        )
+        payment_service = PaymentService(
+            CartService(config, client), registration_service, client, config
+        )
+        await bench(
+            f"list registrations, {mode}",
+            lambda: registration_service.get_registrations("", event_id="event"),
+            args,
+        )
+        await bench(
+            f"payment options, {mode}",
+            lambda: payment_service.get_payment_options("cart", None),
+            args,
+        )
+        await client.aclose()
+
+    unmount_local_apps()
+    for lifespan in lifespans:
+        await lifespan.stop()
+    for server in servers:
+        await server.close()
+
+
+async def bench(
+    name: str, fn: Callable[[], Awaitable[object]], args: argparse.Namespace
+):
+    """Time ``fn`` and print the best time per call."""
+    await fn()
+    best = float("inf")
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        for _ in range(args.count):
+            await fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<40} {best / args.count * 1000:8.3f} ms")
+
+
+def make_app(name: str, registrations: int) -> Sanic:
+    """Make a stub upstream app."""
+    app = Sanic(name, configure_logging=False)
+    app.config.TOUCHUP = False
+    app.config.CORS = False
+    registration_list = {
+        "registrations": [
+            {
+                "registration": {
+                    "id": f"reg-{i}",
+                    "event_id": "event",
+                    "status": "created",
+                    "version": 1,
+                    "first_name": "First",
+                    "last_name": "Last",
+                    "email": f"user{i}@example.com",
+                },
+            }
+            for i in range(registrations)
+        ]
+    }
+    cart = {
+        "cart": {
+            "event_id": "event",
+            "registrations": [{"id": "reg", "new": {"id": "reg"}, "meta": {}}],
+        }
+    }
+
+    @app.get("/events/<event_id>/registrations")
+    async def list_registrations(request: Request, event_id: str) -> HTTPResponse:
+        return json(registration_list)
+
+    @app.get("/carts/<cart_id>")
+    async def read_cart(request: Request, cart_id: str) -> HTTPResponse:
+        return json(cart)
+
+    @app.get("/carts/<cart_id>/pricing-result")
+    async def read_pricing_result(request: Request, cart_id: str) -> HTTPResponse:
+        return json({"total_price": 0})
+
+    @app.post("/payment-methods")
+    async def list_payment_methods(request: Request) -> HTTPResponse:
+        return json([{"id": "cash", "name": "Cash"}])
+
+    return app
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Upstream fan-out benchmark.
+
+Runs the payment flows against a stub upstream that adds a fixed latency to every
+request, with sequential upstream calls and with concurrent ones, and reports the
+end-to-end time per flow. Access code registrations are fetched one at a time,
+concurrently, and with a single bulk read.
+
+Run with ``python -m benchmarks.fanout``.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from typing import Any
+
+import httpx
+import orjson
+from oes.web.access_code import AccessCode, AccessCodeOptions, AccessCodeService
+from oes.web.cart import CartService
+from oes.web.concurrency import gather_limited
+from oes.web.config import Config
+from oes.web.payment import PaymentService
+from oes.web.registration import RegistrationRenderCache, RegistrationService
+from oes.web.selfservice import SelfServiceService
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--latency", type=float, default=20, help="upstream latency in ms"
+    )
+    parser.add_argument(
+        "--registrations", type=int, default=8, help="access code registrations"
+    )
+    parser.add_argument("--count", type=int, default=10, help="flows per round")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds, best is shown")
+    args = parser.parse_args()
+
+    print(
+        f"{args.latency:.0f} ms upstream latency, "
+        f"{args.registrations} access code registrations"
+    )
+    asyncio.run(bench_all(args))
+
+
+async def bench_all(args: argparse.Namespace):
+    """Run each flow sequentially and concurrently."""
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(make_handler(args.latency / 1000)),
+        base_url="http://upstream",
+    )
+    urls = {
+        "cart_service_url": "http://cart",
+        "payment_service_url": "http://payment",
+        "registration_service_url": "http://registration",
+    }
+    sequential = Config(upstream_concurrency=1, **urls)
+    concurrent = Config(**urls)
+    access_code = make_access_code(args.registrations)
+
+    for name, config, payment_cls in (
+        ("sequential", sequential, SequentialPaymentService),
+        ("concurrent", concurrent, PaymentService),
+    ):
+        registration_service = RegistrationService(
+            config, client, RegistrationRenderCache()
+        )
+        payment_service = payment_cls(
+            CartService(config, client), registration_service, client, config
+        )
+        await bench(
+            f"payment options, {name}",
+            lambda: payment_service.get_payment_options("cart", None),
+            args,
+        )
+        await bench(
+            f"create payment, {name}",
+            lambda: payment_service.create_payment("cart", "method", None, None),
+            args,
+        )
+
+    registration_service = RegistrationService(
+        concurrent, client, RegistrationRenderCache()
+    )
+    self_service = SelfServiceService(
+        concurrent, registration_service, AccessCodeService(concurrent, client)
+    )
+    ids = access_code.options.registration_ids
+    for name, limit in (
+        ("sequential", 1),
+        ("concurrent", concurrent.upstream_concurrency),
+    ):
+        await bench(
+            f"access code registrations, {name}",
+            lambda limit=limit: gather_limited(
+                (registration_service.get_registration("event", id) for id in ids),
+                limit=limit,
+            ),
+            args,
+        )
+    await bench(
+        "access code registrations, bulk",
+        lambda: self_service.get_registrations("event", None, None, access_code),
+        args,
+    )
+
+    await client.aclose()
+
+
+async def bench(
+    name: str, fn: Callable[[], Awaitable[object]], args: argparse.Namespace
+):
+    """Time ``fn`` and print the best time per call."""
+    best = float("inf")
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        for _ in range(args.count):
+            await fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<40} {best / args.count * 1000:8.1f} ms")
+
+
+class SequentialPaymentService(PaymentService):
+    """Payment service that fetches the cart and pricing result in turn."""
+
+    async def _get_cart_and_pricing_result(
+        self, cart_id: str
+    ) -> tuple[Mapping[str, Any] | None, Mapping[str, Any] | None]:
+        cart = await self.cart_service.get_cart(cart_id)
+        return cart, await self.cart_service.get_pricing_result(cart_id)
+
+
+def make_handler(
+    latency: float,
+) -> Callable[[httpx.Request], Awaitable[httpx.Response]]:
+    """Make a stub upstream handler that responds after ``latency`` seconds."""
+    cart = {
+        "cart": {
+            "event_id": "event",
+            "registrations": [{"id": "reg", "new": {"id": "reg"}, "meta": {}}],
+        }
+    }
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        host = request.url.host
+        path = request.url.path
+        if host == "cart" and path.endswith("/pricing-result"):
+            return httpx.Response(200, json={"total_price": 0})
+        elif host == "cart":
+            return httpx.Response(200, json=cart)
+        elif host == "registration" and path.endswith("/bulk-read"):
+            ids = orjson.loads(request.content)["ids"]
+            registrations = [
+                {"registration": {"id": id, "event_id": "event"}, "etag": 'W/"1"'}
+                for id in ids
+            ]
+            return httpx.Response(200, json={"registrations": registrations})
+        elif host == "registration" and "/registrations/" in path:
+            reg_id = path.rsplit("/", 1)[-1]
+            return httpx.Response(
+                200, json={"registration": {"id": reg_id, "event_id": "event"}}
+            )
+        elif path.endswith("/payment-methods"):
+            return httpx.Response(200, json=[])
+        else:
+            return httpx.Response(200, json={})
+
+    return handler
+
+
+def make_access_code(registrations: int) -> AccessCode:
+    """Make an access code for ``registrations`` registrations."""
+    now = datetime.now()
+    return AccessCode(
+        "code",
+        now,
+        now,
+        False,
+        "code",
+        AccessCodeOptions((), (), tuple(f"reg-{i}" for i in range(registrations))),
+        True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Combined deployment mode.
+
+Runs the cart, registration, payment and interview services in the web service's
+process. Requests from the web service to the other services are passed to their
+apps directly instead of over the network. Each service still loads its own config
+and needs its own database, redis or message queue.
+"""
+
+import importlib
+from collections.abc import Callable
+
+from loguru import logger
+from oes.utils.asgi import ASGILifespan
+from oes.utils.http import mount_local_app
+from oes.utils.sanic import run_server
+from sanic import Sanic
+
+__all__ = [
+    "COMBINED_SERVICES",
+    "create_app",
+    "main",
+]
+
+COMBINED_SERVICES = (
+    ("cart_service_url", "oes.cart.main:create_app"),
+    ("registration_service_url", "oes.registration.main:create_app"),
+    ("payment_service_url", "oes.payment.main:create_app"),
+    ("interview_service_url", "oes.interview.server.main:create_app"),
+)
+"""Pairs of the web config URL option and app factory of each combined service."""
+
+
+def main():
+    """CLI wrapper."""
+    run_server("oes-combined-service", "oes.web.combined.create_app")
+
+
+def create_app() -> Sanic:
+    """Combined app factory."""
+    from oes.web.main import create_app as create_web_app
+
+    app = create_web_app()
+    config = app.ctx.config
+    apps = [app]
+    services = []
+    for option, factory in COMBINED_SERVICES:
+        service_app = _import_factory(factory)()
+        mount_local_app(getattr(config, option), service_app)
+        apps.append(service_app)
+        services.append(ASGILifespan(service_app))
+
+    # touchup rewrites methods of the Sanic class for one app, which breaks others
+    for sanic_app in apps:
+        sanic_app.config.TOUCHUP = False
+
+    @app.before_server_start
+    async def start_services(app: Sanic):
+        for service in services:
+            await service.start()
+        names = ", ".join(a.name for a in apps[1:])
+        logger.info(f"Started combined services: {names}")
+
+    @app.after_server_stop
+    async def stop_services(app: Sanic):
+        for service in reversed(services):
+            await service.stop()
+
+    return app
+
+
+def _import_factory(name: str) -> Callable[[], Sanic]:
+    module_name, _, attr = name.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        raise RuntimeError(
+            f"Combined mode needs the {module_name.split('.')[1]} package: {e}"
+        ) from e
+    return getattr(module, attr)
@@ -0,0 +1,55 @@
+"""Concurrent upstream calls."""
+
+import asyncio
+import inspect
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[_T]],
+    *,
+    limit: int | None = None,
+    timeout: float | None = None,
+) -> list[_T]:
+    """Await the awaitables concurrently.
+
+    Args:
+        aws: The awaitables.
+        limit: The maximum number of awaitables to run at once.
+        timeout: The timeout in seconds for each awaitable.
+
+    Returns:
+        The results, in order.
+
+    Raises:
+        asyncio.TimeoutError: If an awaitable times out.
+    """
+    aws = list(aws)
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    tasks = [asyncio.ensure_future(_run(aw, semaphore, timeout)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # close coroutines that were still waiting for a slot
+        for aw in aws:
+            if (
+                inspect.iscoroutine(aw)
+                and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED
+            ):
+                aw.close()
+        raise
+
+
+async def _run(
+    aw: Awaitable[_T], semaphore: asyncio.Semaphore | None, timeout: float | None
+) -> _T:
+    if semaphore is None:
+        return await asyncio.wait_for(aw, timeout)
+    async with semaphore:
+        return await asyncio.wait_for(aw, timeout)
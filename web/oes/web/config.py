@@ -1,5 +1,6 @@
 """Configuration module."""
 
+import functools
 from collections.abc import Mapping, Sequence
 from datetime import date
 from typing import Any, TypeAlias, cast
@@ -8,6 +9,7 @@ import typed_settings as ts
 from attrs import Factory, field, frozen
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from oes.utils.config import get_loaders
+from oes.utils.http import HTTPClientConfig
 from oes.utils.logic import (
     LogicAnd,
     LogicOr,
@@ -21,6 +23,7 @@ from oes.utils.template import (
     Expression,
     Template,
     TemplateContext,
+    make_bytecode_cache,
     make_expression_structure_fn,
     make_template_structure_fn,
     template_filter_date,
@@ -28,9 +31,12 @@ from oes.utils.template import (
     template_fn_get_now,
 )
 
+CONFIG_FILE = "events.yml"
+"""The default config file."""
+
 dt_date: TypeAlias = date
 
-jinja2_env = ImmutableSandboxedEnvironment()
+jinja2_env = ImmutableSandboxedEnvironment(bytecode_cache=make_bytecode_cache())
 jinja2_env.globals["get_now"] = template_fn_get_now
 jinja2_env.filters["datetime"] = template_filter_datetime
 jinja2_env.filters["date"] = template_filter_date
@@ -105,7 +111,14 @@ class Event:
     admin: AdminConfig = AdminConfig()
 
     def get_template_context(self) -> TemplateContext:
-        """Get the template context for evaluating conditions."""
+        """Get the template context for evaluating conditions.
+
+        The context is created once and shared, it must not be modified.
+        """
+        return self._template_context
+
+    @functools.cached_property
+    def _template_context(self) -> TemplateContext:
         return {
             "id": self.id,
             "date": self.date,
@@ -136,7 +149,26 @@ class Config:
     interview_service_url: str = ts.option(
         default="http://interview:8000", help="the interview service url"
     )
+    upstream_concurrency: int = ts.option(
+        default=8, help="maximum concurrent upstream requests per request"
+    )
+    upstream_timeout: float = ts.option(
+        default=10.0, help="timeout in seconds for each upstream request"
+    )
+    render_cache_size: int = ts.option(
+        default=4096, help="maximum cached registration summaries and display data"
+    )
     events: _EventsMapping = ts.option(factory=_EventsMapping)
+    metrics: bool = ts.option(default=False, help="expose metrics at /metrics")
+    http_client: HTTPClientConfig = ts.option(
+        factory=HTTPClientConfig, help="upstream HTTP client settings"
+    )
+    server_timing: bool = ts.option(
+        default=False, help="send Server-Timing headers with upstream timings"
+    )
+    config_watch_interval: float | None = ts.option(
+        default=None, help="interval in seconds to check the config for changes"
+    )
 
 
 def _structure_events(v: Any, t: Any) -> _EventsMapping:
@@ -163,7 +195,7 @@ _converter.register_unstructure_hook(LogicAnd, make_logic_unstructure_fn(_conver
 _converter.register_unstructure_hook(LogicOr, make_logic_unstructure_fn(_converter))
 
 
-def get_config(config_file: str = "events.yml") -> Config:
+def get_config(config_file: str = CONFIG_FILE) -> Config:
     """Get the config."""
     return ts.load_settings(
         Config,
@@ -1,14 +1,17 @@
 """Main entry points."""
 
-import os
-import sys
+import asyncio
+from pathlib import Path
 
-import httpx
 from cattrs.gen import make_dict_unstructure_fn
 from oes.utils import configure_converter, setup_logging
-from oes.utils.sanic import setup_app
-from oes.web.config import get_config
-from oes.web.routes.common import response_converter
+from oes.utils.config import get_config_files
+from oes.utils.http import make_http_client
+from oes.utils.reload import ConfigReloader
+from oes.utils.sanic import run_server, setup_app, setup_config_reload
+from oes.utils.template import log_compile_times, record_compile_times
+from oes.web.config import CONFIG_FILE, Config, get_config
+from oes.web.routes.common import handle_upstream_timeout, response_converter
 from sanic import Sanic
 from sanic.worker.manager import WorkerManager
 
@@ -17,13 +20,7 @@ WorkerManager.THRESHOLD = 1200  # type: ignore
 
 def main():
     """CLI wrapper."""
-    os.execlp(
-        "sanic",
-        "oes-web-service",
-        "--single-process",
-        "oes.web.main.create_app",
-        *sys.argv[1:]
-    )
+    run_server("oes-web-service", "oes.web.main.create_app")
 
 
 def create_app() -> Sanic:
@@ -32,14 +29,16 @@ def create_app() -> Sanic:
     from oes.web.cart import CartService
     from oes.web.interview import InterviewService
     from oes.web.payment import PaymentService
-    from oes.web.registration import RegistrationService
+    from oes.web.registration import RegistrationRenderCache, RegistrationService
     from oes.web.routes import admin, cart, event, payment, registration, selfservice
     from oes.web.selfservice import SelfServiceService
 
-    config = get_config()
+    setup_logging()
+    with record_compile_times() as compile_times:
+        config = get_config()
+    log_compile_times(compile_times)
     app = Sanic("Web", configure_logging=False)
     app.config.PROXIES_COUNT = 1
-    setup_logging()
 
     configure_converter(response_converter.converter)
     response_converter.converter.register_unstructure_hook(
@@ -51,7 +50,13 @@ def create_app() -> Sanic:
         ),
     )
 
-    setup_app(app, config, response_converter.converter)
+    setup_app(
+        app,
+        config,
+        response_converter.converter,
+        metrics=config.metrics,
+        server_timing=config.server_timing,
+    )
 
     app.blueprint(event.routes)
     app.blueprint(cart.routes)
@@ -59,9 +64,10 @@ def create_app() -> Sanic:
     app.blueprint(registration.routes)
     app.blueprint(selfservice.routes)
     app.blueprint(admin.routes)
+    app.exception(asyncio.TimeoutError)(handle_upstream_timeout)
 
-    app.ctx.config = config
-    app.ext.dependency(config)
+    render_cache = RegistrationRenderCache(config.render_cache_size)
+    app.ext.dependency(render_cache)
     app.ext.add_dependency(RegistrationService)
     app.ext.add_dependency(InterviewService)
     app.ext.add_dependency(CartService)
@@ -69,13 +75,36 @@ def create_app() -> Sanic:
     app.ext.add_dependency(AccessCodeService)
     app.ext.add_dependency(SelfServiceService)
 
+    def apply_config(new_config: Config):
+        app.ctx.config = new_config
+        render_cache.clear()
+
+    setup_config_reload(
+        app,
+        ConfigReloader(
+            "web",
+            _load_config,
+            apply_config,
+            get_config_files((CONFIG_FILE,)),
+            watch_interval=config.config_watch_interval,
+        ),
+    )
+
     @app.before_server_start
     async def setup_log(app: Sanic):
         setup_logging(app.debug)
 
     @app.before_server_start
     async def setup_httpx(app: Sanic):
-        client = httpx.AsyncClient()
+        client = make_http_client(
+            config.http_client,
+            (
+                config.cart_service_url,
+                config.payment_service_url,
+                config.registration_service_url,
+                config.interview_service_url,
+            ),
+        )
         app.ctx.httpx = client
         app.ext.dependency(client)
 
@@ -84,3 +113,10 @@ def create_app() -> Sanic:
         await app.ctx.httpx.aclose()
 
     return app
+
+
+def _load_config() -> tuple[Config, list[Path]]:
+    with record_compile_times() as compile_times:
+        config = get_config()
+    log_compile_times(compile_times)
+    return config, get_config_files((CONFIG_FILE,))
@@ -1,10 +1,12 @@
 """Payment service."""
 
+import asyncio
 from collections.abc import Mapping, Sequence
 from typing import Any
 
 import httpx
 from oes.web.cart import CartService
+from oes.web.concurrency import gather_limited
 from oes.web.config import Config
 from oes.web.registration import RegistrationService
 
@@ -30,10 +32,9 @@ class PaymentService:
         user_role: str | None,
     ) -> Sequence[Mapping[str, Any]] | None:
         """Get payment options."""
-        cart = await self.cart_service.get_cart(cart_id)
+        cart, pricing_result = await self._get_cart_and_pricing_result(cart_id)
         if not cart:
             return None
-        pricing_result = await self.cart_service.get_pricing_result(cart_id)
         cart_data = cart.get("cart")
         headers = {}
 
@@ -67,10 +68,9 @@ class PaymentService:
         Returns:
             A pair of a status code and body, or None if not found.
         """
-        cart = await self.cart_service.get_cart(cart_id)
+        cart, pricing_result = await self._get_cart_and_pricing_result(cart_id)
         if not cart:
             return None
-        pricing_result = await self.cart_service.get_pricing_result(cart_id)
         cart_data = cart.get("cart", {})
         updated_data = [r["new"] for r in cart_data["registrations"]]
         access_codes = {
@@ -87,8 +87,11 @@ class PaymentService:
             "pricing_result": pricing_result,
         }
 
-        check_res, check_body = await self.registration_service.check_batch_change(
-            cart_data.get("event_id", ""), updated_data, access_codes
+        check_res, check_body = await asyncio.wait_for(
+            self.registration_service.check_batch_change(
+                cart_data.get("event_id", ""), updated_data, access_codes
+            ),
+            self.config.upstream_timeout,
         )
         if check_res != 200:
             return check_res, check_body
@@ -143,3 +146,15 @@ class PaymentService:
             cart_data.get("event_id", ""), updated_data, access_codes, payment_id, body
         )
         return apply_res, apply_body
+
+    async def _get_cart_and_pricing_result(
+        self, cart_id: str
+    ) -> tuple[Mapping[str, Any] | None, Mapping[str, Any] | None]:
+        cart, pricing_result = await gather_limited(
+            (
+                self.cart_service.get_cart(cart_id),
+                self.cart_service.get_pricing_result(cart_id),
+            ),
+            timeout=self.config.upstream_timeout,
+        )
+        return cart, pricing_result
@@ -1,13 +1,24 @@
 """Registration module."""
 
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Any, Literal, cast
+import time
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from contextlib import asynccontextmanager
+from typing import Any, Literal, TypeVar, cast
 
 import httpx
 import nanoid
 import orjson
 from attrs import frozen
-from oes.utils.logic import evaluate
+from oes.utils.logic import evaluate_condition
+from oes.web.concurrency import gather_limited
 from oes.web.config import AdminInterviewOption, Config
 from oes.web.types import JSON
 from typing_extensions import Self
@@ -15,6 +26,17 @@ from typing_extensions import Self
 REGISTRATION_ID_LENGTH = 14
 """Length of a registration ID."""
 
+DEFAULT_RENDER_CACHE_SIZE = 4096
+"""Default maximum number of cached rendered values."""
+
+DEFAULT_RENDER_CACHE_TTL = 300.0
+"""Default time to cache rendered values, in seconds."""
+
+BULK_READ_MAX_IDS = 100
+"""Maximum number of IDs per registration service bulk read request."""
+
+_T = TypeVar("_T")
+
 
 @frozen
 class InterviewOption:
@@ -95,12 +117,55 @@ class Registration(dict[str, Any]):
         )
 
 
+class RegistrationRenderCache:
+    """Bounded cache of values rendered from registrations.
+
+    Entries are keyed by the registration ID and version, so a changed
+    registration is rendered again. Entries also expire after ``ttl`` seconds, for
+    templates that depend on the current time.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_RENDER_CACHE_SIZE,
+        ttl: float = DEFAULT_RENDER_CACHE_TTL,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, render: Callable[[], _T]) -> _T:
+        """Get the cached value for ``key``, or call ``render`` and cache it."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            return entry[1]
+        value = render()
+        if self.max_size > 0:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+
 class RegistrationService:
     """Registration service."""
 
-    def __init__(self, config: Config, client: httpx.AsyncClient):
+    def __init__(
+        self,
+        config: Config,
+        client: httpx.AsyncClient,
+        render_cache: RegistrationRenderCache,
+    ):
         self.config = config
         self.client = client
+        self.render_cache = render_cache
 
     async def get_registrations(
         self,
@@ -136,6 +201,26 @@ class RegistrationService:
         res = await self.get_registration_with_etag(event_id, registration_id)
         return res[0]
 
+    async def get_registrations_by_id(
+        self, event_id: str, registration_ids: Iterable[str]
+    ) -> Sequence[tuple[Registration, str]]:
+        """Get registrations by ID from the registration service, with their ETags.
+
+        Registrations that are not found are omitted.
+        """
+        ids = list(registration_ids)
+        if not ids:
+            return ()
+        chunks = [
+            ids[i : i + BULK_READ_MAX_IDS]
+            for i in range(0, len(ids), BULK_READ_MAX_IDS)
+        ]
+        results = await gather_limited(
+            (self._bulk_read(event_id, chunk) for chunk in chunks),
+            limit=self.config.upstream_concurrency,
+        )
+        return [r for result in results for r in result]
+
     async def get_registration_with_etag(
         self, event_id: str, registration_id: str
     ) -> tuple[Registration | None, str | None]:
@@ -155,33 +240,22 @@ class RegistrationService:
     def get_registration_summary(self, registration: Registration) -> str | None:
         """Get a registration summary."""
         # TODO: user info?
-        event = self.config.events.get(registration.event_id)
-        if not event:
-            return None
-        ctx = {
-            "event": event.get_template_context(),
-            "registration": dict(registration),
-        }
-        return (
-            event.admin.registration_summary.render(ctx)
-            if event.admin.registration_summary
-            else None
+        return self.render_cache.get(
+            ("summary", registration.event_id, registration.id, registration.version),
+            lambda: self._render_summary(registration),
         )
 
     def get_display_data(self, registration: Registration) -> Sequence[tuple[str, str]]:
         """Get display data for a registration."""
-        event = self.config.events.get(registration.event_id)
-        if not event:
-            return ()
-        ctx = {
-            "event": event.get_template_context(),
-            "registration": dict(registration),
-        }
-        entries = (
-            (d[0], str(d[1].render(ctx)) if d[1] else None)
-            for d in event.admin.display_data
+        return self.render_cache.get(
+            (
+                "display_data",
+                registration.event_id,
+                registration.id,
+                registration.version,
+            ),
+            lambda: self._render_display_data(registration),
         )
-        return cast(tuple[tuple[str, str], ...], tuple(e for e in entries if e[1]))
 
     def get_admin_add_options(
         self, event_id: str, user_role: str | None
@@ -195,15 +269,18 @@ class RegistrationService:
             "event": event.get_template_context(),
         }
         for opt in event.admin.add_options:
-            if evaluate(opt.when, ctx):
+            if evaluate_condition(opt.when, ctx):
                 yield opt
 
     def get_admin_change_options(
         self, registration: Registration, user_role: str | None
     ) -> Sequence[AdminInterviewOption]:
-        """Get admin change options for a registration."""
+        """Get admin change options for a registration.
+
+        These are not cached, since their conditions may depend on the time.
+        """
         event = self.config.events.get(registration.event_id)
-        if not event:
+        if not event or not event.admin.change_options:
             return ()
         ctx = {
             "user": {
@@ -212,7 +289,9 @@ class RegistrationService:
             "event": event.get_template_context(),
             "registration": dict(registration),
         }
-        return tuple(o for o in event.admin.change_options if evaluate(o.when, ctx))
+        return tuple(
+            o for o in event.admin.change_options if evaluate_condition(o.when, ctx)
+        )
 
     async def check_batch_change(
         self,
@@ -274,28 +353,79 @@ class RegistrationService:
         )
         return res.status_code, res.json()
 
-    async def proxy_registration_request(
+    @asynccontextmanager
+    async def stream_registration_request(
         self,
         method: str,
         path: str,
-        body: JSON | None = None,
+        body: bytes | None = None,
         if_match: str | None = None,
-    ) -> tuple[int, JSON | None, str | None]:
-        """Proxy a request to the registration service."""
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a request to the registration service and stream the response.
+
+        The request body is sent as-is and the response body is not read.
+        """
         headers = {}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
         if if_match:
             headers["If-Match"] = if_match
-        res = await self.client.request(
+        req = self.client.build_request(
             method,
             f"{self.config.registration_service_url}{path}",
-            json=body,
+            content=body,
             headers=headers,
         )
-        if res.status_code == 204:
-            body = None
-        else:
-            body = res.json()
-        return res.status_code, body, res.headers.get("ETag")
+        res = await self.client.send(req, stream=True)
+        try:
+            yield res
+        finally:
+            await res.aclose()
+
+    async def _bulk_read(
+        self, event_id: str, ids: Sequence[str]
+    ) -> list[tuple[Registration, str]]:
+        url = (
+            f"{self.config.registration_service_url}/events"
+            f"/{event_id}/registrations/bulk-read"
+        )
+        res = await self.client.post(
+            url,
+            content=orjson.dumps({"ids": ids}),
+            headers={"Content-Type": "application/json"},
+        )
+        res.raise_for_status()
+        resp_body = res.json()
+        return [
+            (Registration(r["registration"]), r["etag"])
+            for r in resp_body["registrations"]
+        ]
+
+    def _render_summary(self, registration: Registration) -> str | None:
+        event = self.config.events.get(registration.event_id)
+        if not event or not event.admin.registration_summary:
+            return None
+        ctx = {
+            "event": event.get_template_context(),
+            "registration": dict(registration),
+        }
+        return event.admin.registration_summary.render(ctx)
+
+    def _render_display_data(
+        self, registration: Registration
+    ) -> Sequence[tuple[str, str]]:
+        event = self.config.events.get(registration.event_id)
+        if not event or not event.admin.display_data:
+            return ()
+        ctx = {
+            "event": event.get_template_context(),
+            "registration": dict(registration),
+        }
+        entries = (
+            (d[0], str(d[1].render(ctx)) if d[1] else None)
+            for d in event.admin.display_data
+        )
+        return cast(tuple[tuple[str, str], ...], tuple(e for e in entries if e[1]))
 
 
 def make_new_registration(
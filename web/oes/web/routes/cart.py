@@ -59,9 +59,11 @@ async def add_to_cart_from_interview(
 async def _get_registrations(
     registration_service: RegistrationService, event_id: str, ids: Iterable[str]
 ) -> Mapping[str, Registration]:
-    tasks = [registration_service.get_registration(event_id, id) for id in ids]
-    res = await asyncio.gather(*tasks)
-    by_id = {r.id: r for r in res if r is not None}
+    res = await asyncio.wait_for(
+        registration_service.get_registrations_by_id(event_id, ids),
+        registration_service.config.upstream_timeout,
+    )
+    by_id = {r.id: r for r, _ in res}
     return by_id
 
 
@@ -2,6 +2,7 @@
 
 from attrs import frozen
 from oes.utils.response import ResponseConverter
+from sanic import HTTPResponse, Request
 from sanic.exceptions import HTTPException
 
 response_converter = ResponseConverter()
@@ -14,6 +15,20 @@ class Conflict(HTTPException):
     quiet = True
 
 
+class GatewayTimeout(HTTPException):
+    """Upstream timeout error."""
+
+    status_code = 504
+    quiet = True
+
+
+def handle_upstream_timeout(request: Request, exc: Exception) -> HTTPResponse:
+    """Respond with a :class:`GatewayTimeout` error to an upstream timeout."""
+    return request.app.error_handler.default(
+        request, GatewayTimeout("Upstream service timed out")
+    )
+
+
 @frozen
 class InterviewStateRequestBody:
     """Interview state request body."""
@@ -4,9 +4,10 @@ from datetime import date as dt_date
 
 from attrs import frozen
 from oes.utils.request import raise_not_found
-from oes.web.config import Config, Event
+from oes.utils.response import CachedResponse
+from oes.web.config import Config
 from oes.web.routes.common import response_converter
-from sanic import Blueprint, Request
+from sanic import Blueprint, HTTPResponse, Request
 
 routes = Blueprint("events")
 
@@ -24,14 +25,43 @@ class EventResponse:
 
 
 @routes.get("/events")
-@response_converter(list[EventResponse])
-async def list_events(request: Request, config: Config) -> list[Event]:
+async def list_events(request: Request, config: Config) -> HTTPResponse:
     """List events."""
-    return sorted(config.events.values(), key=lambda e: e.date, reverse=True)
+    return get_event_listings(config).events.make_response(request)
 
 
 @routes.get("/events/<event_id>")
-@response_converter(EventResponse)
-async def read_event(request: Request, event_id: str, config: Config) -> Event:
+async def read_event(request: Request, event_id: str, config: Config) -> HTTPResponse:
     """Read an event."""
-    return raise_not_found(config.events.get(event_id))
+    event = raise_not_found(get_event_listings(config).event.get(event_id))
+    return event.make_response(request)
+
+
+class EventListings:
+    """Pre-serialized event responses for a config."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        events = sorted(config.events.values(), key=lambda e: e.date, reverse=True)
+        dump_list = response_converter.get_dumper(list[EventResponse])
+        dump_event = response_converter.get_dumper(EventResponse)
+        self.events = CachedResponse.create(dump_list(events))
+        self.self_service_events = CachedResponse.create(
+            dump_list([e for e in events if e.visible])
+        )
+        self.event = {e.id: CachedResponse.create(dump_event(e)) for e in events}
+
+
+def get_event_listings(config: Config) -> EventListings:
+    """Get the event listings for ``config``.
+
+    The listings are built on first use, and again when the config changes.
+    """
+    global _listings
+    listings = _listings
+    if listings is None or listings.config is not config:
+        listings = _listings = EventListings(config)
+    return listings
+
+
+_listings: EventListings | None = None
@@ -2,6 +2,7 @@
 
 from collections.abc import Sequence
 
+import orjson
 from attrs import frozen
 from oes.utils.request import CattrsBody, raise_not_found
 from oes.web.interview import InterviewService, get_interview_registrations
@@ -108,23 +109,13 @@ async def create_registration(
     registration_service: RegistrationService,
 ) -> HTTPResponse:
     """Create a registration."""
-    body = request.json
-    status, resp, etag = await registration_service.proxy_registration_request(
+    return await _proxy_registration_request(
+        request,
+        registration_service,
         "POST",
         f"/events/{event_id}/registrations",
-        body,
+        body=request.body or None,
     )
-    if resp is None:
-        return HTTPResponse(status=status)
-    elif status != 200:
-        return json(resp, status)
-    else:
-        reg = Registration(resp["registration"])
-        reg_body = response_converter.converter.unstructure(
-            _make_registration_response(request, reg, registration_service)
-        )
-        headers = {"ETag": etag} if etag else {}
-        return json(reg_body, headers=headers)
 
 
 @routes.get("/events/<event_id>/registrations/<registration_id>")
@@ -155,22 +146,14 @@ async def update_registration(
     registration_service: RegistrationService,
 ) -> HTTPResponse:
     """Update a registration."""
-    body = request.json
-    if_match = request.headers.get("If-Match")
-    status, resp, etag = await registration_service.proxy_registration_request(
-        "PUT", f"/events/{event_id}/registrations/{registration_id}", body, if_match
+    return await _proxy_registration_request(
+        request,
+        registration_service,
+        "PUT",
+        f"/events/{event_id}/registrations/{registration_id}",
+        body=request.body or None,
+        if_match=request.headers.get("If-Match"),
     )
-    if resp is None:
-        return HTTPResponse(status=status)
-    elif status != 200:
-        return json(resp, status)
-    else:
-        reg = Registration(resp["registration"])
-        reg_body = response_converter.converter.unstructure(
-            _make_registration_response(request, reg, registration_service)
-        )
-        headers = {"ETag": etag} if etag else {}
-        return json(reg_body, headers=headers)
 
 
 @routes.put("/events/<event_id>/registrations/<registration_id>/complete")
@@ -181,20 +164,12 @@ async def complete_registration(
     registration_service: RegistrationService,
 ) -> HTTPResponse:
     """Complete a registration."""
-    status, resp, etag = await registration_service.proxy_registration_request(
-        "PUT", f"/events/{event_id}/registrations/{registration_id}/complete"
+    return await _proxy_registration_request(
+        request,
+        registration_service,
+        "PUT",
+        f"/events/{event_id}/registrations/{registration_id}/complete",
     )
-    if resp is None:
-        return HTTPResponse(status=status)
-    elif status != 200:
-        return json(resp, status)
-    else:
-        reg = Registration(resp["registration"])
-        reg_body = response_converter.converter.unstructure(
-            _make_registration_response(request, reg, registration_service)
-        )
-        headers = {"ETag": etag} if etag else {}
-        return json(reg_body, headers=headers)
 
 
 @routes.put("/events/<event_id>/registrations/<registration_id>/cancel")
@@ -205,20 +180,12 @@ async def cancel_registration(
     registration_service: RegistrationService,
 ) -> HTTPResponse:
     """Complete a registration."""
-    status, resp, etag = await registration_service.proxy_registration_request(
-        "PUT", f"/events/{event_id}/registrations/{registration_id}/cancel"
+    return await _proxy_registration_request(
+        request,
+        registration_service,
+        "PUT",
+        f"/events/{event_id}/registrations/{registration_id}/cancel",
     )
-    if resp is None:
-        return HTTPResponse(status=status)
-    elif status != 200:
-        return json(resp, status)
-    else:
-        reg = Registration(resp["registration"])
-        reg_body = response_converter.converter.unstructure(
-            _make_registration_response(request, reg, registration_service)
-        )
-        headers = {"ETag": etag} if etag else {}
-        return json(reg_body, headers=headers)
 
 
 @routes.put("/events/<event_id>/registrations/<registration_id>/assign-number")
@@ -229,20 +196,47 @@ async def assign_number_to_registration(
     registration_service: RegistrationService,
 ) -> HTTPResponse:
     """Complete a registration."""
-    status, resp, etag = await registration_service.proxy_registration_request(
-        "PUT", f"/events/{event_id}/registrations/{registration_id}/assign-number"
+    return await _proxy_registration_request(
+        request,
+        registration_service,
+        "PUT",
+        f"/events/{event_id}/registrations/{registration_id}/assign-number",
     )
-    if resp is None:
-        return HTTPResponse(status=status)
-    elif status != 200:
-        return json(resp, status)
-    else:
-        reg = Registration(resp["registration"])
-        reg_body = response_converter.converter.unstructure(
-            _make_registration_response(request, reg, registration_service)
-        )
+
+
+async def _proxy_registration_request(
+    request: Request,
+    registration_service: RegistrationService,
+    method: str,
+    path: str,
+    *,
+    body: bytes | None = None,
+    if_match: str | None = None,
+) -> HTTPResponse:
+    async with registration_service.stream_registration_request(
+        method, path, body, if_match
+    ) as res:
+        etag = res.headers.get("ETag")
         headers = {"ETag": etag} if etag else {}
-        return json(reg_body, headers=headers)
+        if res.status_code == 200:
+            # successful responses include the summary and options
+            resp_body = orjson.loads(await res.aread())
+            reg = Registration(resp_body["registration"])
+            response = response_converter.make_response(
+                _make_registration_response(request, reg, registration_service)
+            )
+            response.headers.update(headers)
+            return response
+        elif res.status_code == 204:
+            return HTTPResponse(status=204)
+
+        # pass other responses through without decoding them
+        return HTTPResponse(
+            await res.aread(),
+            status=res.status_code,
+            headers=headers,
+            content_type=res.headers.get("Content-Type", "application/json"),
+        )
 
 
 def _make_registration_response(
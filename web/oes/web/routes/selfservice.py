@@ -7,13 +7,13 @@ from oes.utils.request import raise_not_found
 from oes.utils.template import TemplateContext
 from oes.web.access_code import AccessCodeService
 from oes.web.cart import CartService
-from oes.web.config import Config, Event, RegistrationDisplay
+from oes.web.config import Config, RegistrationDisplay
 from oes.web.interview import InterviewService, InterviewState
 from oes.web.registration import InterviewOption, Registration, RegistrationService
 from oes.web.routes.common import response_converter
-from oes.web.routes.event import EventResponse
+from oes.web.routes.event import get_event_listings
 from oes.web.selfservice import SelfServiceService, get_interview_data, get_option
-from sanic import Blueprint, Forbidden, NotFound, Request
+from sanic import Blueprint, Forbidden, HTTPResponse, NotFound, Request
 from typing_extensions import Self
 
 routes = Blueprint("selfservice")
@@ -113,14 +113,9 @@ class SelfServiceAddToCartRequest:
 
 
 @routes.get("/self-service/events")
-@response_converter(list[EventResponse])
-async def list_selfservice_events(request: Request, config: Config) -> list[Event]:
+async def list_selfservice_events(request: Request, config: Config) -> HTTPResponse:
     """List self-service events."""
-    return sorted(
-        (e for e in config.events.values() if e.visible),
-        key=lambda e: e.date,
-        reverse=True,
-    )
+    return get_event_listings(config).self_service_events.make_response(request)
 
 
 @routes.get(
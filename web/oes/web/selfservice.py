@@ -1,10 +1,11 @@
 """Self service module."""
 
+import asyncio
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any
 
 from attrs import frozen
-from oes.utils.logic import evaluate
+from oes.utils.logic import evaluate_condition
 from oes.utils.mapping import merge_mapping
 from oes.utils.template import TemplateContext
 from oes.web.access_code import AccessCode, AccessCodeInterviewOption, AccessCodeService
@@ -111,12 +112,13 @@ class SelfServiceService:
     async def _get_access_code_registrations(
         self, event_id: str, access_code: AccessCode
     ) -> list[Registration]:
-        registrations = []
-        for id in access_code.options.registration_ids:
-            reg = await self.registration_service.get_registration(event_id, id)
-            if reg is not None:
-                registrations.append(reg)
-        return registrations
+        registrations = await asyncio.wait_for(
+            self.registration_service.get_registrations_by_id(
+                event_id, access_code.options.registration_ids
+            ),
+            self.config.upstream_timeout,
+        )
+        return [registration for registration, _ in registrations]
 
     def get_add_options(
         self, event_id: str, access_code: AccessCode | None
@@ -130,7 +132,7 @@ class SelfServiceService:
             event_ctx = event.get_template_context()
             for opt in event.self_service.add_options:
                 ctx = {"event": event_ctx}
-                if evaluate(opt.when, ctx):
+                if evaluate_condition(opt.when, ctx):
                     yield InterviewOption(opt.id, opt.title, opt.direct)
 
     def get_change_options(  # noqa: CCR001
@@ -150,7 +152,7 @@ class SelfServiceService:
             event_ctx = event.get_template_context()
             for opt in event.self_service.change_options:
                 ctx = {"event": event_ctx, "registration": dict(registration)}
-                if evaluate(opt.when, ctx):
+                if evaluate_condition(opt.when, ctx):
                     yield InterviewOption(opt.id, opt.title, opt.direct)
 
 
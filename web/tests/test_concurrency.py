@@ -0,0 +1,57 @@
+import asyncio
+import inspect
+
+import pytest
+from oes.web.concurrency import gather_limited
+
+
+@pytest.mark.asyncio
+async def test_gather_limited():
+    running = 0
+    max_running = 0
+
+    async def call(i: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    res = await gather_limited((call(i) for i in range(10)), limit=3)
+    assert res == list(range(10))
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_timeout():
+    cancelled = False
+
+    async def slow():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def fast():
+        return 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await gather_limited([fast(), slow(), slow()], limit=2, timeout=0.01)
+    assert cancelled
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_error_cancels():
+    async def fail():
+        raise ValueError
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    waiting = slow()
+    with pytest.raises(ValueError):
+        await gather_limited([fail(), slow(), waiting], limit=2)
+    assert inspect.getcoroutinestate(waiting) == inspect.CORO_CLOSED
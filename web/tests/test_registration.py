@@ -1,4 +1,15 @@
-from oes.web.registration import Registration
+from datetime import date
+
+import httpx
+import orjson
+import pytest
+from oes.utils.template import Expression, Template
+from oes.web.config import AdminConfig, AdminInterviewOption, Config, Event, jinja2_env
+from oes.web.registration import (
+    Registration,
+    RegistrationRenderCache,
+    RegistrationService,
+)
 
 
 def test_registration_object():
@@ -9,3 +20,89 @@ def test_registration_object():
 
     r2 = Registration(r)
     assert r2 == r
+
+
+@pytest.mark.asyncio
+async def test_get_registrations_by_id():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        body = orjson.loads(request.content)
+        return httpx.Response(
+            200,
+            json={
+                "registrations": [
+                    {"registration": {"id": id, "event_id": "test"}, "etag": 'W/"1"'}
+                    for id in body["ids"]
+                    if id != "missing"
+                ]
+            },
+        )
+
+    config = Config(registration_service_url="http://registration")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = RegistrationService(config, client, RegistrationRenderCache())
+        res = await service.get_registrations_by_id("test", ["a", "missing", "b"])
+        assert await service.get_registrations_by_id("test", []) == ()
+
+    assert [(r.id, etag) for r, etag in res] == [("a", 'W/"1"'), ("b", 'W/"1"')]
+    assert len(requests) == 1
+    assert requests[0].url == "http://registration/events/test/registrations/bulk-read"
+
+    requests.clear()
+    ids = [f"r{i}" for i in range(250)]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        service = RegistrationService(config, client, RegistrationRenderCache())
+        res = await service.get_registrations_by_id("test", ids)
+
+    assert [r.id for r, _ in res] == ids
+    assert [len(orjson.loads(r.content)["ids"]) for r in requests] == [100, 100, 50]
+
+
+def test_render_cache():
+    renders = []
+
+    def count_renders(value: str) -> str:
+        renders.append(value)
+        return value
+
+    env = jinja2_env.overlay()
+    env.filters["count_renders"] = count_renders
+    event = Event(
+        "test",
+        date(2020, 1, 1),
+        admin=AdminConfig(
+            registration_summary=Template(
+                "{{ registration.first_name | count_renders }}", env
+            ),
+            change_options=(
+                AdminInterviewOption(
+                    "change", "Change", when=Expression("user.role == 'admin'", env)
+                ),
+            ),
+        ),
+    )
+    config = Config(events={"test": event})  # type: ignore
+    service = RegistrationService(
+        config, httpx.AsyncClient(), RegistrationRenderCache(max_size=2)
+    )
+
+    reg = Registration({"id": "r1", "event_id": "test", "first_name": "A"})
+    assert service.get_registration_summary(reg) == "A"
+    assert service.get_registration_summary(Registration(reg)) == "A"
+    assert renders == ["A"]
+
+    updated = Registration({**reg, "first_name": "B", "version": 2})
+    assert service.get_registration_summary(updated) == "B"
+    assert renders == ["A", "B"]
+
+    assert [o.id for o in service.get_admin_change_options(reg, "admin")] == ["change"]
+    assert service.get_admin_change_options(reg, None) == ()
+
+    other = Registration({"id": "r2", "event_id": "test", "first_name": "C"})
+    assert service.get_registration_summary(other) == "C"
+
+    # evicted
+    assert service.get_registration_summary(reg) == "A"
+    assert renders == ["A", "B", "C", "A"]
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date
+
+import httpx
+import orjson
+import pytest
+from oes.web.config import Config, Event
+from oes.web.registration import RegistrationRenderCache, RegistrationService
+from oes.web.routes import event, registration, selfservice
+from oes.web.routes.common import handle_upstream_timeout
+from sanic import HTTPResponse, Request, Sanic
+
+Sanic.test_mode = True
+
+_registration = {"id": "r1", "event_id": "test", "status": "created", "version": 1}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/cancel"):
+        return httpx.Response(
+            409, content=b'{"description":"conflict"}', headers={"ETag": 'W/"2"'}
+        )
+    assert request.headers["If-Match"] == 'W/"1"'
+    reg = {**_registration, **orjson.loads(request.content)["registration"]}
+    return httpx.Response(200, json={"registration": reg}, headers={"ETag": 'W/"1"'})
+
+
+@asynccontextmanager
+async def _serve(app: Sanic) -> AsyncIterator[httpx.AsyncClient]:
+    receive: asyncio.Queue[dict] = asyncio.Queue()
+    send: asyncio.Queue[dict] = asyncio.Queue()
+    await receive.put({"type": "lifespan.startup"})
+    task = asyncio.create_task(
+        app({"type": "lifespan", "asgi": {"version": "3.0"}}, receive.get, send.put)
+    )
+    await send.get()
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url="http://web"
+        ) as client:
+            yield client
+    finally:
+        await receive.put({"type": "lifespan.shutdown"})
+        await send.get()
+        await task
+
+
+@pytest.fixture(scope="module")
+def app() -> Sanic:
+    config = Config(registration_service_url="http://registration")
+    upstream = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    app = Sanic("TestWebRoutes", configure_logging=False)
+    app.blueprint(registration.routes)
+    app.ext.dependency(config)
+    app.ext.dependency(upstream)
+    app.ext.dependency(RegistrationRenderCache())
+    app.ext.add_dependency(RegistrationService)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_proxy_registration_request(app: Sanic):
+    async with _serve(app) as client:
+        res = await client.put(
+            "/events/test/registrations/r1",
+            content=b'{"registration":{"first_name":"Test"}}',
+            headers={"If-Match": 'W/"1"'},
+        )
+        assert res.status_code == 200
+        assert res.headers["etag"] == 'W/"1"'
+        assert res.json() == {
+            "registration": {**_registration, "first_name": "Test"},
+            "summary": None,
+            "display_data": [],
+            "change_options": [],
+        }
+
+        res = await client.put("/events/test/registrations/r1/cancel")
+        assert res.status_code == 409
+        assert res.headers["etag"] == 'W/"2"'
+        assert res.content == b'{"description":"conflict"}'
+
+
+@pytest.mark.asyncio
+async def test_event_listings():
+    events = {
+        "a": Event("a", date(2020, 1, 1), visible=True),
+        "b": Event("b", date(2021, 1, 1)),
+    }
+    app = Sanic("TestWebEventRoutes", configure_logging=False)
+    app.blueprint(event.routes)
+    app.blueprint(selfservice.routes)
+    app.ext.dependency(Config(events=events))  # type: ignore
+
+    async with _serve(app) as client:
+        res = await client.get("/events")
+        assert [e["id"] for e in res.json()] == ["b", "a"]
+        etag = res.headers["etag"]
+
+        res = await client.get("/events", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.headers["etag"] == etag
+        assert res.content == b""
+
+        res = await client.get("/self-service/events")
+        assert [e["id"] for e in res.json()] == ["a"]
+        assert res.headers["etag"] != etag
+
+        res = await client.get("/events/a")
+        assert res.json()["id"] == "a"
+        res = await client.get("/events/c")
+        assert res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_upstream_timeout():
+    app = Sanic("TestWebTimeout", configure_logging=False)
+    app.exception(asyncio.TimeoutError)(handle_upstream_timeout)
+
+    @app.get("/")
+    async def handler(request: Request) -> HTTPResponse:
+        return await asyncio.wait_for(asyncio.sleep(1), 0.01)
+
+    async with _serve(app) as client:
+        res = await client.get("/")
+        assert res.status_code == 504